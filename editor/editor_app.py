@@ -6,28 +6,134 @@ PyCraft 编辑器应用程序类
 
 import sys
 import os
+from functools import lru_cache
 from PyQt5.QtWidgets import QApplication, QSplashScreen, QMessageBox, QStyleFactory, QProgressDialog
 from PyQt5.QtGui import QPixmap, QFont, QColor, QPalette, QIcon
-from PyQt5.QtCore import Qt, QTimer, QSize
+from PyQt5.QtCore import Qt, QTimer, QSize, QSettings
 
 # 引入主窗口类
 from editor.ui.main_window import MainWindow
 
+# 资源根目录，导入时计算一次
+_RESOURCE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources")
+
+
+@lru_cache(maxsize=64)
+def _resource_path(relative_path):
+    """获取资源绝对路径，只拼接路径，不访问文件系统
+    
+    Args:
+        relative_path (str): 相对于资源目录的路径
+        
+    Returns:
+        str: 绝对路径
+    """
+    return os.path.join(_RESOURCE_DIR, relative_path)
+
+
+# 应用程序图标，所有EditorApp实例共享，只解码一次
+_app_icon = None
+
+
+def _get_app_icon(icon_path):
+    """获取应用程序图标，只在首次调用时读取图标文件
+    
+    Args:
+        icon_path (str): 图标文件路径
+        
+    Returns:
+        QIcon: 应用程序图标
+    """
+    global _app_icon
+    if _app_icon is None:
+        _app_icon = QIcon(icon_path)
+    return _app_icon
+
+
+# 深色主题调色板，首次应用主题时创建，QPalette需要QGuiApplication
+_dark_palette = None
+
+
+def _get_dark_palette():
+    """获取深色主题调色板，只在首次调用时创建
+    
+    Returns:
+        QPalette: 深色调色板
+    """
+    global _dark_palette
+    if _dark_palette is not None:
+        return _dark_palette
+    
+    # 创建深色调色板
+    dark_palette = QPalette()
+    
+    # 设置窗口背景色
+    dark_palette.setColor(QPalette.Window, QColor(45, 45, 45))
+    dark_palette.setColor(QPalette.WindowText, QColor(212, 212, 212))
+    
+    # 设置按钮和控件颜色
+    dark_palette.setColor(QPalette.Button, QColor(60, 60, 60))
+    dark_palette.setColor(QPalette.ButtonText, QColor(212, 212, 212))
+    
+    # 设置高亮和选择区域颜色
+    dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
+    dark_palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
+    
+    # 设置工具提示颜色
+    dark_palette.setColor(QPalette.ToolTipBase, QColor(35, 35, 35))
+    dark_palette.setColor(QPalette.ToolTipText, QColor(212, 212, 212))
+    
+    # 设置文本颜色
+    dark_palette.setColor(QPalette.Text, QColor(212, 212, 212))
+    dark_palette.setColor(QPalette.BrightText, QColor(255, 255, 255))
+    
+    # 设置链接颜色
+    dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
+    
+    # 设置面板颜色
+    dark_palette.setColor(QPalette.Base, QColor(32, 32, 32))
+    dark_palette.setColor(QPalette.AlternateBase, QColor(45, 45, 45))
+    
+    # 设置禁用状态颜色
+    dark_palette.setColor(QPalette.Disabled, QPalette.Text, QColor(128, 128, 128))
+    dark_palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(128, 128, 128))
+    
+    _dark_palette = dark_palette
+    return _dark_palette
+
+
+def _is_embedded_launch():
+    """检查编辑器是否在交互式解释器或其他宿主程序中启动
+    
+    Returns:
+        bool: 没有主脚本文件或已加载IPython时返回True
+    """
+    import __main__
+    return not hasattr(__main__, "__file__") or "IPython" in sys.modules
+
 
 class EditorApp:
     """编辑器应用程序类"""
     
-    def __init__(self, width=1920, height=1080, debug=False):
+    def __init__(self, width=1920, height=1080, debug=False, show_splash=True):
         """初始化编辑器应用程序
         
         Args:
             width (int): 窗口宽度
             height (int): 窗口高度
             debug (bool): 是否启用调试模式
+            show_splash (bool): 是否显示加载进度，设置PYCRAFT_NO_SPLASH环境变量或嵌入启动时总是跳过
         """
         self.width = width
         self.height = height
         self.debug = debug
+        self.show_splash = (show_splash
+                            and not os.environ.get("PYCRAFT_NO_SPLASH")
+                            and not _is_embedded_launch())
+        self.progress = None  # 加载进度对话框
+        self._app_icon = None  # 应用程序图标，主窗口复用
+        self._project_name = None  # 当前项目名称，用于窗口标题
+        self._scene_name = None  # 当前场景名称，用于窗口标题
         
         # 确保应用只有一个实例
         self.app = QApplication.instance()
@@ -41,13 +147,17 @@ class EditorApp:
         self._apply_dark_theme()
         
         # 创建加载进度对话框
-        self._show_loading_progress()
+        if self.show_splash:
+            self._show_loading_progress()
         
-        # 创建主窗口
-        self.main_window = MainWindow(width, height)
+        # 创建主窗口，主窗口在初始化各部分时报告进度
+        self._set_progress(10, "加载用户界面...")
+        self.main_window = MainWindow(width, height, progress_callback=self._set_progress)
+        self._set_progress(100, "完成加载...")
         
         # 设置窗口图标
-        self.main_window.setWindowIcon(QIcon(self._get_resource_path("icons/app_icon.png")))
+        if self._app_icon is not None:
+            self.main_window.setWindowIcon(self._app_icon)
         
         if debug:
             print("编辑器启动于调试模式")
@@ -63,10 +173,11 @@ class EditorApp:
             self._create_default_resources()
         
         if os.path.exists(icon_path):
-            self.app.setWindowIcon(QIcon(icon_path))
+            self._app_icon = _get_app_icon(icon_path)
+            self.app.setWindowIcon(self._app_icon)
     
     def _get_resource_path(self, relative_path):
-        """获取资源路径
+        """获取资源路径，只用于读取，不创建目录
         
         Args:
             relative_path (str): 相对路径
@@ -74,370 +185,133 @@ class EditorApp:
         Returns:
             str: 绝对路径
         """
-        # 获取编辑器目录
-        editor_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        # 返回资源绝对路径
-        resource_path = os.path.join(editor_dir, "resources", relative_path)
-        # 确保目录存在
-        os.makedirs(os.path.dirname(resource_path), exist_ok=True)
-        return resource_path
+        return _resource_path(relative_path)
+    
+    def _ensure_resource_dir(self, relative_path):
+        """确保资源文件所在目录存在，只在写入资源前调用
+        
+        Args:
+            relative_path (str): 相对路径
+            
+        Returns:
+            str: 资源所在目录
+        """
+        resource_dir = os.path.dirname(_resource_path(relative_path))
+        # 目录已存在时只做一次stat，不再调用mkdir
+        if not os.path.isdir(resource_dir):
+            os.makedirs(resource_dir, exist_ok=True)
+        return resource_dir
     
     def _create_default_resources(self):
         """创建默认资源文件"""
         # 创建资源目录
-        icons_dir = os.path.dirname(self._get_resource_path("icons/app_icon.png"))
-        os.makedirs(icons_dir, exist_ok=True)
+        icons_dir = self._ensure_resource_dir("icons/app_icon.png")
         
         # 这里可以生成默认图标，但为简单起见，我们只创建目录
         if self.debug:
             print(f"已创建资源目录: {icons_dir}")
     
     def _apply_dark_theme(self):
-        """应用深色主题样式"""
+        """应用深色主题样式，同一个QApplication只应用一次"""
+        # 复用已有的QApplication时主题已经生效，重新设置样式表会让所有控件重新计算样式
+        if self.app.property("pycraft_dark_theme"):
+            return
+        
         # 设置Fusion风格，这是跨平台的现代风格
         self.app.setStyle(QStyleFactory.create("Fusion"))
         
-        # 创建深色调色板
-        dark_palette = QPalette()
-        
-        # 设置窗口背景色
-        dark_palette.setColor(QPalette.Window, QColor(45, 45, 45))
-        dark_palette.setColor(QPalette.WindowText, QColor(212, 212, 212))
-        
-        # 设置按钮和控件颜色
-        dark_palette.setColor(QPalette.Button, QColor(60, 60, 60))
-        dark_palette.setColor(QPalette.ButtonText, QColor(212, 212, 212))
-        
-        # 设置高亮和选择区域颜色
-        dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-        
-        # 设置工具提示颜色
-        dark_palette.setColor(QPalette.ToolTipBase, QColor(35, 35, 35))
-        dark_palette.setColor(QPalette.ToolTipText, QColor(212, 212, 212))
-        
-        # 设置文本颜色
-        dark_palette.setColor(QPalette.Text, QColor(212, 212, 212))
-        dark_palette.setColor(QPalette.BrightText, QColor(255, 255, 255))
-        
-        # 设置链接颜色
-        dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        
-        # 设置面板颜色
-        dark_palette.setColor(QPalette.Base, QColor(32, 32, 32))
-        dark_palette.setColor(QPalette.AlternateBase, QColor(45, 45, 45))
-        
-        # 设置禁用状态颜色
-        dark_palette.setColor(QPalette.Disabled, QPalette.Text, QColor(128, 128, 128))
-        dark_palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(128, 128, 128))
-        
         # 应用调色板
-        self.app.setPalette(dark_palette)
+        self.app.setPalette(_get_dark_palette())
         
         # 设置样式表，进一步美化控件
-        stylesheet = """
-            QToolTip { 
-                color: #d4d4d4; 
-                background-color: #232323; 
-                border: 1px solid #3a3a3a; 
-                border-radius: 3px;
-                padding: 5px;
-            }
-            
-            QDockWidget::title {
-                background: linear-gradient(#3a3a3a, #303030);
-                color: #d4d4d4;
-                padding: 6px;
-                border-top-left-radius: 3px;
-                border-top-right-radius: 3px;
-                font-weight: bold;
-            }
-            
-            QMenuBar {
-                background-color: #2d2d2d;
-                color: #d4d4d4;
-                border-bottom: 1px solid #1a1a1a;
-            }
-            
-            QMenuBar::item:selected {
-                background-color: #3a3a3a;
-                border-radius: 2px;
-            }
-            
-            QMenu {
-                background-color: #2d2d2d;
-                color: #d4d4d4;
-                border: 1px solid #1a1a1a;
-                padding: 2px;
-            }
-            
-            QMenu::item:selected {
-                background-color: #3a3a3a;
-                border-radius: 2px;
-            }
-            
-            QStatusBar {
-                background-color: #2d2d2d;
-                color: #d4d4d4;
-                border-top: 1px solid #1a1a1a;
-            }
-            
-            QTreeView {
-                background-color: #282828;
-                alternate-background-color: #303030;
-                color: #d4d4d4;
-                border: 1px solid #1a1a1a;
-            }
-            
-            QTreeView::item:selected {
-                background-color: #42648e;
-                color: #ffffff;
-            }
-            
-            QHeaderView::section {
-                background-color: #3a3a3a;
-                color: #d4d4d4;
-                border: 1px solid #232323;
-                padding: 4px;
-            }
-            
-            QScrollBar:vertical {
-                background-color: #282828;
-                width: 12px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #505050;
-                min-height: 20px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #606060;
-            }
-            
-            QScrollBar:horizontal {
-                background-color: #282828;
-                height: 12px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:horizontal {
-                background-color: #505050;
-                min-width: 20px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:horizontal:hover {
-                background-color: #606060;
-            }
-            
-            QLineEdit, QTextEdit, QPlainTextEdit {
-                background-color: #282828;
-                color: #d4d4d4;
-                border: 1px solid #3a3a3a;
-                border-radius: 3px;
-                padding: 3px 5px;
-                selection-background-color: #42648e;
-            }
-            
-            QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
-                border: 1px solid #6090d0;
-            }
-            
-            QPushButton {
-                background-color: #3a3a3a;
-                color: #d4d4d4;
-                border: 1px solid #505050;
-                border-radius: 3px;
-                padding: 5px 15px;
-                min-height: 20px;
-            }
-            
-            QPushButton:hover {
-                background-color: #505050;
-                border: 1px solid #6090d0;
-            }
-            
-            QPushButton:pressed {
-                background-color: #2a5284;
-            }
-            
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #707070;
-                border: 1px solid #3a3a3a;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #3a3a3a;
-                background-color: #282828;
-            }
-            
-            QTabBar::tab {
-                background-color: #2d2d2d;
-                color: #d4d4d4;
-                padding: 6px 12px;
-                border-top-left-radius: 3px;
-                border-top-right-radius: 3px;
-                margin-right: 1px;
-                border: 1px solid #1a1a1a;
-                border-bottom: none;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #3a3a3a;
-                border-bottom: 2px solid #42648e;
-            }
-            
-            QTabBar::tab:hover:!selected {
-                background-color: #333333;
-            }
-            
-            QComboBox {
-                background-color: #3a3a3a;
-                color: #d4d4d4;
-                border: 1px solid #505050;
-                border-radius: 3px;
-                padding: 2px 5px;
-                min-height: 20px;
-            }
-            
-            QComboBox:hover {
-                border: 1px solid #6090d0;
-            }
-            
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 15px;
-                border-left: 1px solid #505050;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                color: #d4d4d4;
-                border: 1px solid #505050;
-                selection-background-color: #42648e;
-                selection-color: #ffffff;
-            }
-            
-            QCheckBox, QRadioButton {
-                color: #d4d4d4;
-                spacing: 5px;
-            }
-            
-            QGroupBox {
-                border: 1px solid #3a3a3a;
-                border-radius: 3px;
-                margin-top: 10px;
-                font-weight: bold;
-                color: #d4d4d4;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 5px;
-            }
-            
-            QProgressBar {
-                border: 1px solid #3a3a3a;
-                border-radius: 3px;
-                background-color: #282828;
-                text-align: center;
-                color: #d4d4d4;
-            }
-            
-            QProgressBar::chunk {
-                background-color: #42648e;
-                border-radius: 2px;
-            }
-            
-            QSlider::groove:horizontal {
-                border: 1px solid #3a3a3a;
-                height: 8px;
-                background: #282828;
-                margin: 2px 0;
-                border-radius: 4px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: #6090d0;
-                border: 1px solid #6090d0;
-                width: 14px;
-                height: 14px;
-                margin: -4px 0;
-                border-radius: 7px;
-            }
+        self.app.setStyleSheet(self._load_stylesheet("dark.qss"))
+        self.app.setProperty("pycraft_dark_theme", True)
+        
+    def _load_stylesheet(self, name):
+        """读取编辑器样式表文件
+        
+        Args:
+            name (str): editor/resources目录下的样式表文件名
             
-            QSlider::handle:horizontal:hover {
-                background: #7aa8e0;
-                border: 1px solid #7aa8e0;
-            }
+        Returns:
+            str: 样式表内容，读取失败时返回空字符串
         """
-        self.app.setStyleSheet(stylesheet)
-        
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", name)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError as e:
+            print(f"加载样式表失败: {path}, {e}")
+            return ""
+    
     def _show_loading_progress(self):
-        """显示加载进度对话框"""
+        """显示加载进度对话框，进度由后续的真实初始化步骤推进"""
         # 创建进度对话框
-        progress = QProgressDialog("正在加载编辑器组件...", None, 0, 100)
-        progress.setWindowTitle("PyCraft Editor")
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)  # 立即显示
-        progress.setAutoClose(True)
-        progress.setWindowFlag(Qt.FramelessWindowHint)  # 无边框
+        self.progress = QProgressDialog("初始化编辑器环境...", None, 0, 100)
+        self.progress.setWindowTitle("PyCraft Editor")
+        self.progress.setWindowModality(Qt.WindowModal)
+        self.progress.setMinimumDuration(0)  # 立即显示
+        self.progress.setAutoClose(False)  # 由run()在显示主窗口前关闭
+        self.progress.setWindowFlag(Qt.FramelessWindowHint)  # 无边框
         
-        # 设置样式
-        progress.setStyleSheet("""
-            QProgressDialog {
-                background-color: #2d2d2d;
-                border: 1px solid #3a3a3a;
-                border-radius: 5px;
-            }
-            QLabel {
-                color: #d4d4d4;
-                font-weight: bold;
-                margin: 10px;
-            }
-        """)
+        # 样式由全局样式表中的QProgressDialog规则提供
         
-        # 显示进度
-        for i in range(1, 101):
-            progress.setValue(i)
-            if i < 20:
-                progress.setLabelText("初始化编辑器环境...")
-            elif i < 40:
-                progress.setLabelText("加载核心模块...")
-            elif i < 60:
-                progress.setLabelText("准备渲染系统...")
-            elif i < 80:
-                progress.setLabelText("加载用户界面...")
-            else:
-                progress.setLabelText("完成加载...")
-            
-            # 模拟加载延迟
-            QTimer.singleShot(20, lambda: None)
-            self.app.processEvents()
+        # 显示对话框，只处理一次事件使其完成绘制
+        self.progress.setValue(0)
+        self.progress.show()
+        self.app.processEvents()
+    
+    def _set_progress(self, value, message):
+        """更新加载进度
+        
+        Args:
+            value (int): 进度值，0-100
+            message (str): 进度说明
+        """
+        if self.progress is None:
+            return
+        
+        self.progress.setLabelText(message)
+        self.progress.setValue(value)
+        self.app.processEvents()
+    
+    def _close_loading_progress(self):
+        """关闭加载进度对话框"""
+        if self.progress is not None:
+            self.progress.close()
+            self.progress = None
     
     def _show_welcome_message(self):
-        """显示欢迎信息"""
-        if not self.debug:  # 在调试模式下不显示欢迎信息
-            QMessageBox.information(
-                self.main_window,
-                "欢迎使用 PyCraft 编辑器",
-                "<h3>欢迎使用 PyCraft 编辑器！</h3>"
-                "<p>已创建一个初始的3D场景，您可以使用以下控制方式浏览场景：</p>"
-                "<ul>"
-                "<li><b>WASD 键</b>：前后左右移动</li>"
-                "<li><b>空格键</b>：上升</li>"
-                "<li><b>Ctrl 键</b>：下降</li>"
-                "<li><b>鼠标拖动</b>：旋转视角</li>"
-                "</ul>"
-                "<p>请点击场景视图以获取焦点，然后开始操作。</p>"
-                "<p><i>提示：可以在菜单 > 帮助 > 快捷键查看更多操作方式</i></p>"
-            )
+        """显示欢迎信息，只在首次启动时显示，且不阻塞事件循环"""
+        if self.debug:  # 在调试模式下不显示欢迎信息
+            return
+        
+        settings = QSettings("PyCraft", "Editor")
+        if settings.value("welcome_shown", False, type=bool):
+            return
+        
+        # 非模态消息框，用户阅读时编辑器仍然可以响应
+        box = QMessageBox(
+            QMessageBox.Information,
+            "欢迎使用 PyCraft 编辑器",
+            "<h3>欢迎使用 PyCraft 编辑器！</h3>"
+            "<p>已创建一个初始的3D场景，您可以使用以下控制方式浏览场景：</p>"
+            "<ul>"
+            "<li><b>WASD 键</b>：前后左右移动</li>"
+            "<li><b>空格键</b>：上升</li>"
+            "<li><b>Ctrl 键</b>：下降</li>"
+            "<li><b>鼠标拖动</b>：旋转视角</li>"
+            "</ul>"
+            "<p>请点击场景视图以获取焦点，然后开始操作。</p>"
+            "<p><i>提示：可以在菜单 > 帮助 > 快捷键查看更多操作方式</i></p>",
+            QMessageBox.Ok,
+            self.main_window
+        )
+        box.setModal(False)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.show()
+        
+        settings.setValue("welcome_shown", True)
     
     def open_project(self, project_path):
         """打开项目
@@ -449,8 +323,8 @@ class EditorApp:
             print(f"打开项目: {project_path}")
         self.main_window.open_project(project_path)
         # 设置窗口标题以包含项目名称
-        project_name = os.path.basename(project_path)
-        self.main_window.setWindowTitle(f"PyCraft Editor - {project_name}")
+        self._project_name = os.path.basename(project_path)
+        self._refresh_title()
     
     def load_scene(self, scene_path):
         """加载场景
@@ -462,17 +336,22 @@ class EditorApp:
             print(f"加载场景: {scene_path}")
         self.main_window.load_scene(scene_path)
         # 更新窗口标题以包含场景名称
-        scene_name = os.path.basename(scene_path)
-        current_title = self.main_window.windowTitle()
-        if " - " in current_title:
-            project_part = current_title.split(" - ")[1]
-            self.main_window.setWindowTitle(f"PyCraft Editor - {project_part} - {scene_name}")
-        else:
-            self.main_window.setWindowTitle(f"PyCraft Editor - {scene_name}")
+        self._scene_name = os.path.basename(scene_path)
+        self._refresh_title()
+    
+    def _refresh_title(self):
+        """根据当前项目和场景名称更新窗口标题"""
+        title = "PyCraft Editor"
+        if self._project_name:
+            title += f" - {self._project_name}"
+        if self._scene_name:
+            title += f" - {self._scene_name}"
+        self.main_window.setWindowTitle(title)
     
     def run(self):
         """运行编辑器"""
-        # 显示主窗口
+        # 关闭加载进度并显示主窗口
+        self._close_loading_progress()
         self.main_window.show()
         
         # 设置焦点到场景视图
@@ -8,25 +8,29 @@ from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QDockWidget, QMenuBar, QMenu,
     QAction, QMessageBox, QFileDialog, QLabel, QVBoxLayout
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 
 from editor.ui.panels.scene_panel import ScenePanel
-from editor.ui.panels.property_panel import PropertyPanel
-from editor.ui.panels.hierarchy_panel import HierarchyPanel
-from editor.ui.panels.asset_browser import AssetBrowser
 
 
 class MainWindow(QMainWindow):
     """编辑器主窗口类"""
     
-    def __init__(self, width, height):
+    def __init__(self, width, height, progress_callback=None):
         """初始化主窗口
         
         Args:
             width (int): 窗口宽度
             height (int): 窗口高度
+            progress_callback (callable): 加载进度回调，参数为(进度值, 进度说明)
         """
         super().__init__()
+        self.progress_callback = progress_callback
+        
+        # 停靠面板在窗口首次绘制后才创建
+        self._hierarchy_panel = None
+        self._property_panel = None
+        self._asset_browser = None
         
         # 设置窗口标题和大小
         self.setWindowTitle("PyCraft Editor")
@@ -40,46 +44,127 @@ class MainWindow(QMainWindow):
         # 当前场景路径
         self.current_scene = None
     
+    def set_progress(self, value, message):
+        """报告加载进度
+        
+        Args:
+            value (int): 进度值，0-100
+            message (str): 进度说明
+        """
+        if self.progress_callback:
+            self.progress_callback(value, message)
+    
     def _init_ui(self):
         """初始化UI"""
         # 创建菜单栏
         self._create_menu_bar()
+        self.set_progress(20, "准备渲染系统...")
         
         # 创建场景面板，并将其设置为中央窗口部件
         self.scene_panel = ScenePanel()
         self.setCentralWidget(self.scene_panel)
+        self.set_progress(50, "创建停靠窗口...")
         
         # 设置场景面板为焦点
         self.scene_panel.setFocus()
         
-        # 创建层级面板
-        self.hierarchy_panel = HierarchyPanel()
-        hierarchy_dock = QDockWidget("层级视图", self)
-        hierarchy_dock.setWidget(self.hierarchy_panel)
-        self.addDockWidget(Qt.LeftDockWidgetArea, hierarchy_dock)
-        
-        # 创建属性面板
-        self.property_panel = PropertyPanel()
-        property_dock = QDockWidget("属性", self)
-        property_dock.setWidget(self.property_panel)
-        self.addDockWidget(Qt.RightDockWidgetArea, property_dock)
+        # 停靠窗口和状态栏部件一起添加，暂停更新使窗口只重新布局一次
+        self.setUpdatesEnabled(False)
         
-        # 创建资源浏览器
-        self.asset_browser = AssetBrowser()
-        asset_dock = QDockWidget("资源", self)
-        asset_dock.setWidget(self.asset_browser)
-        self.addDockWidget(Qt.BottomDockWidgetArea, asset_dock)
+        # 创建停靠窗口外壳，面板本身延迟创建
+        self.hierarchy_dock = self._create_dock("层级视图", Qt.LeftDockWidgetArea, self._build_hierarchy_panel)
+        self.property_dock = self._create_dock("属性", Qt.RightDockWidgetArea, self._build_property_panel)
+        self.asset_dock = self._create_dock("资源", Qt.BottomDockWidgetArea, self._build_asset_browser)
         
         # 添加状态栏信息
         self.statusBar().showMessage("准备就绪")
         
-        # 添加WASD控制提示
-        control_label = QLabel("使用WASD键移动，空格键上升，Ctrl键下降")
-        self.statusBar().addPermanentWidget(control_label)
+        # 添加WASD控制和世界视窗模式提示，合并为一个永久部件
+        hint_label = QLabel("使用WASD键移动，空格键上升，Ctrl键下降 | 右键点击进入世界视窗模式，ESC退出")
+        self.statusBar().addPermanentWidget(hint_label)
+        
+        self.setUpdatesEnabled(True)
+        self.set_progress(95, "完成加载...")
+        
+        # 事件循环先绘制窗口框架，空闲时再创建停靠面板
+        QTimer.singleShot(0, self._build_dock_panels)
+    
+    def _create_dock(self, title, area, builder):
+        """创建带占位部件的停靠窗口，首次可见时创建面板
+        
+        Args:
+            title (str): 停靠窗口标题
+            area (Qt.DockWidgetArea): 停靠区域
+            builder (callable): 创建面板的方法
+            
+        Returns:
+            QDockWidget: 停靠窗口
+        """
+        dock = QDockWidget(title, self)
+        dock.setWidget(QWidget())
+        dock.visibilityChanged.connect(lambda visible: visible and builder())
+        self.addDockWidget(area, dock)
+        return dock
+    
+    def _build_dock_panels(self):
+        """创建所有尚未创建的停靠面板"""
+        # 三个面板替换占位部件后只重新布局一次
+        self.setUpdatesEnabled(False)
+        self._build_hierarchy_panel()
+        self._build_property_panel()
+        self._build_asset_browser()
+        self.setUpdatesEnabled(True)
+    
+    def _build_hierarchy_panel(self):
+        """创建层级面板，只创建一次
+        
+        Returns:
+            HierarchyPanel: 层级面板
+        """
+        if self._hierarchy_panel is None:
+            from editor.ui.panels.hierarchy_panel import HierarchyPanel
+            self._hierarchy_panel = HierarchyPanel()
+            self.hierarchy_dock.setWidget(self._hierarchy_panel)
+        return self._hierarchy_panel
+    
+    def _build_property_panel(self):
+        """创建属性面板，只创建一次
+        
+        Returns:
+            PropertyPanel: 属性面板
+        """
+        if self._property_panel is None:
+            from editor.ui.panels.property_panel import PropertyPanel
+            self._property_panel = PropertyPanel()
+            self.property_dock.setWidget(self._property_panel)
+        return self._property_panel
+    
+    def _build_asset_browser(self):
+        """创建资源浏览器，只创建一次
         
-        # 添加世界视窗模式提示
-        world_view_label = QLabel("右键点击进入世界视窗模式，ESC退出")
-        self.statusBar().addPermanentWidget(world_view_label)
+        Returns:
+            AssetBrowser: 资源浏览器
+        """
+        if self._asset_browser is None:
+            from editor.ui.panels.asset_browser import AssetBrowser
+            self._asset_browser = AssetBrowser()
+            self.asset_dock.setWidget(self._asset_browser)
+        return self._asset_browser
+    
+    @property
+    def hierarchy_panel(self):
+        """层级面板，访问时若尚未创建则立即创建"""
+        return self._build_hierarchy_panel()
+    
+    @property
+    def property_panel(self):
+        """属性面板，访问时若尚未创建则立即创建"""
+        return self._build_property_panel()
+    
+    @property
+    def asset_browser(self):
+        """资源浏览器，访问时若尚未创建则立即创建"""
+        return self._build_asset_browser()
     
     def _create_menu_bar(self):
         """创建菜单栏"""
@@ -5,14 +5,66 @@
 """
 
 import os
+import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QTreeView, QFileSystemModel,
     QMenu, QAction, QToolBar, QSplitter, QLabel, 
     QFileIconProvider, QFileDialog, QInputDialog, 
     QMessageBox, QListView, QAbstractItemView
 )
-from PyQt5.QtCore import Qt, QDir, QSize, QModelIndex, pyqtSignal
-from PyQt5.QtGui import QIcon, QPixmap, QImage
+from PyQt5.QtCore import (
+    Qt, QDir, QSize, QModelIndex, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal,
+    QSortFilterProxyModel
+)
+from PyQt5.QtGui import QIcon, QPixmap, QImage, QImageReader, QPixmapCache
+
+
+# 资源树中显示的文件类型
+_NAME_FILTERS = [
+    "*.png", "*.jpg", "*.jpeg", "*.bmp",  # 图片
+    "*.obj", "*.fbx", "*.gltf",           # 3D模型
+    "*.wav", "*.mp3", "*.ogg",            # 音频
+    "*.scene",                             # 场景文件
+    "*.py"                                # 脚本文件
+]
+
+# 导入资源对话框的文件过滤器
+_IMPORT_FILTER = (
+    "所有支持的文件 (*.png *.jpg *.jpeg *.bmp *.obj *.fbx *.gltf *.wav *.mp3 *.ogg *.scene *.py);;"
+    "图片文件 (*.png *.jpg *.jpeg *.bmp);;"
+    "3D模型 (*.obj *.fbx *.gltf);;"
+    "音频文件 (*.wav *.mp3 *.ogg);;"
+    "场景文件 (*.scene);;"
+    "脚本文件 (*.py);;"
+    "所有文件 (*.*)"
+)
+
+# 预览时按扩展名区分的文件类型
+_IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".bmp"})
+_MODEL_EXTS = frozenset({".obj", ".fbx", ".gltf"})
+_AUDIO_EXTS = frozenset({".wav", ".mp3", ".ogg"})
+
+# 资源树中隐藏且不统计内容的目录，通常包含大量与资源无关的文件
+_SKIPPED_DIRS = frozenset({"node_modules", ".git", "__pycache__", ".venv", "dist", "build"})
+
+# 预览缩略图缓存上限，单位KB
+QPixmapCache.setCacheLimit(65536)
+
+
+@lru_cache(maxsize=None)
+def _icon(name):
+    """获取资源图标，每个图标文件在进程内只加载一次
+    
+    Args:
+        name (str): resources/icons目录下的图标文件名
+        
+    Returns:
+        QIcon: 共享的图标
+    """
+    return QIcon(f"resources/icons/{name}")
 
 
 class CustomFileIconProvider(QFileIconProvider):
@@ -20,53 +72,199 @@ class CustomFileIconProvider(QFileIconProvider):
     
     def __init__(self):
         super().__init__()
-        # 自定义图标映射
+        # 不读取目录的自定义图标（如desktop.ini），避免逐个目录访问系统外壳
+        self.setOptions(QFileIconProvider.DontUseCustomDirectoryIcons)
+        
+        # 自定义图标映射，扩展名（不含点）-> 图标类型
         self.icon_map = {
-            ".png": "image",
-            ".jpg": "image",
-            ".jpeg": "image",
-            ".bmp": "image",
-            ".obj": "model",
-            ".fbx": "model",
-            ".gltf": "model",
-            ".wav": "audio",
-            ".mp3": "audio",
-            ".ogg": "audio",
-            ".scene": "scene",
-            ".py": "script"
+            "png": "image",
+            "jpg": "image",
+            "jpeg": "image",
+            "bmp": "image",
+            "obj": "model",
+            "fbx": "model",
+            "gltf": "model",
+            "wav": "audio",
+            "mp3": "audio",
+            "ogg": "audio",
+            "scene": "scene",
+            "py": "script"
         }
         
         # 加载图标
-        self.folder_icon = QIcon("resources/icons/folder.png")
-        self.image_icon = QIcon("resources/icons/image.png")
-        self.model_icon = QIcon("resources/icons/model.png")
-        self.audio_icon = QIcon("resources/icons/audio.png")
-        self.scene_icon = QIcon("resources/icons/scene.png")
-        self.script_icon = QIcon("resources/icons/script.png")
-        self.file_icon = QIcon("resources/icons/file.png")
+        self.folder_icon = _icon("folder.png")
+        self.image_icon = _icon("image.png")
+        self.model_icon = _icon("model.png")
+        self.audio_icon = _icon("audio.png")
+        self.scene_icon = _icon("scene.png")
+        self.script_icon = _icon("script.png")
+        self.file_icon = _icon("file.png")
+        
+        # 图标加载失败时使用按类型获取的通用图标，不按单个文件向系统查询
+        if self.folder_icon.isNull():
+            self.folder_icon = super().icon(QFileIconProvider.Folder)
+        if self.file_icon.isNull():
+            self.file_icon = super().icon(QFileIconProvider.File)
+        
+        # 扩展名直接映射到图标，icon()每次调用只需一次字典查找
+        type_icons = {
+            "image": self.image_icon,
+            "model": self.model_icon,
+            "audio": self.audio_icon,
+            "scene": self.scene_icon,
+            "script": self.script_icon
+        }
+        self._ext_to_icon = {
+            ext: type_icons[icon_type] if not type_icons[icon_type].isNull() else self.file_icon
+            for ext, icon_type in self.icon_map.items()
+        }
 
     def icon(self, fileInfo):
-        # 如果是目录
+        # 视图绘制每一行时都会调用，只做目录判断和一次字典查找
         if fileInfo.isDir():
-            return self.folder_icon if self.folder_icon else super().icon(fileInfo)
-        
-        # 根据文件扩展名获取图标
-        ext = os.path.splitext(fileInfo.fileName())[1].lower()
-        icon_type = self.icon_map.get(ext)
-        
-        if icon_type == "image" and self.image_icon:
-            return self.image_icon
-        elif icon_type == "model" and self.model_icon:
-            return self.model_icon
-        elif icon_type == "audio" and self.audio_icon:
-            return self.audio_icon
-        elif icon_type == "scene" and self.scene_icon:
-            return self.scene_icon
-        elif icon_type == "script" and self.script_icon:
-            return self.script_icon
-        
-        # 默认图标
-        return self.file_icon if self.file_icon else super().icon(fileInfo)
+            return self.folder_icon
+        
+        return self._ext_to_icon.get(fileInfo.suffix().lower(), self.file_icon)
+
+
+class ImageLoaderSignals(QObject):
+    """图片加载任务的信号，QRunnable本身不能发射信号"""
+    
+    # 缓存键, 文件路径, 缩放后的图片, 原始宽度, 原始高度
+    loaded = pyqtSignal(str, str, QImage, int, int)
+
+
+class ImageLoader(QRunnable):
+    """在线程池中解码并缩放预览图片"""
+    
+    def __init__(self, key, file_path, width, height):
+        """初始化图片加载任务
+        
+        Args:
+            key (str): 缩略图缓存键
+            file_path (str): 图片文件路径
+            width (int): 预览最大宽度
+            height (int): 预览最大高度
+        """
+        super().__init__()
+        self.key = key
+        self.file_path = file_path
+        self.width = width
+        self.height = height
+        self.signals = ImageLoaderSignals()
+    
+    def run(self):
+        """解码图片，完成后通过信号交给界面线程"""
+        image = QImage(self.file_path)
+        original_width = image.width()
+        original_height = image.height()
+        if not image.isNull():
+            image = image.scaled(
+                self.width, self.height,
+                Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+        self.signals.loaded.emit(self.key, self.file_path, image, original_width, original_height)
+
+
+class FileWorkerSignals(QObject):
+    """文件操作任务的信号"""
+    
+    # 操作失败的错误信息列表
+    finished = pyqtSignal(list)
+
+
+class DeleteWorker(QRunnable):
+    """在线程池中删除文件和目录"""
+    
+    def __init__(self, file_paths):
+        """初始化删除任务
+        
+        Args:
+            file_paths (list): 要删除的文件或目录路径
+        """
+        super().__init__()
+        self.file_paths = file_paths
+        self.signals = FileWorkerSignals()
+    
+    def run(self):
+        """逐个删除，收集错误后一次性交给界面线程"""
+        errors = []
+        for file_path in self.file_paths:
+            try:
+                if os.path.isdir(file_path):
+                    shutil.rmtree(file_path)
+                else:
+                    os.remove(file_path)
+            except Exception as e:
+                errors.append(f"无法删除 {os.path.basename(file_path)}: {str(e)}")
+        self.signals.finished.emit(errors)
+
+
+class ImportWorker(QRunnable):
+    """在线程池中并行复制导入的资源文件"""
+    
+    MAX_COPY_THREADS = 8  # 同时复制的最大文件数
+    
+    def __init__(self, copy_pairs):
+        """初始化导入任务
+        
+        Args:
+            copy_pairs (list): [(源文件路径, 目标文件路径)]
+        """
+        super().__init__()
+        self.copy_pairs = copy_pairs
+        self.signals = FileWorkerSignals()
+    
+    @staticmethod
+    def _copy(pair):
+        """复制单个文件
+        
+        Args:
+            pair (tuple): (源文件路径, 目标文件路径)
+            
+        Returns:
+            str: 错误信息，成功时返回None
+        """
+        src, dst = pair
+        try:
+            shutil.copy2(src, dst)
+        except Exception as e:
+            return f"无法导入文件 {os.path.basename(src)}: {str(e)}"
+        return None
+    
+    def run(self):
+        """并行复制所有文件，收集错误后一次性交给界面线程"""
+        max_workers = min(self.MAX_COPY_THREADS, os.cpu_count() or 1, len(self.copy_pairs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            errors = [error for error in executor.map(self._copy, self.copy_pairs) if error]
+        self.signals.finished.emit(errors)
+
+
+class AssetProxyModel(QSortFilterProxyModel):
+    """资源树代理模型，隐藏系统目录，视图不会展开它们，文件系统模型也就不会扫描和监视其内容"""
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        """判断源模型中的行是否显示
+        
+        Args:
+            source_row (int): 源模型行号
+            source_parent (QModelIndex): 源模型父索引
+            
+        Returns:
+            bool: 是否显示该行
+        """
+        model = self.sourceModel()
+        index = model.index(source_row, 0, source_parent)
+        return not (model.fileName(index) in _SKIPPED_DIRS and model.isDir(index))
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """排序交给文件系统模型，保持目录在前的排序方式
+        
+        Args:
+            column (int): 排序列
+            order (Qt.SortOrder): 排序顺序
+        """
+        self.sourceModel().sort(column, order)
 
 
 class AssetBrowser(QWidget):
@@ -76,6 +274,39 @@ class AssetBrowser(QWidget):
     asset_selected = pyqtSignal(str)
     asset_double_clicked = pyqtSignal(str)
     
+    PREVIEW_DELAY_MS = 150  # 选择停止变化后多久更新预览
+    FOLDER_SCAN_LIMIT = 5000  # 文件夹预览最多统计的条目数
+    SCRIPT_PREVIEW_BYTES = 4096  # 脚本预览读取的字节数
+    
+    # 所有资源浏览器共享的文件系统模型和图标提供器，面板重新创建时保留已扫描的目录
+    _shared_model = None
+    _shared_icon_provider = None
+    
+    @classmethod
+    def _get_shared_model(cls):
+        """获取共享的文件系统模型，只在首次调用时创建和配置
+        
+        Returns:
+            QFileSystemModel: 文件系统模型
+        """
+        if cls._shared_model is None:
+            # 创建文件系统模型
+            model = QFileSystemModel()
+            model.setReadOnly(False)
+            # 不解析符号链接，减少枚举时的文件系统访问
+            model.setResolveSymlinks(False)
+            
+            # 设置自定义图标提供器
+            cls._shared_icon_provider = CustomFileIconProvider()
+            model.setIconProvider(cls._shared_icon_provider)
+            
+            # 设置过滤器
+            model.setNameFilters(_NAME_FILTERS)
+            model.setNameFilterDisables(False)
+            
+            cls._shared_model = model
+        return cls._shared_model
+    
     def __init__(self):
         """初始化资源浏览器"""
         super().__init__()
@@ -91,56 +322,60 @@ class AssetBrowser(QWidget):
         
         # 添加工具栏按钮
         self.new_folder_action = QAction("新建文件夹", self)
-        self.new_folder_action.setIcon(QIcon("resources/icons/new_folder.png"))
+        self.new_folder_action.setIcon(_icon("new_folder.png"))
         self.new_folder_action.triggered.connect(self._create_new_folder)
         self.toolbar.addAction(self.new_folder_action)
         
         self.import_action = QAction("导入资源", self)
-        self.import_action.setIcon(QIcon("resources/icons/import.png"))
+        self.import_action.setIcon(_icon("import.png"))
         self.import_action.triggered.connect(self._import_asset)
         self.toolbar.addAction(self.import_action)
         
         self.refresh_action = QAction("刷新", self)
-        self.refresh_action.setIcon(QIcon("resources/icons/refresh.png"))
+        self.refresh_action.setIcon(_icon("refresh.png"))
         self.refresh_action.triggered.connect(self._refresh_view)
         self.toolbar.addAction(self.refresh_action)
         
+        # 大型项目可以关闭文件监视，避免为每个展开的目录注册系统监视
+        self.watch_action = QAction("监视文件变化", self)
+        self.watch_action.setCheckable(True)
+        self.watch_action.setChecked(True)
+        self.watch_action.toggled.connect(self._set_watch_changes)
+        self.toolbar.addAction(self.watch_action)
+        
         # 创建分割器
         self.splitter = QSplitter(Qt.Horizontal)
         self.main_layout.addWidget(self.splitter)
         
-        # 创建文件系统模型
-        self.model = QFileSystemModel()
-        self.model.setReadOnly(False)
-        
-        # 设置自定义图标提供器
-        self.icon_provider = CustomFileIconProvider()
-        self.model.setIconProvider(self.icon_provider)
+        # 使用共享的文件系统模型
+        self.model = self._get_shared_model()
+        self.icon_provider = self._shared_icon_provider
+        # 监视开关显示共享模型的当前设置
+        self.watch_action.setChecked(self._is_watching())
         
-        # 设置过滤器
-        self.model.setNameFilters([
-            "*.png", "*.jpg", "*.jpeg", "*.bmp",  # 图片
-            "*.obj", "*.fbx", "*.gltf",           # 3D模型
-            "*.wav", "*.mp3", "*.ogg",            # 音频
-            "*.scene",                             # 场景文件
-            "*.py"                                # 脚本文件
-        ])
-        self.model.setNameFilterDisables(False)
+        # 通过代理模型过滤系统目录
+        self.proxy_model = AssetProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
         
         # 创建树形视图
         self.tree_view = QTreeView()
-        self.tree_view.setModel(self.model)
+        self.tree_view.setModel(self.proxy_model)
         self.tree_view.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree_view.customContextMenuRequested.connect(self._show_context_menu)
         self.tree_view.setDragDropMode(QAbstractItemView.InternalMove)
         self.tree_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.tree_view.setSortingEnabled(True)
         self.tree_view.sortByColumn(0, Qt.AscendingOrder)
+        # 所有行高度相同，视图可以缓存行高，不必逐行测量
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setAnimated(False)
         
-        # 隐藏不需要的列
+        # 隐藏不需要的列，暂停更新使表头只重新布局一次
+        self.tree_view.setUpdatesEnabled(False)
         self.tree_view.setColumnHidden(1, True)  # 大小
         self.tree_view.setColumnHidden(2, True)  # 类型
         self.tree_view.setColumnHidden(3, True)  # 修改日期
+        self.tree_view.setUpdatesEnabled(True)
         
         # 选择变化时触发
         self.tree_view.selectionModel().selectionChanged.connect(self._on_selection_changed)
@@ -161,6 +396,41 @@ class AssetBrowser(QWidget):
         
         # 当前路径
         self.current_path = None
+        
+        # 预览延迟更新，连续切换选择时只预览最后一项
+        self._pending_preview_path = None
+        self._preview_image_key = None  # 正在加载的预览图片缓存键
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._do_preview)
+        
+        # 当前选中项目第一列的路径，选择变化时计算一次，各操作共用
+        self._selected_paths = []
+        
+        # 当前预览文件的大小文本，与预览时的stat一同计算，各预览分支共用
+        self._preview_size = ""
+    
+    def _index_for_path(self, path):
+        """获取路径在视图中的索引
+        
+        Args:
+            path (str): 文件或目录路径
+            
+        Returns:
+            QModelIndex: 代理模型中的索引
+        """
+        return self.proxy_model.mapFromSource(self.model.index(path))
+    
+    def _path_for_index(self, index):
+        """获取视图索引对应的路径
+        
+        Args:
+            index (QModelIndex): 代理模型中的索引
+            
+        Returns:
+            str: 文件或目录路径
+        """
+        return self.model.filePath(self.proxy_model.mapToSource(index))
     
     def set_root_path(self, path):
         """设置根路径
@@ -169,14 +439,24 @@ class AssetBrowser(QWidget):
             path (str): 资源根路径
         """
         if os.path.exists(path):
-            # 设置根路径
-            self.model.setRootPath(path)
-            # 设置视图的根索引
-            self.tree_view.setRootIndex(self.model.index(path))
             # 更新当前路径
             self.current_path = path
-            # 设置列宽
-            self.tree_view.setColumnWidth(0, 250)
+            # 扫描根目录推迟到事件循环空闲时，调用方可以立即返回
+            QTimer.singleShot(0, self._apply_root_path)
+    
+    def _apply_root_path(self):
+        """将当前路径设置为模型和视图的根，多次设置时只应用最后一次"""
+        path = self.current_path
+        if not path:
+            return
+        
+        # 共享模型已经以该路径为根时不再重新设置
+        if self.model.rootPath() != path:
+            self.model.setRootPath(path)
+        # 设置视图的根索引
+        self.tree_view.setRootIndex(self._index_for_path(path))
+        # 设置列宽
+        self.tree_view.setColumnWidth(0, 250)
             
     def _show_context_menu(self, position):
         """显示上下文菜单
@@ -186,16 +466,13 @@ class AssetBrowser(QWidget):
         """
         menu = QMenu()
         
-        # 获取选中的索引
-        indexes = self.tree_view.selectedIndexes()
-        if indexes and len(indexes) > 0:
-            # 只使用第一列的索引
-            selected_indexes = [idx for idx in indexes if idx.column() == 0]
-            
+        # 使用选择变化时缓存的路径
+        selected_paths = list(self._selected_paths)
+        if selected_paths:
             # 添加操作菜单项
             # 单个选择时的菜单项
-            if len(selected_indexes) == 1:
-                file_path = self.model.filePath(selected_indexes[0])
+            if len(selected_paths) == 1:
+                file_path = selected_paths[0]
                 
                 # 如果是目录，添加"新建文件夹"菜单项
                 if os.path.isdir(file_path):
@@ -211,18 +488,18 @@ class AssetBrowser(QWidget):
                 
                 # 添加重命名选项
                 rename_action = QAction("重命名", self)
-                rename_action.triggered.connect(lambda: self._rename_item(selected_indexes[0]))
+                rename_action.triggered.connect(lambda: self._rename_item(self._index_for_path(file_path)))
                 menu.addAction(rename_action)
                 
                 # 添加删除选项
                 delete_action = QAction("删除", self)
-                delete_action.triggered.connect(lambda: self._delete_items(selected_indexes))
+                delete_action.triggered.connect(lambda: self._delete_items(selected_paths))
                 menu.addAction(delete_action)
             
             # 多选时的菜单项
-            elif len(selected_indexes) > 1:
-                delete_action = QAction(f"删除选中的 {len(selected_indexes)} 个项目", self)
-                delete_action.triggered.connect(lambda: self._delete_items(selected_indexes))
+            elif len(selected_paths) > 1:
+                delete_action = QAction(f"删除选中的 {len(selected_paths)} 个项目", self)
+                delete_action.triggered.connect(lambda: self._delete_items(selected_paths))
                 menu.addAction(delete_action)
         else:
             # 未选择文件时的菜单项
@@ -250,14 +527,8 @@ class AssetBrowser(QWidget):
         """
         # 获取父目录
         if not parent_path:
-            indexes = self.tree_view.selectedIndexes()
-            if indexes and len(indexes) > 0:
-                # 只使用第一列的索引
-                selected_index = next((idx for idx in indexes if idx.column() == 0), None)
-                if selected_index:
-                    file_path = self.model.filePath(selected_index)
-                    if os.path.isdir(file_path):
-                        parent_path = file_path
+            if self._selected_paths and os.path.isdir(self._selected_paths[0]):
+                parent_path = self._selected_paths[0]
             
             if not parent_path and self.current_path:
                 parent_path = self.current_path
@@ -275,7 +546,7 @@ class AssetBrowser(QWidget):
                     os.makedirs(folder_path, exist_ok=True)
                     
                     # 选择新创建的文件夹
-                    self.tree_view.setCurrentIndex(self.model.index(folder_path))
+                    self.tree_view.setCurrentIndex(self._index_for_path(folder_path))
                     
                 except Exception as e:
                     QMessageBox.warning(self, "错误", f"无法创建文件夹: {str(e)}")
@@ -288,14 +559,8 @@ class AssetBrowser(QWidget):
         """
         # 获取目标目录
         if not target_dir:
-            indexes = self.tree_view.selectedIndexes()
-            if indexes and len(indexes) > 0:
-                # 只使用第一列的索引
-                selected_index = next((idx for idx in indexes if idx.column() == 0), None)
-                if selected_index:
-                    file_path = self.model.filePath(selected_index)
-                    if os.path.isdir(file_path):
-                        target_dir = file_path
+            if self._selected_paths and os.path.isdir(self._selected_paths[0]):
+                target_dir = self._selected_paths[0]
             
             if not target_dir and self.current_path:
                 target_dir = self.current_path
@@ -306,43 +571,56 @@ class AssetBrowser(QWidget):
                 self, 
                 "选择要导入的资源", 
                 "", 
-                "所有支持的文件 (*.png *.jpg *.jpeg *.bmp *.obj *.fbx *.gltf *.wav *.mp3 *.ogg *.scene *.py);;"\
-                "图片文件 (*.png *.jpg *.jpeg *.bmp);;"\
-                "3D模型 (*.obj *.fbx *.gltf);;"\
-                "音频文件 (*.wav *.mp3 *.ogg);;"\
-                "场景文件 (*.scene);;"\
-                "脚本文件 (*.py);;"\
-                "所有文件 (*.*)"
+                _IMPORT_FILTER
             )
             
             if file_paths:
-                # 导入所有选择的文件
-                for file_path in file_paths:
-                    try:
-                        file_name = os.path.basename(file_path)
-                        dest_path = os.path.join(target_dir, file_name)
-                        
-                        # 检查文件是否已存在
-                        if os.path.exists(dest_path):
-                            response = QMessageBox.question(
-                                self, 
-                                "文件已存在", 
-                                f"文件 {file_name} 已存在，是否覆盖？",
-                                QMessageBox.Yes | QMessageBox.No
-                            )
-                            
-                            if response == QMessageBox.No:
-                                continue
-                        
-                        # 复制文件
-                        import shutil
-                        shutil.copy2(file_path, dest_path)
-                        
-                    except Exception as e:
-                        QMessageBox.warning(self, "导入错误", f"无法导入文件 {file_name}: {str(e)}")
+                copy_pairs = [
+                    (file_path, os.path.join(target_dir, os.path.basename(file_path)))
+                    for file_path in file_paths
+                ]
+                
+                # 已存在的文件只询问一次是否全部覆盖
+                existing = [dst for _, dst in copy_pairs if os.path.exists(dst)]
+                if existing:
+                    names = "\n".join(os.path.basename(dst) for dst in existing[:10])
+                    if len(existing) > 10:
+                        names += "\n..."
+                    response = QMessageBox.question(
+                        self, 
+                        "文件已存在", 
+                        f"以下 {len(existing)} 个文件已存在，是否全部覆盖？\n{names}",
+                        QMessageBox.Yes | QMessageBox.No
+                    )
+                    
+                    if response == QMessageBox.No:
+                        existing = set(existing)
+                        copy_pairs = [pair for pair in copy_pairs if pair[1] not in existing]
                 
-                # 刷新视图
-                self._refresh_view()
+                if copy_pairs:
+                    # 复制在线程池中并行进行，界面保持响应
+                    worker = ImportWorker(copy_pairs)
+                    target_paths = [dst for _, dst in copy_pairs]
+                    worker.signals.finished.connect(
+                        lambda errors: self._on_import_finished(errors, target_paths)
+                    )
+                    QThreadPool.globalInstance().start(worker)
+    
+    def _on_import_finished(self, errors, target_paths):
+        """导入完成后报告错误并把新文件加入模型
+        
+        Args:
+            errors (list): 导入失败的错误信息列表
+            target_paths (list): 导入的目标文件路径列表
+        """
+        if errors:
+            QMessageBox.warning(self, "导入错误", "\n".join(errors))
+        
+        # 监视关闭时模型不会自动发现新文件，按路径获取索引即可插入对应节点，无需重新扫描目录
+        if not self._is_watching():
+            for path in target_paths:
+                if os.path.exists(path):
+                    self.model.index(path)
     
     def _rename_item(self, index):
         """重命名项目
@@ -351,7 +629,7 @@ class AssetBrowser(QWidget):
             index (QModelIndex): 要重命名的项目索引
         """
         if index.isValid():
-            file_path = self.model.filePath(index)
+            file_path = self._path_for_index(index)
             old_name = os.path.basename(file_path)
             
             # 弹出对话框获取新名称
@@ -371,68 +649,104 @@ class AssetBrowser(QWidget):
                     
                     # 重命名文件
                     os.rename(file_path, new_path)
+                    # 监视关闭时重新扫描，去掉旧名称的节点
+                    self._refresh_after_change()
                     
                 except Exception as e:
                     QMessageBox.warning(self, "重命名错误", f"无法重命名: {str(e)}")
     
-    def _delete_items(self, indexes):
+    def _delete_items(self, file_paths):
         """删除选中的项目
         
         Args:
-            indexes (list): 要删除的项目索引列表
+            file_paths (list): 要删除的文件或目录路径列表
         """
-        if indexes:
+        if file_paths:
             # 确认删除
-            message = f"确定要删除选中的 {len(indexes)} 个项目吗？此操作不可撤销。"
+            message = f"确定要删除选中的 {len(file_paths)} 个项目吗？此操作不可撤销。"
             response = QMessageBox.question(
                 self, "确认删除", message, QMessageBox.Yes | QMessageBox.No
             )
             
             if response == QMessageBox.Yes:
-                for index in indexes:
-                    if index.isValid() and index.column() == 0:
-                        file_path = self.model.filePath(index)
-                        try:
-                            if os.path.isdir(file_path):
-                                import shutil
-                                shutil.rmtree(file_path)
-                            else:
-                                os.remove(file_path)
-                        except Exception as e:
-                            QMessageBox.warning(
-                                self, 
-                                "删除错误", 
-                                f"无法删除 {os.path.basename(file_path)}: {str(e)}"
-                            )
+                # 删除大目录可能很慢，放到线程池中进行，界面保持响应
+                worker = DeleteWorker(file_paths)
+                worker.signals.finished.connect(self._on_delete_finished)
+                QThreadPool.globalInstance().start(worker)
+    
+    def _on_delete_finished(self, errors):
+        """删除完成后报告错误并刷新视图
+        
+        Args:
+            errors (list): 删除失败的错误信息列表
+        """
+        if errors:
+            QMessageBox.warning(self, "删除错误", "\n".join(errors))
+        self._refresh_after_change()
+    
+    def _refresh_after_change(self):
+        """自己修改文件后刷新视图，监视文件变化时模型已由文件监视器更新，无需重新扫描"""
+        if not self._is_watching():
+            self._refresh_view()
     
     def _refresh_view(self):
-        """刷新视图"""
-        if self.current_path:
-            # 保存当前选择
-            current_index = self.tree_view.currentIndex()
-            current_path = self.model.filePath(current_index) if current_index.isValid() else None
-            
-            # 重新加载模型
-            self.model.setRootPath(self.current_path)
-            
-            # 尝试恢复选择
-            if current_path and os.path.exists(current_path):
-                new_index = self.model.index(current_path)
-                if new_index.isValid():
-                    self.tree_view.setCurrentIndex(new_index)
+        """刷新视图
+        
+        Qt对相同的根路径不会重新扫描，因此先清空根路径再重新设置，强制重新扫描目录。
+        """
+        if not self.current_path:
+            return
+        
+        # 保存当前选择
+        current_index = self.tree_view.currentIndex()
+        current_path = self._path_for_index(current_index) if current_index.isValid() else None
+        
+        # 重新扫描模型
+        self.model.setRootPath("")
+        self.model.setRootPath(self.current_path)
+        self.tree_view.setRootIndex(self._index_for_path(self.current_path))
+        
+        # 尝试恢复选择
+        if current_path and os.path.exists(current_path):
+            new_index = self._index_for_path(current_path)
+            if new_index.isValid():
+                self.tree_view.setCurrentIndex(new_index)
+    
+    def _is_watching(self):
+        """文件系统模型是否在监视文件变化
+        
+        Returns:
+            bool: 是否监视
+        """
+        return not self.model.testOption(QFileSystemModel.DontWatchForChanges)
+    
+    def _set_watch_changes(self, enabled):
+        """设置是否监视文件系统变化
+        
+        Args:
+            enabled (bool): 是否监视，关闭后资源树不会自动显示文件变化
+        """
+        self.model.setOption(QFileSystemModel.DontWatchForChanges, not enabled)
+        if enabled:
+            # 已加载的目录不会补注册监视器，重新扫描让Qt重新监视并显示关闭期间的变化
+            self._refresh_view()
     
     def _on_selection_changed(self):
-        """选择改变时更新预览"""
-        indexes = self.tree_view.selectionModel().selectedIndexes()
-        if indexes and len(indexes) > 0:
-            # 只使用第一列的索引
-            selected_index = next((idx for idx in indexes if idx.column() == 0), None)
-            if selected_index:
-                file_path = self.model.filePath(selected_index)
-                self._update_preview(file_path)
-                
-                # 发射信号
-                self.asset_selected.emit(file_path)
+        """选择改变时缓存选中路径并更新预览"""
+        # 只使用第一列的索引，结果供上下文菜单、新建文件夹和导入资源共用
+        self._selected_paths = [
+            self._path_for_index(idx)
+            for idx in self.tree_view.selectionModel().selectedIndexes()
+            if idx.column() == 0
+        ]
+        
+        if self._selected_paths:
+            file_path = self._selected_paths[0]
+            self._pending_preview_path = file_path
+            self._preview_timer.start(self.PREVIEW_DELAY_MS)
+            
+            # 发射信号
+            self.asset_selected.emit(file_path)
     
     def _on_item_double_clicked(self, index):
         """双击项目时的回调
@@ -441,54 +755,70 @@ class AssetBrowser(QWidget):
             index (QModelIndex): 被双击的项目索引
         """
         if index.isValid() and index.column() == 0:
-            file_path = self.model.filePath(index)
+            file_path = self._path_for_index(index)
             # 发射信号
             self.asset_double_clicked.emit(file_path)
     
+    def _do_preview(self):
+        """选择稳定后更新预览"""
+        if self._pending_preview_path:
+            self._update_preview(self._pending_preview_path)
+    
     def _update_preview(self, file_path):
         """更新预览面板
         
         Args:
             file_path (str): 文件路径
         """
-        if os.path.isdir(file_path):
+        # 丢弃尚未完成的图片预览
+        self._preview_image_key = None
+        self.preview_panel.setToolTip("")
+        
+        # 只stat一次，类型判断、文件大小和图片缓存键共用结果
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return
+        self._preview_size = self._format_size(st.st_size)
+        
+        # setText会同时清除之前的图片，之后不能再设置空pixmap，否则文字也会被清除
+        if stat.S_ISDIR(st.st_mode):
             # 显示目录信息
-            num_files = len([f for f in os.listdir(file_path) if os.path.isfile(os.path.join(file_path, f))])
-            num_dirs = len([d for d in os.listdir(file_path) if os.path.isdir(os.path.join(file_path, d))])
-            
-            self.preview_panel.setText(f"文件夹: {os.path.basename(file_path)}\n"
-                                      f"包含 {num_files} 个文件\n"
-                                      f"{num_dirs} 个子目录")
+            folder_name = os.path.basename(file_path)
+            if folder_name in _SKIPPED_DIRS:
+                self.preview_panel.setText(f"文件夹: {folder_name}")
+                return
             
-            self.preview_panel.setPixmap(QPixmap())  # 清除pixmap
+            num_files, num_dirs, capped = self._count_entries(file_path)
+            more = "+" if capped else ""
+            self.preview_panel.setText(f"文件夹: {folder_name}\n"
+                                      f"包含 {num_files}{more} 个文件\n"
+                                      f"{num_dirs}{more} 个子目录")
             
-        elif os.path.isfile(file_path):
+        elif stat.S_ISREG(st.st_mode):
             # 根据文件类型显示不同预览
             ext = os.path.splitext(file_path)[1].lower()
             
-            if ext in ['.png', '.jpg', '.jpeg', '.bmp']:
+            if ext in _IMAGE_EXTS:
                 # 图片预览
-                self._preview_image(file_path)
+                self._preview_image(file_path, st.st_mtime_ns)
                 
-            elif ext in ['.obj', '.fbx', '.gltf']:
+            elif ext in _MODEL_EXTS:
                 # 3D模型预览 (简化版)
                 self.preview_panel.setText(f"3D模型: {os.path.basename(file_path)}\n"
                                           f"类型: {ext[1:].upper()}\n"
-                                          f"大小: {self._get_file_size(file_path)}")
-                self.preview_panel.setPixmap(QPixmap())
+                                          f"大小: {self._preview_size}")
                 
-            elif ext in ['.wav', '.mp3', '.ogg']:
+            elif ext in _AUDIO_EXTS:
                 # 音频文件预览
                 self.preview_panel.setText(f"音频文件: {os.path.basename(file_path)}\n"
                                           f"类型: {ext[1:].upper()}\n"
-                                          f"大小: {self._get_file_size(file_path)}")
-                self.preview_panel.setPixmap(QPixmap())
+                                          f"大小: {self._preview_size}")
                 
             elif ext == '.scene':
                 # 场景文件预览
                 self.preview_panel.setText(f"场景文件: {os.path.basename(file_path)}\n"
-                                          f"大小: {self._get_file_size(file_path)}")
-                self.preview_panel.setPixmap(QPixmap())
+                                          f"大小: {self._preview_size}")
                 
             elif ext == '.py':
                 # 脚本文件预览
@@ -498,40 +828,102 @@ class AssetBrowser(QWidget):
                 # 其他文件
                 self.preview_panel.setText(f"文件: {os.path.basename(file_path)}\n"
                                           f"类型: {ext[1:].upper() if ext else '未知'}\n"
-                                          f"大小: {self._get_file_size(file_path)}")
-                self.preview_panel.setPixmap(QPixmap())
+                                          f"大小: {self._preview_size}")
     
-    def _preview_image(self, file_path):
-        """预览图片
+    def _count_entries(self, dir_path):
+        """统计目录中的文件和子目录数量，最多统计FOLDER_SCAN_LIMIT个条目
         
         Args:
-            file_path (str): 图片文件路径
+            dir_path (str): 目录路径
+            
+        Returns:
+            tuple: (文件数量, 子目录数量, 是否因达到上限而停止)
         """
+        num_files = num_dirs = 0
         try:
-            pixmap = QPixmap(file_path)
-            if not pixmap.isNull():
-                # 获取图片尺寸
-                width = pixmap.width()
-                height = pixmap.height()
-                
-                # 调整图片大小以适应预览面板
-                preview_width = self.preview_panel.width() - 10
-                preview_height = self.preview_panel.height() - 40
-                pixmap = pixmap.scaled(
-                    preview_width, preview_height,
-                    Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-                
-                self.preview_panel.setPixmap(pixmap)
-                # 在pixmap下方显示图片信息
-                self.preview_panel.setText(f"\n\n\n\n\n\n{os.path.basename(file_path)}\n"
-                                          f"{width}x{height}, {self._get_file_size(file_path)}")
-            else:
+            # 一次遍历统计，条目类型来自目录项本身，通常不需要stat
+            with os.scandir(dir_path) as entries:
+                for i, entry in enumerate(entries):
+                    if i >= self.FOLDER_SCAN_LIMIT:
+                        return num_files, num_dirs, True
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            num_dirs += 1
+                        elif entry.is_file(follow_symlinks=False):
+                            num_files += 1
+                    except OSError:
+                        pass
+        except OSError as e:
+            print(f"读取目录失败: {dir_path}, {e}")
+        return num_files, num_dirs, False
+    
+    def _preview_image(self, file_path, mtime):
+        """预览图片，缩略图已缓存时直接显示，否则在线程池中解码和缩放
+        
+        Args:
+            file_path (str): 图片文件路径
+            mtime (int): 文件修改时间，单位为纳秒
+        """
+        # 调整图片大小以适应预览面板
+        preview_width = max(self.preview_panel.width() - 10, 1)
+        preview_height = max(self.preview_panel.height() - 40, 1)
+        
+        # 缓存键包含修改时间和预览尺寸，文件变化或面板缩放后重新生成
+        key = f"{file_path}|{mtime}|{preview_width}x{preview_height}"
+        
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            size = QImageReader(file_path).size()  # 只读取文件头
+            self._show_image_preview(file_path, pixmap, size.width(), size.height())
+            return
+        
+        self._preview_image_key = key
+        self.preview_panel.setText(f"正在加载图片:\n{os.path.basename(file_path)}")
+        
+        loader = ImageLoader(key, file_path, preview_width, preview_height)
+        loader.signals.loaded.connect(self._on_image_loaded)
+        QThreadPool.globalInstance().start(loader)
+    
+    def _on_image_loaded(self, key, file_path, image, width, height):
+        """图片加载完成后缓存缩略图并显示预览
+        
+        Args:
+            key (str): 缩略图缓存键
+            file_path (str): 图片文件路径
+            image (QImage): 缩放后的图片
+            width (int): 原始宽度
+            height (int): 原始高度
+        """
+        if image.isNull():
+            if key == self._preview_image_key:
+                self._preview_image_key = None
                 self.preview_panel.setText(f"无法预览图片:\n{os.path.basename(file_path)}")
-                self.preview_panel.setPixmap(QPixmap())
-        except Exception as e:
-            self.preview_panel.setText(f"预览图片错误:\n{str(e)}")
-            self.preview_panel.setPixmap(QPixmap())
+            return
+        
+        # 过期结果也放入缓存，之后再选中时可以直接使用
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        
+        # 加载期间选择了其他文件，不更新预览
+        if key != self._preview_image_key:
+            return
+        self._preview_image_key = None
+        
+        self._show_image_preview(file_path, pixmap, width, height)
+    
+    def _show_image_preview(self, file_path, pixmap, width, height):
+        """显示图片预览
+        
+        Args:
+            file_path (str): 图片文件路径
+            pixmap (QPixmap): 缩略图
+            width (int): 原始宽度
+            height (int): 原始高度
+        """
+        self.preview_panel.setPixmap(pixmap)
+        # QLabel不能同时显示图片和文字，图片信息放在提示中
+        self.preview_panel.setToolTip(f"{os.path.basename(file_path)}\n"
+                                      f"{width}x{height}, {self._preview_size}")
     
     def _preview_script(self, file_path):
         """预览脚本文件
@@ -539,35 +931,37 @@ class AssetBrowser(QWidget):
         Args:
             file_path (str): 脚本文件路径
         """
+        # setText会清除之前的图片，不需要再设置空pixmap，否则文字也会被清除
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # 只读取前10行
-                lines = [next(f) for _ in range(10) if f]
-                content = ''.join(lines)
-                
-                self.preview_panel.setText(f"脚本文件: {os.path.basename(file_path)}\n"
-                                          f"大小: {self._get_file_size(file_path)}\n\n"
-                                          f"预览:\n{content}\n...\n")
-                self.preview_panel.setPixmap(QPixmap())
-        except Exception as e:
+            # 预览只需要开头几行，一次读取一个块，不使用带缓冲的逐行读取
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                raw = os.read(fd, self.SCRIPT_PREVIEW_BYTES)
+            finally:
+                os.close(fd)
+        except OSError as e:
             self.preview_panel.setText(f"预览脚本错误:\n{str(e)}")
-            self.preview_panel.setPixmap(QPixmap())
+            return
+        
+        # 只显示前10行
+        content = '\n'.join(raw.decode('utf-8', errors='replace').splitlines()[:10])
+        
+        self.preview_panel.setText(f"脚本文件: {os.path.basename(file_path)}\n"
+                                  f"大小: {self._preview_size}\n\n"
+                                  f"预览:\n{content}\n...\n")
     
-    def _get_file_size(self, file_path):
+    @staticmethod
+    def _format_size(size):
         """获取文件大小的可读表示
         
         Args:
-            file_path (str): 文件路径
+            size (int): 文件大小，单位为字节
             
         Returns:
             str: 格式化的文件大小
         """
-        try:
-            size = os.path.getsize(file_path)
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if size < 1024.0:
-                    return f"{size:.1f} {unit}"
-                size /= 1024.0
-            return f"{size:.1f} TB"
-        except Exception:
-            return "未知大小"
\ No newline at end of file
+        for unit in ['B', 'KB', 'MB', 'GB']:
+            if size < 1024.0:
+                return f"{size:.1f} {unit}"
+            size /= 1024.0
+        return f"{size:.1f} TB"
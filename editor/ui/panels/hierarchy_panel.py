@@ -5,95 +5,461 @@
 """
 
 import os
-import uuid
+from array import array
+from functools import lru_cache
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QTreeWidget, QTreeWidgetItem, 
+    QWidget, QVBoxLayout, QTreeView, QAbstractItemView,
     QHeaderView, QMenu, QAction, QInputDialog, QMessageBox,
     QToolBar
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QAbstractItemModel, QModelIndex
 from PyQt5.QtGui import QIcon, QColor, QBrush, QFont
 
 
-class EntityTreeItem(QTreeWidgetItem):
-    """实体树项目类"""
+# 组件类型对应的实体图标，按优先级排列
+_COMPONENT_ICONS = {
+    "CameraComponent": "camera.png",
+    "LightComponent": "light.png",
+    "MeshComponent": "mesh.png",
+    "AudioComponent": "audio.png",
+    "ScriptComponent": "script.png",
+}
+
+
+# 禁用实体的文字颜色，所有节点共用
+_DISABLED_BRUSH = QBrush(QColor(150, 150, 150))
+
+
+@lru_cache(maxsize=None)
+def _icon(name):
+    """获取图标，每个图标文件在进程内只加载一次
+    
+    Args:
+        name (str): resources/icons目录下的图标文件名
+        
+    Returns:
+        QIcon: 共享的图标
+    """
+    return QIcon(f"resources/icons/{name}")
+
+
+def entity_key(entity):
+    """获取实体在层级中的键
+    
+    Args:
+        entity: 实体对象
+        
+    Returns:
+        实体ID，没有ID时使用对象标识
+    """
+    return entity.id if hasattr(entity, "id") else id(entity)
+
+
+class SceneHierarchyModel(QAbstractItemModel):
+    """场景层级模型
+    
+    节点按广度优先顺序存放在并行的扁平数组中，同一父节点的子节点连续排列，
+    index()、parent()和rowCount()都只需要一次数组查找，模型索引的内部ID就是节点编号。
+    增量添加节点时，父节点的子节点块整体移到数组末尾以保持连续，原位置留空，
+    下次重建模型时回收。
+    """
+    
+    NONE = -1  # 表示没有父节点或子节点的哨兵值
+    FRAGMENT_SLACK = 256  # 允许的空位数量，超过有效节点数加上该值时重建模型
     
-    def __init__(self, entity, parent=None):
-        """初始化实体树项
+    def __init__(self, parent=None):
+        """初始化场景层级模型
         
         Args:
-            entity: 实体对象
-            parent: 父项目
+            parent (QObject): 父对象
         """
         super().__init__(parent)
+        self._clear_nodes()
+        
+        # 禁用实体的斜体字体，需要在QApplication创建后构造，因此每个模型创建一次
+        self._disabled_font = QFont()
+        self._disabled_font.setItalic(True)
+    
+    def _clear_nodes(self):
+        """清空节点数组"""
+        self.entities = []  # 节点 -> 实体
+        self.names = []  # 节点 -> 显示名称
+        self.icons = []  # 节点 -> 图标，首次显示时生成
+        self.tooltips = []  # 节点 -> 工具提示，首次显示时生成
+        self.component_types = []  # 节点 -> 组件类型名称，图标和工具提示共用
+        self.parents = array("i")  # 节点 -> 父节点
+        self.first_child = array("i")  # 节点 -> 第一个子节点
+        self.child_count = array("i")  # 节点 -> 子节点数量
+        self.root_first = 0  # 第一个根节点
+        self.root_count = 0  # 根节点数量
+        self.entity_nodes = {}  # 实体ID -> 节点
+    
+    def set_root_entities(self, root_entities):
+        """重建模型
         
-        self.entity_id = entity.id if hasattr(entity, "id") else str(uuid.uuid4())
-        self.entity_name = entity.name if hasattr(entity, "name") else "Entity"
-        self.entity = entity
+        Args:
+            root_entities (list): 根实体列表
+        """
+        self.beginResetModel()
+        self._clear_nodes()
         
-        # 设置显示名称
-        self.setText(0, self.entity_name)
+        self.entities.extend(root_entities)
+        self.root_count = len(self.entities)
+        self.parents.extend([self.NONE] * self.root_count)
+        self._build_nodes(0)
         
-        # 设置图标（根据实体类型或组件设置不同图标）
-        self.setIcon(0, self._get_entity_icon(entity))
+        self.endResetModel()
+    
+    def _build_nodes(self, start):
+        """填充新节点的其余数组，并按广度优先顺序追加它们的子节点
         
-        # 设置工具提示
-        self.setToolTip(0, f"ID: {self.entity_id}\n类型: {self._get_entity_type(entity)}")
+        调用前新节点只写入了entities和parents数组。
         
-        # 设置实体是否激活的样式
-        if hasattr(entity, "enabled") and not entity.enabled:
-            # 使用灰色文本来表示禁用的实体
-            self.setForeground(0, QBrush(QColor(150, 150, 150)))
-            # 设置斜体字
-            font = self.font(0)
-            font.setItalic(True)
-            self.setFont(0, font)
+        Args:
+            start (int): 第一个新节点
+        """
+        entities = self.entities
+        
+        # 广度优先遍历，子节点追加到末尾，同一父节点的子节点因此连续
+        node = start
+        while node < len(entities):
+            entity = entities[node]
+            children = entity.children if hasattr(entity, "children") else []
+            
+            self.first_child.append(len(entities) if children else self.NONE)
+            self.child_count.append(len(children))
+            entities.extend(children)
+            self.parents.extend([node] * len(children))
+            
+            self.names.append(entity.name if hasattr(entity, "name") else "Entity")
+            self.entity_nodes[entity_key(entity)] = node
+            node += 1
+        
+        # 图标和工具提示需要检查组件，只为视图实际请求的节点生成
+        added = len(entities) - start
+        self.icons.extend([None] * added)
+        self.tooltips.extend([None] * added)
+        self.component_types.extend([None] * added)
     
-    def _get_entity_icon(self, entity):
-        """获取实体图标
+    def _block(self, parent):
+        """获取父节点的子节点块
+        
+        Args:
+            parent (int): 父节点，NONE表示根
+            
+        Returns:
+            tuple: (第一个子节点, 子节点数量)
+        """
+        if parent == self.NONE:
+            return self.root_first, self.root_count
+        return self.first_child[parent], self.child_count[parent]
+    
+    def _set_block(self, parent, first, count):
+        """设置父节点的子节点块
+        
+        Args:
+            parent (int): 父节点，NONE表示根
+            first (int): 第一个子节点
+            count (int): 子节点数量
+        """
+        if parent == self.NONE:
+            self.root_first, self.root_count = first, count
+        else:
+            self.first_child[parent] = first if count else self.NONE
+            self.child_count[parent] = count
+    
+    def _move_node(self, source, target):
+        """把节点的数据复制到另一个位置，并更新子节点和实体ID的指向
+        
+        Args:
+            source (int): 原节点
+            target (int): 目标节点，等于节点数量时追加到末尾
+        """
+        if target == len(self.entities):
+            for values in (self.entities, self.names, self.icons, self.tooltips,
+                           self.component_types, self.parents, self.first_child, self.child_count):
+                values.append(values[source])
+        else:
+            for values in (self.entities, self.names, self.icons, self.tooltips,
+                           self.component_types, self.parents, self.first_child, self.child_count):
+                values[target] = values[source]
+        
+        first, count = self._block(source)
+        for child in range(first, first + count):
+            self.parents[child] = target
+        self.entity_nodes[entity_key(self.entities[target])] = target
+    
+    def _release_subtree(self, node):
+        """释放节点及其所有后代占用的位置
+        
+        Args:
+            node (int): 节点
+        """
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            key = entity_key(self.entities[node])
+            if self.entity_nodes.get(key) == node:
+                del self.entity_nodes[key]
+            self.entities[node] = None
+            
+            first, count = self._block(node)
+            pending.extend(range(first, first + count))
+    
+    def is_fragmented(self):
+        """增量修改留下的空位是否已经多于有效节点，此时应重建模型
+        
+        Returns:
+            bool: 是否需要重建
+        """
+        return len(self.entities) > 2 * len(self.entity_nodes) + self.FRAGMENT_SLACK
+    
+    def insert_entity(self, entity, parent=NONE):
+        """在父节点的子节点末尾添加实体
         
         Args:
             entity: 实体对象
+            parent (int): 父节点，NONE表示添加为根节点
             
         Returns:
-            QIcon: 实体图标
+            int: 新节点
         """
-        # 根据实体类型或组件设置不同图标
-        # 这里可以根据实际需求扩展
-        if hasattr(entity, "components"):
-            components = entity.get_components() if callable(getattr(entity, "get_components", None)) else []
-            component_types = [comp.__class__.__name__ for comp in components]
+        parent_index = self.node_index(parent) if parent != self.NONE else QModelIndex()
+        first, count = self._block(parent)
+        
+        self.beginInsertRows(parent_index, count, count)
+        
+        # 子节点块不在数组末尾时整体移到末尾，新节点才能紧接在后面
+        moved = {}
+        if count and first + count != len(self.entities):
+            new_first = len(self.entities)
+            for node in range(first, first + count):
+                moved[node] = len(self.entities)
+                self._move_node(node, len(self.entities))
+                self.entities[node] = None
+            first = new_first
+        elif not count:
+            first = len(self.entities)
+        
+        node = len(self.entities)
+        self.entities.append(entity)
+        self.parents.append(parent)
+        self._set_block(parent, first, count + 1)
+        self._build_nodes(node)
+        
+        # 移动过的节点更新持久索引，视图中的选择和展开状态得以保留
+        if moved:
+            old_indexes = []
+            new_indexes = []
+            for index in self.persistentIndexList():
+                target = moved.get(index.internalId())
+                if target is not None:
+                    old_indexes.append(index)
+                    new_indexes.append(self.createIndex(index.row(), 0, target))
+            self.changePersistentIndexList(old_indexes, new_indexes)
+        
+        self.endInsertRows()
+        return node
+    
+    def remove_node(self, node):
+        """移除节点及其所有后代
+        
+        Args:
+            node (int): 节点
+        """
+        parent = self.parents[node]
+        parent_index = self.node_index(parent) if parent != self.NONE else QModelIndex()
+        first, count = self._block(parent)
+        row = node - first
+        
+        self.beginRemoveRows(parent_index, row, row)
+        self._release_subtree(node)
+        
+        # 后面的兄弟节点前移一位保持连续，Qt在endRemoveRows中通过index()取得它们的新索引
+        for sibling in range(node + 1, first + count):
+            self._move_node(sibling, sibling - 1)
+        self.entities[first + count - 1] = None
+        self._set_block(parent, first, count - 1)
+        
+        self.endRemoveRows()
+    
+    def _get_component_types(self, node):
+        """获取节点实体的组件类型名称，每个节点只检查一次组件
+        
+        Args:
+            node (int): 节点
             
-            # 根据组件类型返回对应图标
-            if "CameraComponent" in component_types:
-                return QIcon("resources/icons/camera.png")
-            elif "LightComponent" in component_types:
-                return QIcon("resources/icons/light.png")
-            elif "MeshComponent" in component_types:
-                return QIcon("resources/icons/mesh.png")
-            elif "AudioComponent" in component_types:
-                return QIcon("resources/icons/audio.png")
-            elif "ScriptComponent" in component_types:
-                return QIcon("resources/icons/script.png")
-        
-        # 默认图标
-        return QIcon("resources/icons/entity.png")
-    
-    def _get_entity_type(self, entity):
+        Returns:
+            tuple: 组件类型名称
+        """
+        component_types = self.component_types[node]
+        if component_types is None:
+            entity = self.entities[node]
+            components = ()
+            if hasattr(entity, "components") and callable(getattr(entity, "get_components", None)):
+                components = entity.get_components()
+            component_types = self.component_types[node] = tuple(
+                comp.__class__.__name__ for comp in components
+            )
+        return component_types
+    
+    def _get_entity_icon(self, component_types):
+        """获取实体图标
+        
+        Args:
+            component_types (tuple): 实体的组件类型名称
+            
+        Returns:
+            QIcon: 实体图标
+        """
+        # 根据组件类型返回对应图标，没有匹配的组件时使用默认图标
+        icon_name = next(
+            (name for component_type, name in _COMPONENT_ICONS.items() if component_type in component_types),
+            "entity.png"
+        )
+        return _icon(icon_name)
+    
+    def _get_entity_type(self, component_types, entity):
         """获取实体类型描述
         
         Args:
+            component_types (tuple): 实体的组件类型名称
             entity: 实体对象
             
         Returns:
             str: 实体类型描述
         """
-        if hasattr(entity, "components"):
-            components = entity.get_components() if callable(getattr(entity, "get_components", None)) else []
-            if components:
-                return ", ".join([comp.__class__.__name__ for comp in components])
+        if component_types:
+            return ", ".join(component_types)
         
         return entity.__class__.__name__
+    
+    def _row(self, node):
+        """获取节点在其父节点下的行号
+        
+        Args:
+            node (int): 节点
+            
+        Returns:
+            int: 行号
+        """
+        return node - self._block(self.parents[node])[0]
+    
+    def node_index(self, node):
+        """获取节点的模型索引
+        
+        Args:
+            node (int): 节点
+            
+        Returns:
+            QModelIndex: 模型索引
+        """
+        return self.createIndex(self._row(node), 0, node)
+    
+    def entity(self, index):
+        """获取模型索引对应的实体
+        
+        Args:
+            index (QModelIndex): 模型索引
+            
+        Returns:
+            实体对象，索引无效时返回None
+        """
+        return self.entities[index.internalId()] if index.isValid() else None
+    
+    def set_name(self, node, name):
+        """更新节点显示名称
+        
+        Args:
+            node (int): 节点
+            name (str): 新名称
+        """
+        self.names[node] = name
+        index = self.node_index(node)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+    
+    def refresh_style(self, node):
+        """实体激活状态变化后刷新节点样式
+        
+        Args:
+            node (int): 节点
+        """
+        index = self.node_index(node)
+        self.dataChanged.emit(index, index, [Qt.ForegroundRole, Qt.FontRole])
+    
+    def index(self, row, column, parent=QModelIndex()):
+        """获取子节点的模型索引"""
+        if column != 0 or row < 0:
+            return QModelIndex()
+        
+        if parent.isValid():
+            parent_node = parent.internalId()
+            if row >= self.child_count[parent_node]:
+                return QModelIndex()
+            return self.createIndex(row, 0, self.first_child[parent_node] + row)
+        
+        if row >= self.root_count:
+            return QModelIndex()
+        return self.createIndex(row, 0, self.root_first + row)
+    
+    def parent(self, index):
+        """获取父节点的模型索引"""
+        if not index.isValid():
+            return QModelIndex()
+        
+        parent_node = self.parents[index.internalId()]
+        if parent_node == self.NONE:
+            return QModelIndex()
+        return self.createIndex(self._row(parent_node), 0, parent_node)
+    
+    def rowCount(self, parent=QModelIndex()):
+        """获取子节点数量"""
+        if parent.column() > 0:
+            return 0
+        if parent.isValid():
+            return self.child_count[parent.internalId()]
+        return self.root_count
+    
+    def columnCount(self, parent=QModelIndex()):
+        """获取列数"""
+        return 1
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """获取节点数据"""
+        if not index.isValid():
+            return None
+        
+        node = index.internalId()
+        if role == Qt.DisplayRole:
+            return self.names[node]
+        if role == Qt.DecorationRole:
+            icon = self.icons[node]
+            if icon is None:
+                icon = self.icons[node] = self._get_entity_icon(self._get_component_types(node))
+            return icon
+        if role == Qt.ToolTipRole:
+            tooltip = self.tooltips[node]
+            if tooltip is None:
+                entity = self.entities[node]
+                tooltip = self.tooltips[node] = (
+                    f"ID: {entity_key(entity)}\n"
+                    f"类型: {self._get_entity_type(self._get_component_types(node), entity)}"
+                )
+            return tooltip
+        
+        # 使用灰色斜体文字表示禁用的实体
+        if role == Qt.ForegroundRole or role == Qt.FontRole:
+            entity = self.entities[node]
+            if hasattr(entity, "enabled") and not entity.enabled:
+                return _DISABLED_BRUSH if role == Qt.ForegroundRole else self._disabled_font
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """获取标题栏文字"""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "场景层级"
+        return None
 
 
 class HierarchyPanel(QWidget):
@@ -119,42 +485,47 @@ class HierarchyPanel(QWidget):
         
         # 添加工具栏按钮
         self.add_entity_action = QAction("添加实体", self)
-        self.add_entity_action.setIcon(QIcon("resources/icons/add.png"))
+        self.add_entity_action.setIcon(_icon("add.png"))
         self.add_entity_action.triggered.connect(self._add_entity)
         self.toolbar.addAction(self.add_entity_action)
         
         self.delete_entity_action = QAction("删除实体", self)
-        self.delete_entity_action.setIcon(QIcon("resources/icons/delete.png"))
+        self.delete_entity_action.setIcon(_icon("delete.png"))
         self.delete_entity_action.triggered.connect(self._delete_entity)
         self.toolbar.addAction(self.delete_entity_action)
         
         self.refresh_action = QAction("刷新", self)
-        self.refresh_action.setIcon(QIcon("resources/icons/refresh.png"))
+        self.refresh_action.setIcon(_icon("refresh.png"))
         self.refresh_action.triggered.connect(self.refresh_tree)
         self.toolbar.addAction(self.refresh_action)
         
-        # 创建树形视图
-        self.tree_widget = QTreeWidget()
-        self.tree_widget.setHeaderLabel("场景层级")
-        self.tree_widget.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.tree_widget.customContextMenuRequested.connect(self._show_context_menu)
-        self.tree_widget.setSelectionMode(QTreeWidget.ExtendedSelection)
-        self.tree_widget.setDragDropMode(QTreeWidget.InternalMove)
+        # 创建层级模型和树形视图
+        self.model = SceneHierarchyModel(self)
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.model)
+        self.tree_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.tree_view.customContextMenuRequested.connect(self._show_context_menu)
+        self.tree_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.tree_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # 所有行高度一致，布局时无需逐行计算高度；关闭展开动画和自动滚动
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setAnimated(False)
+        self.tree_view.setAutoScroll(False)
         
         # 设置标题栏格式
-        header = self.tree_widget.header()
+        header = self.tree_view.header()
         header.setSectionResizeMode(QHeaderView.Stretch)
         
         # 连接信号
-        self.tree_widget.itemSelectionChanged.connect(self._on_selection_changed)
-        self.tree_widget.itemDoubleClicked.connect(self._on_item_double_clicked)
-        layout.addWidget(self.tree_widget)
+        self.tree_view.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.tree_view.doubleClicked.connect(self._on_item_double_clicked)
+        layout.addWidget(self.tree_view)
         
         # 当前场景
         self.current_scene = None
         
-        # 实体到树项目的映射
-        self.entity_items = {}
+        # 面板隐藏时推迟刷新，再次显示时才重建实体树
+        self._dirty = False
     
     def load_scene(self, scene):
         """加载场景
@@ -166,15 +537,30 @@ class HierarchyPanel(QWidget):
         self.refresh_tree()
     
     def refresh_tree(self):
-        """刷新实体树"""
-        # 清空树
-        self.tree_widget.clear()
-        self.entity_items = {}
+        """刷新实体树，面板不可见时推迟到显示时刷新"""
+        if not self.isVisible():
+            self._dirty = True
+            return
+        self._do_refresh()
+    
+    def showEvent(self, event):
+        """面板显示时执行推迟的刷新
+        
+        Args:
+            event (QShowEvent): 显示事件
+        """
+        if self._dirty:
+            self._do_refresh()
+        super().showEvent(event)
+    
+    def _do_refresh(self):
+        """重建实体树"""
+        self._dirty = False
+        
+        # 获取场景中的根实体
+        root_entities = []
         
         if self.current_scene:
-            # 获取场景中的根实体
-            root_entities = []
-            
             # 尝试不同的方法获取根实体
             if hasattr(self.current_scene, "root_entities"):
                 # 直接访问根实体属性
@@ -186,36 +572,20 @@ class HierarchyPanel(QWidget):
                 # 获取所有实体，然后筛选出根实体
                 all_entities = self.current_scene.get_entities()
                 root_entities = [e for e in all_entities if not hasattr(e, "parent") or e.parent is None]
-            
-            # 递归添加实体
-            for entity in root_entities:
-                self._add_entity_to_tree(entity, None)
-            
-            # 展开第一级节点
-            self.tree_widget.expandToDepth(0)
-    
-    def _add_entity_to_tree(self, entity, parent_item):
-        """递归添加实体到树
         
-        Args:
-            entity: 实体对象
-            parent_item: 父树项
+        # 重建模型和展开节点时暂停绘制和选择信号，视图只重新布局和绘制一次
+        selection_model = self.tree_view.selectionModel()
+        self.tree_view.setUpdatesEnabled(False)
+        selection_model.blockSignals(True)
+        try:
+            # 重建模型
+            self.model.set_root_entities(root_entities)
             
-        Returns:
-            EntityTreeItem: 创建的树项
-        """
-        # 创建树项
-        item = EntityTreeItem(entity, parent_item if parent_item else self.tree_widget)
-        
-        # 保存实体到树项的映射
-        self.entity_items[entity.id if hasattr(entity, "id") else id(entity)] = item
-        
-        # 添加子实体
-        if hasattr(entity, "children"):
-            for child in entity.children:
-                self._add_entity_to_tree(child, item)
-        
-        return item
+            # 展开第一级节点
+            self.tree_view.expandToDepth(0)
+        finally:
+            selection_model.blockSignals(False)
+            self.tree_view.setUpdatesEnabled(True)
     
     def select_entity(self, entity_id):
         """选择指定实体
@@ -226,20 +596,31 @@ class HierarchyPanel(QWidget):
         Returns:
             bool: 是否成功选择
         """
-        if entity_id in self.entity_items:
-            item = self.entity_items[entity_id]
-            self.tree_widget.setCurrentItem(item)
+        # 有推迟的刷新时先重建，保证选择的是当前场景中的实体
+        if self._dirty:
+            self._do_refresh()
+        
+        node = self.model.entity_nodes.get(entity_id)
+        if node is not None:
+            self.tree_view.setCurrentIndex(self.model.node_index(node))
             return True
         return False
     
+    def _selected_indexes(self):
+        """获取当前选中的模型索引
+        
+        Returns:
+            list: 模型索引列表
+        """
+        return self.tree_view.selectionModel().selectedIndexes()
+    
     def get_selected_entities(self):
         """获取当前选中的实体列表
         
         Returns:
             list: 实体列表
         """
-        selected_items = self.tree_widget.selectedItems()
-        return [item.entity for item in selected_items]
+        return [self.model.entity(index) for index in self._selected_indexes()]
     
     def _on_selection_changed(self):
         """选择改变时的处理函数"""
@@ -248,15 +629,14 @@ class HierarchyPanel(QWidget):
         if selected_entities:
             self.entity_selected.emit(selected_entities[0] if len(selected_entities) == 1 else selected_entities)
     
-    def _on_item_double_clicked(self, item, column):
+    def _on_item_double_clicked(self, index):
         """项目双击事件处理
         
         Args:
-            item: 被双击的项目
-            column: 列号
+            index (QModelIndex): 被双击的项目索引
         """
         # 双击时可以重命名实体
-        self._rename_entity(item)
+        self._rename_entity(index)
     
     def _show_context_menu(self, position):
         """显示上下文菜单
@@ -267,27 +647,28 @@ class HierarchyPanel(QWidget):
         menu = QMenu()
         
         # 获取选中的项目
-        selected_items = self.tree_widget.selectedItems()
+        selected_indexes = self._selected_indexes()
         
-        if selected_items:
+        if selected_indexes:
             # 单选时的菜单项
-            if len(selected_items) == 1:
-                item = selected_items[0]
+            if len(selected_indexes) == 1:
+                index = selected_indexes[0]
+                entity = self.model.entity(index)
                 
                 # 添加子实体选项
                 add_child_action = QAction("添加子实体", self)
-                add_child_action.triggered.connect(lambda: self._add_child_entity(item))
+                add_child_action.triggered.connect(lambda: self._add_child_entity(index))
                 menu.addAction(add_child_action)
                 
                 # 重命名选项
                 rename_action = QAction("重命名", self)
-                rename_action.triggered.connect(lambda: self._rename_entity(item))
+                rename_action.triggered.connect(lambda: self._rename_entity(index))
                 menu.addAction(rename_action)
                 
                 # 激活/禁用选项
-                if hasattr(item.entity, "enabled"):
-                    toggle_action = QAction("禁用" if item.entity.enabled else "激活", self)
-                    toggle_action.triggered.connect(lambda: self._toggle_entity_state(item))
+                if hasattr(entity, "enabled"):
+                    toggle_action = QAction("禁用" if entity.enabled else "激活", self)
+                    toggle_action.triggered.connect(lambda: self._toggle_entity_state(index))
                     menu.addAction(toggle_action)
                 
                 # 添加分隔线
@@ -304,7 +685,7 @@ class HierarchyPanel(QWidget):
             menu.addAction(add_entity_action)
         
         if menu.actions():
-            menu.exec_(self.tree_widget.viewport().mapToGlobal(position))
+            menu.exec_(self.tree_view.viewport().mapToGlobal(position))
     
     def _add_entity(self):
         """添加根实体"""
@@ -318,45 +699,54 @@ class HierarchyPanel(QWidget):
                 # 创建实体
                 if hasattr(self.current_scene, "create_entity") and callable(self.current_scene.create_entity):
                     entity = self.current_scene.create_entity(name)
-                    # 刷新树
-                    self.refresh_tree()
+                    # 只添加新实体的节点，不重建整棵树
+                    self.model.insert_entity(entity)
+                    if self.model.is_fragmented():
+                        self.refresh_tree()
                     # 选择新创建的实体
-                    if entity.id in self.entity_items:
-                        self.tree_widget.setCurrentItem(self.entity_items[entity.id])
+                    self.select_entity(entity.id)
                     
                     # 发射场景变更信号
                     self.scene_changed.emit()
             except Exception as e:
                 QMessageBox.warning(self, "错误", f"无法创建实体: {str(e)}")
     
-    def _add_child_entity(self, parent_item):
+    def _add_child_entity(self, parent_index):
         """添加子实体
         
         Args:
-            parent_item: 父项目
+            parent_index (QModelIndex): 父项目索引
         """
-        if not self.current_scene or not parent_item or not hasattr(parent_item, "entity"):
+        parent_entity = self.model.entity(parent_index)
+        if not self.current_scene or parent_entity is None:
             return
             
         # 获取实体名称
         name, ok = QInputDialog.getText(self, "添加子实体", "请输入实体名称:", text="Child Entity")
         if ok and name:
             try:
-                parent_entity = parent_item.entity
-                
                 # 创建子实体
                 if hasattr(self.current_scene, "create_entity") and callable(self.current_scene.create_entity):
                     child_entity = self.current_scene.create_entity(name)
                     
                     # 设置父子关系
+                    parent_node = self.model.NONE
                     if hasattr(parent_entity, "add_child") and callable(parent_entity.add_child):
                         parent_entity.add_child(child_entity)
+                        parent_node = self.model.entity_nodes.get(entity_key(parent_entity))
+                        
+                        # 新实体创建时没有父实体，被加入了根实体列表，设置父实体后移出
+                        root_entities = getattr(self.current_scene, "root_entities", None)
+                        if root_entities is not None and child_entity in root_entities:
+                            root_entities.remove(child_entity)
                     
-                    # 刷新树
-                    self.refresh_tree()
+                    # 只添加新实体的节点，不重建整棵树
+                    if parent_node is None or self.model.is_fragmented():
+                        self.refresh_tree()
+                    else:
+                        self.model.insert_entity(child_entity, parent_node)
                     # 选择新创建的实体
-                    if child_entity.id in self.entity_items:
-                        self.tree_widget.setCurrentItem(self.entity_items[child_entity.id])
+                    self.select_entity(child_entity.id)
                     
                     # 发射场景变更信号
                     self.scene_changed.emit()
@@ -368,47 +758,61 @@ class HierarchyPanel(QWidget):
         if not self.current_scene:
             return
         
-        selected_items = self.tree_widget.selectedItems()
-        if not selected_items:
+        selected_entities = self.get_selected_entities()
+        if not selected_entities:
             return
         
         # 确认删除
-        message = f"确定要删除选中的 {len(selected_items)} 个实体吗？此操作不可撤销。"
+        message = f"确定要删除选中的 {len(selected_entities)} 个实体吗？此操作不可撤销。"
         response = QMessageBox.question(
             self, "确认删除", message, QMessageBox.Yes | QMessageBox.No
         )
         
         if response == QMessageBox.Yes:
             try:
-                # 先收集要删除的实体ID，避免在循环中修改
-                entity_ids = [item.entity_id for item in selected_items]
-                
-                for entity_id in entity_ids:
-                    # 从场景中删除实体
-                    if hasattr(self.current_scene, "remove_entity") and callable(self.current_scene.remove_entity):
-                        entity = self.current_scene.get_entity(entity_id)
-                        if entity:
-                            self.current_scene.remove_entity(entity)
+                scene = self.current_scene
+                if callable(getattr(scene, "remove_entities", None)) or callable(getattr(scene, "remove_entity", None)):
+                    # 选中的实体直接来自模型，无需再按ID到场景中查找
+                    for entity in selected_entities:
+                        # 从父实体中移除，否则父实体的子实体列表仍然引用它
+                        parent = getattr(entity, "parent", None)
+                        if parent is not None and callable(getattr(parent, "remove_child", None)):
+                            parent.remove_child(entity)
+                    
+                    # 从场景中删除实体，支持批量删除时根实体列表和组件版本只更新一次
+                    if callable(getattr(scene, "remove_entities", None)):
+                        scene.remove_entities(selected_entities)
+                    else:
+                        for entity in selected_entities:
+                            scene.remove_entity(entity)
+                    
+                    # 只移除对应的节点，已随祖先节点移除的节点不再处理
+                    for entity in selected_entities:
+                        node = self.model.entity_nodes.get(entity_key(entity))
+                        if node is not None:
+                            self.model.remove_node(node)
                 
-                # 刷新树
-                self.refresh_tree()
+                if self.model.is_fragmented():
+                    self.refresh_tree()
                 
                 # 发射场景变更信号
                 self.scene_changed.emit()
             except Exception as e:
                 QMessageBox.warning(self, "删除错误", f"无法删除实体: {str(e)}")
     
-    def _rename_entity(self, item):
+    def _rename_entity(self, index):
         """重命名实体
         
         Args:
-            item: 要重命名的项目
+            index (QModelIndex): 要重命名的项目索引
         """
-        if not item or not hasattr(item, "entity"):
+        entity = self.model.entity(index)
+        if entity is None:
             return
             
         # 获取新名称
-        old_name = item.entity_name
+        node = index.internalId()
+        old_name = self.model.names[node]
         new_name, ok = QInputDialog.getText(
             self, "重命名实体", "请输入新名称:", text=old_name
         )
@@ -416,42 +820,33 @@ class HierarchyPanel(QWidget):
         if ok and new_name and new_name != old_name:
             try:
                 # 设置实体名称
-                item.entity.name = new_name
+                entity.name = new_name
                 # 更新树项目文本
-                item.setText(0, new_name)
-                item.entity_name = new_name
+                self.model.set_name(node, new_name)
                 
                 # 发射场景变更信号
                 self.scene_changed.emit()
             except Exception as e:
                 QMessageBox.warning(self, "重命名错误", f"无法重命名实体: {str(e)}")
     
-    def _toggle_entity_state(self, item):
+    def _toggle_entity_state(self, index):
         """切换实体激活状态
         
         Args:
-            item: 实体项目
+            index (QModelIndex): 实体项目索引
         """
-        if not item or not hasattr(item, "entity") or not hasattr(item.entity, "enabled"):
+        entity = self.model.entity(index)
+        if entity is None or not hasattr(entity, "enabled"):
             return
             
         try:
             # 切换状态
-            item.entity.enabled = not item.entity.enabled
+            entity.enabled = not entity.enabled
             
-            # 更新样式
-            if not item.entity.enabled:
-                item.setForeground(0, QBrush(QColor(150, 150, 150)))
-                font = item.font(0)
-                font.setItalic(True)
-                item.setFont(0, font)
-            else:
-                item.setForeground(0, QBrush(QColor(0, 0, 0)))
-                font = item.font(0)
-                font.setItalic(False)
-                item.setFont(0, font)
+            # 更新样式，样式由模型根据实体状态提供
+            self.model.refresh_style(index.internalId())
             
             # 发射场景变更信号
             self.scene_changed.emit()
         except Exception as e:
-            QMessageBox.warning(self, "错误", f"无法切换实体状态: {str(e)}")
\ No newline at end of file
+            QMessageBox.warning(self, "错误", f"无法切换实体状态: {str(e)}")
@@ -13,6 +13,7 @@ from OpenGL.GL import *
 from OpenGL.GLU import *
 import numpy as np
 import math
+import ctypes
 
 
 class ScenePanel(QWidget):
@@ -51,6 +52,9 @@ class ScenePanel(QWidget):
 class SceneGLWidget(QOpenGLWidget):
     """场景OpenGL窗口部件"""
     
+    # 立方体六个面的光照系数，按create_cube中面的顺序排列
+    CUBE_FACE_LIGHTING = (0.7, 0.85, 1.0, 0.7, 0.85, 1.0)
+    
     def __init__(self):
         """初始化OpenGL窗口部件"""
         super().__init__()
@@ -66,6 +70,10 @@ class SceneGLWidget(QOpenGLWidget):
         self.camera_front = QVector3D(0.0, 0.0, -1.0)
         self.camera_up = QVector3D(0.0, 1.0, 0.0)
         
+        # 相机右方向缓存，只在前方向或上方向变化时重新计算
+        self._right_cache = None
+        self._right_key = None
+        
         # 相机旋转角度
         self.yaw = -90.0  # 水平旋转角度
         self.pitch = 0.0  # 垂直旋转角度
@@ -94,6 +102,9 @@ class SceneGLWidget(QOpenGLWidget):
             Qt.Key_Shift: False  # 加速键
         }
         
+        # 场景是否需要重绘，定时器只在相机移动或状态变化后请求重绘
+        self._scene_dirty = True
+        
         # 创建定时器，用于更新场景
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_scene)
@@ -101,7 +112,15 @@ class SceneGLWidget(QOpenGLWidget):
         
         # 网格数据
         self.grid_vertices = self.create_grid(20, 1.0)
+        self.grid_vertex_count = len(self.grid_vertices) // 3
+        self.grid_vbo = None  # 网格顶点缓冲，在initializeGL中创建
         self.cube_vertices = self.create_cube()
+        self.cube_vbo = None  # 单位立方体顶点缓冲，用于绘制选中轮廓
+        
+        # 所有立方体合并后的位置和颜色顶点缓冲，立方体数据变化时才重新上传
+        self.cube_batch_vbo = None
+        self.cube_batch_key = None
+        self.cube_batch_count = 0
         
         # 地面颜色
         self.ground_color = (0.3, 0.3, 0.35)  # 稍微带蓝色的灰色
@@ -161,6 +180,10 @@ class SceneGLWidget(QOpenGLWidget):
         """更新FPS计数器"""
         self.fps = self.frame_count
         self.frame_count = 0
+        
+        # 统计信息中的FPS需要重绘才能更新
+        if self.show_stats:
+            self.mark_dirty()
     
     def create_grid(self, size, step):
         """创建网格顶点数据
@@ -170,26 +193,26 @@ class SceneGLWidget(QOpenGLWidget):
             step (float): 网格步长
             
         Returns:
-            list: 网格顶点数据
+            np.ndarray: 网格顶点数据
         """
-        vertices = []
+        offsets = np.arange(-size, size + 1, dtype=np.float32) * step
         half_size = size * step / 2
+        count = len(offsets)
+        
+        # 每条线两个顶点，先是水平线再是垂直线，y坐标都为0
+        vertices = np.zeros((2, count, 2, 3), dtype=np.float32)
         
         # 创建水平线
-        for i in range(-size, size + 1):
-            vertices.extend([
-                -half_size, 0.0, i * step,
-                half_size, 0.0, i * step
-            ])
+        vertices[0, :, 0, 0] = -half_size
+        vertices[0, :, 1, 0] = half_size
+        vertices[0, :, :, 2] = offsets[:, None]
         
         # 创建垂直线
-        for i in range(-size, size + 1):
-            vertices.extend([
-                i * step, 0.0, -half_size,
-                i * step, 0.0, half_size
-            ])
+        vertices[1, :, :, 0] = offsets[:, None]
+        vertices[1, :, 0, 2] = -half_size
+        vertices[1, :, 1, 2] = half_size
         
-        return np.array(vertices, dtype=np.float32)
+        return vertices.ravel()
     
     def create_cube(self):
         """创建立方体顶点数据
@@ -265,6 +288,21 @@ class SceneGLWidget(QOpenGLWidget):
         # 启用多重采样
         glEnable(GL_MULTISAMPLE)
         
+        # 网格顶点不会变化，一次上传到顶点缓冲，绘制时无需逐个提交顶点
+        self.grid_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.grid_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self.grid_vertices.nbytes, self.grid_vertices, GL_STATIC_DRAW)
+        
+        # 单位立方体顶点同样只上传一次
+        self.cube_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.cube_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self.cube_vertices.nbytes, self.cube_vertices, GL_STATIC_DRAW)
+        
+        # 立方体批次缓冲在第一次绘制时填充
+        self.cube_batch_vbo = glGenBuffers(1)
+        self.cube_batch_key = None
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
         # 标记OpenGL已初始化
         self.gl_initialized = True
     
@@ -316,11 +354,7 @@ class SceneGLWidget(QOpenGLWidget):
             self.draw_axes(view, projection)
         
         # 绘制立方体
-        for i, cube in enumerate(self.cubes):
-            position = cube["position"]
-            color = cube["color"]
-            is_selected = (i == self.selected_cube)
-            self.draw_cube(position, color, view, projection, is_selected)
+        self.draw_cubes(view, projection)
         
         # 在世界视窗模式下绘制准星
         if self.world_view_mode:
@@ -387,17 +421,15 @@ class SceneGLWidget(QOpenGLWidget):
         glColor4f(self.ground_color[0], self.ground_color[1], self.ground_color[2], 0.3)
         
         try:
-            # 绘制网格
-            glBegin(GL_LINES)
+            # 绘制网格，整个顶点缓冲一次绘制
+            glBindBuffer(GL_ARRAY_BUFFER, self.grid_vbo)
+            glEnableClientState(GL_VERTEX_ARRAY)
             try:
-                for i in range(0, len(self.grid_vertices), 3):
-                    glVertex3f(
-                        self.grid_vertices[i],
-                        self.grid_vertices[i + 1],
-                        self.grid_vertices[i + 2]
-                    )
+                glVertexPointer(3, GL_FLOAT, 0, None)
+                glDrawArrays(GL_LINES, 0, self.grid_vertex_count)
             finally:
-                glEnd()
+                glDisableClientState(GL_VERTEX_ARRAY)
+                glBindBuffer(GL_ARRAY_BUFFER, 0)
             
             # 绘制主网格线（坐标轴上的线更粗更亮）
             glLineWidth(1.5)
@@ -466,91 +498,89 @@ class SceneGLWidget(QOpenGLWidget):
         self.renderText(0.0, self.axis_length+0.05, 0.0, "Y", self.y_axis_color)
         self.renderText(0.0, 0.0, self.axis_length+0.05, "Z", self.z_axis_color)
     
-    def draw_cube(self, position, color, view, projection, selected=False):
-        """绘制立方体
+    def update_cube_batch(self):
+        """立方体位置或颜色变化时重新生成合并的顶点缓冲"""
+        key = tuple((cube["position"], cube["color"]) for cube in self.cubes)
+        if key == self.cube_batch_key:
+            return
+        
+        count = len(self.cubes)
+        vertices = self.cube_vertices.reshape(-1, 3)
+        positions = np.array([cube["position"] for cube in self.cubes], dtype=np.float32).reshape(count, 3)
+        colors = np.array([cube["color"] for cube in self.cubes], dtype=np.float32).reshape(count, 3)
+        # 每个面4个顶点使用同一个光照系数
+        lighting = np.repeat(np.array(self.CUBE_FACE_LIGHTING, dtype=np.float32), 4)
+        
+        # 顶点格式为交错的位置(3)和颜色(3)，位置已平移到世界空间
+        data = np.empty((count, len(vertices), 6), dtype=np.float32)
+        data[:, :, :3] = vertices[None, :, :] + positions[:, None, :]
+        data[:, :, 3:] = colors[:, None, :] * lighting[None, :, None]
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.cube_batch_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        self.cube_batch_key = key
+        self.cube_batch_count = count * len(vertices)
+    
+    def draw_cubes(self, view, projection):
+        """一次绘制所有立方体，并为选中的立方体绘制轮廓
         
         Args:
-            position (tuple): 位置
-            color (tuple): 颜色
             view (QMatrix4x4): 视图矩阵
             projection (QMatrix4x4): 投影矩阵
-            selected (bool): 是否选中
         """
-        # 设置模型矩阵
-        model = QMatrix4x4()
-        model.translate(position[0], position[1], position[2])
-        
-        # 如果选中，增加轮廓效果
-        if selected:
-            # 稍微放大立方体以创建轮廓
-            outline_model = QMatrix4x4()
-            outline_model.translate(position[0], position[1], position[2])
-            outline_model.scale(1.05, 1.05, 1.05)  # 放大5%
-            
-            # 绘制黑色轮廓
-            glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-            glLineWidth(2.0)
-            glColor3f(1.0, 1.0, 0.0)  # 黄色轮廓
+        try:
+            self.update_cube_batch()
             
-            self.draw_cube_faces(outline_model)
+            if self.cube_batch_count:
+                stride = 6 * 4  # 每个顶点6个float
+                glBindBuffer(GL_ARRAY_BUFFER, self.cube_batch_vbo)
+                glEnableClientState(GL_VERTEX_ARRAY)
+                glEnableClientState(GL_COLOR_ARRAY)
+                try:
+                    glVertexPointer(3, GL_FLOAT, stride, None)
+                    glColorPointer(3, GL_FLOAT, stride, ctypes.c_void_p(3 * 4))
+                    glDrawArrays(GL_QUADS, 0, self.cube_batch_count)
+                finally:
+                    glDisableClientState(GL_COLOR_ARRAY)
+                    glDisableClientState(GL_VERTEX_ARRAY)
+                    glBindBuffer(GL_ARRAY_BUFFER, 0)
             
-            # 恢复填充模式
-            glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-        
-        # 设置MVP矩阵
-        mvp = projection * view * model
-        
-        # 设置颜色
-        glColor3f(*color)
-        
-        # 绘制立方体面
-        self.draw_cube_faces(model)
+            # 如果选中，增加轮廓效果
+            if 0 <= self.selected_cube < len(self.cubes):
+                self.draw_cube_outline(self.cubes[self.selected_cube]["position"])
+        except OpenGL.error.GLError as e:
+            print(f"绘制立方体时出错: {e}")
     
-    def draw_cube_faces(self, model):
-        """绘制立方体面
+    def draw_cube_outline(self, position):
+        """绘制立方体的选中轮廓
         
         Args:
-            model (QMatrix4x4): 模型矩阵
+            position (tuple): 立方体位置
         """
+        # 稍微放大立方体以创建轮廓
+        glPushMatrix()
+        glTranslatef(position[0], position[1], position[2])
+        glScalef(1.05, 1.05, 1.05)  # 放大5%
+        
+        # 绘制黄色轮廓
+        glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
+        glLineWidth(2.0)
+        glColor3f(1.0, 1.0, 0.0)
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.cube_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
         try:
-            glBegin(GL_QUADS)
-            try:
-                for i in range(0, len(self.cube_vertices), 3):
-                    if i % 12 == 0:
-                        # 每个面的第一个顶点，设置面的颜色
-                        face_index = i // 12
-                        # 根据面的法线方向计算光照效果
-                        lighting = 0.7 + 0.3 * (face_index % 3) / 2.0
-                        
-                        # 获取当前颜色
-                        current_color = glGetFloatv(GL_CURRENT_COLOR)
-                        # 调整颜色以反映光照
-                        adjusted_color = (
-                            current_color[0] * lighting,
-                            current_color[1] * lighting,
-                            current_color[2] * lighting
-                        )
-                        glColor3f(*adjusted_color)
-                    
-                    # 获取顶点位置
-                    vertex = QVector3D(
-                        self.cube_vertices[i],
-                        self.cube_vertices[i + 1],
-                        self.cube_vertices[i + 2]
-                    )
-                    # 应用模型变换
-                    transformed = model.map(vertex)
-                    # 设置顶点
-                    glVertex3f(transformed.x(), transformed.y(), transformed.z())
-            finally:
-                glEnd()  # 确保在finally块中调用glEnd
-        except OpenGL.error.GLError as e:
-            print(f"OpenGL错误: {e}")
-            # 如果发生错误，尝试结束当前的图元绘制
-            try:
-                glEnd()
-            except:
-                pass
+            glVertexPointer(3, GL_FLOAT, 0, None)
+            glDrawArrays(GL_QUADS, 0, len(self.cube_vertices) // 3)
+        finally:
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            
+            # 恢复填充模式
+            glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
+            glPopMatrix()
     
     def renderText(self, x, y, z, text, color=(1.0, 1.0, 1.0)):
         """使用QPainter在3D空间渲染文本
@@ -627,16 +657,43 @@ class SceneGLWidget(QOpenGLWidget):
         # 结束绘制
         painter.end()
     
+    def mark_dirty(self):
+        """标记场景需要重绘，场景数据在外部修改后调用"""
+        self._scene_dirty = True
+    
     def update_scene(self):
         """更新场景"""
-        # 处理键盘输入
-        self.process_input()
+        # 处理键盘输入，相机没有移动且状态没有变化时不重绘
+        if self.process_input() or self._scene_dirty:
+            self._scene_dirty = False
+            
+            # 更新视图
+            self.update()
+    
+    def get_camera_right(self):
+        """获取相机的右方向
         
-        # 更新视图
-        self.update()
+        Returns:
+            QVector3D: 归一化的右方向向量
+        """
+        key = self._right_key
+        if key is None or key[0] != self.camera_front or key[1] != self.camera_up:
+            right = QVector3D.crossProduct(self.camera_front, self.camera_up)
+            right.normalize()
+            self._right_cache = right
+            # 保存副本，避免原向量被原地修改后缓存失效却检测不到
+            self._right_key = (QVector3D(self.camera_front), QVector3D(self.camera_up))
+        return self._right_cache
     
     def process_input(self):
-        """处理键盘输入"""
+        """处理键盘输入
+        
+        Returns:
+            bool: 相机位置是否发生变化
+        """
+        # 相机位置会被原地修改，保存副本用于比较
+        old_pos = QVector3D(self.camera_pos)
+        
         # 确定移动速度 (按住Shift加速)
         speed = self.move_speed * (3.0 if self.keys[Qt.Key_Shift] else 1.0)
         
@@ -647,8 +704,7 @@ class SceneGLWidget(QOpenGLWidget):
             forward.normalize()
             
             # 计算右方向
-            right = QVector3D.crossProduct(self.camera_front, self.camera_up)
-            right.normalize()
+            right = self.get_camera_right()
             
             # 计算新位置
             new_pos = QVector3D(self.camera_pos)
@@ -706,19 +762,17 @@ class SceneGLWidget(QOpenGLWidget):
             
             # 左右移动
             if self.keys[Qt.Key_A]:
-                right = QVector3D.crossProduct(self.camera_front, self.camera_up)
-                right.normalize()
-                self.camera_pos -= right * speed
+                self.camera_pos -= self.get_camera_right() * speed
             if self.keys[Qt.Key_D]:
-                right = QVector3D.crossProduct(self.camera_front, self.camera_up)
-                right.normalize()
-                self.camera_pos += right * speed
+                self.camera_pos += self.get_camera_right() * speed
             
             # 上下移动
             if self.keys[Qt.Key_Space]:
                 self.camera_pos += self.camera_up * speed
             if self.keys[Qt.Key_Control]:
                 self.camera_pos -= self.camera_up * speed
+        
+        return self.camera_pos != old_pos
     
     def check_collision(self, position):
         """检查位置是否与立方体碰撞
@@ -782,6 +836,8 @@ class SceneGLWidget(QOpenGLWidget):
             else:
                 # 在世界视窗模式下，右键可以用于交互
                 self.try_interact_with_object()
+        
+        self.mark_dirty()
     
     def try_select_object(self, x, y):
         """尝试选择物体
@@ -1113,6 +1169,7 @@ class SceneGLWidget(QOpenGLWidget):
             # 将鼠标重置到屏幕中心
             cursor = QCursor()
             cursor.setPos(self.mapToGlobal(QPoint(center_x, center_y)))
+            self.mark_dirty()
             
         elif self.mouse_pressed:
             # 编辑器模式下的鼠标移动处理
@@ -1146,6 +1203,7 @@ class SceneGLWidget(QOpenGLWidget):
             front.setZ(math.sin(math.radians(self.yaw)) * math.cos(math.radians(self.pitch)))
             front.normalize()
             self.camera_front = front
+            self.mark_dirty()
     
     def wheelEvent(self, event):
         """鼠标滚轮事件
@@ -1195,6 +1253,8 @@ class SceneGLWidget(QOpenGLWidget):
                 print("重力已启用")
             else:
                 print("重力已禁用")
+        
+        self.mark_dirty()
     
     def keyReleaseEvent(self, event):
         """键盘释放事件
@@ -11,7 +11,7 @@ import logging
 import traceback
 from PyQt5.QtWidgets import QApplication, QSplashScreen
 from PyQt5.QtGui import QPixmap, QImage, QPainter, QLinearGradient, QColor, QFont, QPen
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QLine
 
 # 配置日志记录
 logging.basicConfig(
@@ -62,13 +62,10 @@ def create_splash_image():
     pen.setWidth(1)
     painter.setPen(pen)
     
-    # 绘制水平线
-    for y in range(0, height, 20):
-        painter.drawLine(0, y, width, y)
-    
-    # 绘制垂直线
-    for x in range(0, width, 20):
-        painter.drawLine(x, 0, x, height)
+    # 水平线和垂直线一次提交给绘制器
+    grid_lines = [QLine(0, y, width, y) for y in range(0, height, 20)]
+    grid_lines += [QLine(x, 0, x, height) for x in range(0, width, 20)]
+    painter.drawLines(grid_lines)
     
     # 添加装饰性几何图形 - 左上角光效
     radial_gradient = QLinearGradient(0, 0, 150, 150)
@@ -131,6 +128,7 @@ def parse_arguments():
     parser.add_argument('--project', type=str, help='要打开的项目路径')
     parser.add_argument('--scene', type=str, help='要加载的场景文件路径')
     parser.add_argument('--debug', action='store_true', help='启用调试模式')
+    parser.add_argument('--no-splash', action='store_true', help='不显示启动画面和加载进度')
     parser.add_argument('--fullscreen', action='store_true', help='全屏模式')
     parser.add_argument('--resolution', type=str, default='1280x720', help='分辨率，格式为 宽x高')
     return parser.parse_args()
@@ -145,23 +143,25 @@ def main():
         app = QApplication(sys.argv)
         logger.info("QApplication 已创建")
         
-        # 显示启动画面
-        splash_pixmap = create_splash_image()
-        splash = QSplashScreen(splash_pixmap, Qt.WindowStaysOnTopHint)
-        splash.setFont(QFont("Arial", 10))
-        splash.show()
-        splash.showMessage(
-            "初始化编辑器环境...", 
-            Qt.AlignBottom | Qt.AlignHCenter, 
-            Qt.white
-        )
-        app.processEvents()
-        logger.info("启动画面已显示")
-        
         # 解析命令行参数
         args = parse_arguments()
         logger.info(f"命令行参数: {args}")
         
+        # 显示启动画面
+        splash = None
+        if not args.no_splash:
+            splash_pixmap = create_splash_image()
+            splash = QSplashScreen(splash_pixmap, Qt.WindowStaysOnTopHint)
+            splash.setFont(QFont("Arial", 10))
+            splash.show()
+            splash.showMessage(
+                "初始化编辑器环境...", 
+                Qt.AlignBottom | Qt.AlignHCenter, 
+                Qt.white
+            )
+            app.processEvents()
+            logger.info("启动画面已显示")
+        
         # 解析分辨率
         try:
             width, height = map(int, args.resolution.split('x'))
@@ -170,17 +170,13 @@ def main():
             logger.warning(f"无效的分辨率格式 '{args.resolution}'，使用默认值 1280x720")
         
         # 显示加载消息
-        splash.showMessage(
-            "加载编辑器组件...", 
-            Qt.AlignBottom | Qt.AlignHCenter, 
-            Qt.white
-        )
-        app.processEvents()
-        
-        # 延迟一段时间以显示启动画面
-        timer = QTimer()
-        timer.singleShot(1500, lambda: None)
-        app.processEvents()
+        if splash:
+            splash.showMessage(
+                "加载编辑器组件...", 
+                Qt.AlignBottom | Qt.AlignHCenter, 
+                Qt.white
+            )
+            app.processEvents()
         
         try:
             # 创建编辑器应用程序实例
@@ -188,34 +184,38 @@ def main():
             editor_app = EditorApp(
                 width=width,
                 height=height,
-                debug=args.debug
+                debug=args.debug,
+                show_splash=not args.no_splash
             )
             logger.info("编辑器应用程序实例已创建")
             
             # 如果指定了项目，打开项目
             if args.project:
-                splash.showMessage(
-                    f"正在打开项目: {os.path.basename(args.project)}...", 
-                    Qt.AlignBottom | Qt.AlignHCenter, 
-                    Qt.white
-                )
-                app.processEvents()
+                if splash:
+                    splash.showMessage(
+                        f"正在打开项目: {os.path.basename(args.project)}...", 
+                        Qt.AlignBottom | Qt.AlignHCenter, 
+                        Qt.white
+                    )
+                    app.processEvents()
                 editor_app.open_project(args.project)
                 logger.info(f"已打开项目: {args.project}")
             
             # 如果指定了场景，加载场景
             if args.scene:
-                splash.showMessage(
-                    f"正在加载场景: {os.path.basename(args.scene)}...", 
-                    Qt.AlignBottom | Qt.AlignHCenter, 
-                    Qt.white
-                )
-                app.processEvents()
+                if splash:
+                    splash.showMessage(
+                        f"正在加载场景: {os.path.basename(args.scene)}...", 
+                        Qt.AlignBottom | Qt.AlignHCenter, 
+                        Qt.white
+                    )
+                    app.processEvents()
                 editor_app.load_scene(args.scene)
                 logger.info(f"已加载场景: {args.scene}")
             
             # 关闭启动画面，显示主窗口
-            splash.finish(editor_app.main_window)
+            if splash:
+                splash.finish(editor_app.main_window)
             logger.info("编辑器启动完成，显示主窗口")
             
             # 运行编辑器
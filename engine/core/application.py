@@ -14,12 +14,31 @@ from engine.physics.physics_system import PhysicsSystem
 from engine.input.input_system import InputSystem
 from engine.scripting.script_system import ScriptSystem
 from engine.ui.ui_system import UISystem
+from engine.ui.components.ui_component import UIKind
+from engine.core.debug import DEBUG
 
 
 class Application:
     """应用程序类，作为引擎的入口点"""
     
-    def __init__(self, width=1280, height=720, title="PyCraft Engine", fullscreen=False, debug=False):
+    FPS_SAMPLE_FRAMES = 15  # 每隔多少帧更新一次FPS
+    FPS_TEXTS = [f"FPS: {i}" for i in range(1000)]  # 常见FPS值的预生成文本
+    PACING_SAFETY_NS = 500_000  # 帧节奏控制在截止时间前预留的安全余量
+    PACING_SPIN_NS = 2_000_000  # 帧节奏控制在截止时间前改为让步轮询的时长
+    
+    # 高频且引擎不处理的事件类型，在SDL层过滤，不进入Python；
+    # 其余事件（窗口、设备热插拔、自定义事件等）照常进入事件队列供游戏使用。
+    # 部分类型在较早的pygame 2版本中不存在，按名称查找
+    BLOCKED_EVENTS = [
+        getattr(pygame, name) for name in (
+            "FINGERMOTION", "FINGERDOWN", "FINGERUP", "MULTIGESTURE", "TEXTEDITING",
+            "JOYBALLMOTION", "CONTROLLERAXISMOTION", "CONTROLLERSENSORUPDATE",
+            "CONTROLLERTOUCHPADMOTION", "CONTROLLERTOUCHPADDOWN", "CONTROLLERTOUCHPADUP",
+        )
+        if hasattr(pygame, name)
+    ]
+    
+    def __init__(self, width=1280, height=720, title="PyCraft Engine", fullscreen=False, debug=False, vsync=False):
         """
         初始化应用程序
         
@@ -29,12 +48,14 @@ class Application:
             title (str): 窗口标题
             fullscreen (bool): 是否全屏
             debug (bool): 是否启用调试模式
+            vsync (bool): 是否启用垂直同步，启用后由缓冲区交换控制帧节奏
         """
         self.width = width
         self.height = height
         self.title = title
         self.fullscreen = fullscreen
         self.debug = debug
+        self.vsync = vsync
         self.running = False
         self.paused = False
         self.target_fps = 60
@@ -43,6 +64,12 @@ class Application:
         self.elapsed_time = 0.0
         self.frame_count = 0
         self.fps = 0
+        self._fps_ema = float(self.target_fps)  # FPS的指数移动平均
+        self._last_frame_ns = time.perf_counter_ns()  # 上一帧的时间戳
+        self._fps_sample_start_ns = self._last_frame_ns  # FPS采样区间的起始时间戳
+        self._fps_sample_frames = 0  # FPS采样区间内的帧数
+        self._caption_fps = None  # 窗口标题中当前显示的FPS
+        self._next_present_ns = self._last_frame_ns  # 下一帧的呈现截止时间
         self.window = None
         self.clock = None
         
@@ -54,6 +81,10 @@ class Application:
         self.script_system = ScriptSystem()
         self.ui_system = UISystem()
         
+        # 缓存事件处理的绑定方法，避免每个事件重复查找属性
+        self._input_process_event = self.input_system.process_event
+        self._ui_process_event = self.ui_system.process_event
+        
         # 初始化标志
         self.initialized = False
         
@@ -85,7 +116,7 @@ class Application:
             flags |= pygame.FULLSCREEN
         
         try:
-            self.window = pygame.display.set_mode((self.width, self.height), flags)
+            self.window = self._create_window(flags)
             pygame.display.set_caption(self.title)
         except pygame.error as e:
             print(f"创建窗口失败: {e}")
@@ -93,9 +124,10 @@ class Application:
             pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLEBUFFERS, 0)
             pygame.display.gl_set_attribute(pygame.GL_MULTISAMPLESAMPLES, 0)
             try:
-                self.window = pygame.display.set_mode((self.width, self.height), flags)
+                self.window = self._create_window(flags)
                 pygame.display.set_caption(f"{self.title} (兼容模式)")
-                print("已切换到兼容模式")
+                if DEBUG:
+                    print("已切换到兼容模式")
             except pygame.error as e2:
                 print(f"创建兼容模式窗口失败: {e2}")
                 return False
@@ -103,6 +135,9 @@ class Application:
         # 创建时钟
         self.clock = pygame.time.Clock()
         
+        # 屏蔽引擎不处理的高频事件
+        pygame.event.set_blocked(self.BLOCKED_EVENTS)
+        
         # 初始化系统
         try:
             # 渲染系统必须在窗口创建后初始化
@@ -121,6 +156,25 @@ class Application:
         self.initialized = True
         return True
     
+    def _create_window(self, flags):
+        """
+        创建窗口，请求垂直同步失败时回退到无垂直同步
+        
+        Args:
+            flags (int): 窗口标志
+            
+        Returns:
+            pygame.Surface: 窗口表面
+        """
+        if self.vsync:
+            try:
+                return pygame.display.set_mode((self.width, self.height), flags, vsync=1)
+            except pygame.error as e:
+                print(f"启用垂直同步失败，改用帧节奏控制: {e}")
+                self.vsync = False
+        
+        return pygame.display.set_mode((self.width, self.height), flags)
+    
     def start(self):
         """启动应用程序但不进入主循环"""
         if not self.initialized and not self.initialize():
@@ -132,9 +186,7 @@ class Application:
         self.paused = False
         
         # 重置计时器
-        self.elapsed_time = 0.0
-        self.frame_count = 0
-        self.delta_time = 0.0
+        self._reset_timing()
         
         # 启动脚本系统
         scene = self.scene_manager.get_active_scene()
@@ -172,37 +224,9 @@ class Application:
             return
         
         # 主循环
-        while self.running:
-            # 处理事件
-            self._process_events()
-            
-            # 如果不再运行，退出循环
-            if not self.running:
-                break
-            
-            # 计算帧时间
-            self.delta_time = self.clock.tick(self.target_fps) / 1000.0
-            self.elapsed_time += self.delta_time
-            self.frame_count += 1
-            
-            # 计算FPS
-            if self.elapsed_time >= 1.0:
-                self.fps = self.frame_count
-                self.frame_count = 0
-                self.elapsed_time = 0.0
-                
-                # 更新窗口标题
-                pygame.display.set_caption(f"{self.title} - FPS: {self.fps}")
-            
-            # 更新
-            if not self.paused:
-                self._update()
-            
-            # 渲染
-            self._render()
-            
-            # 交换缓冲区
-            pygame.display.flip()
+        tick = self._tick
+        while tick():
+            pass
         
         # 清理
         self._cleanup()
@@ -213,9 +237,18 @@ class Application:
             print("初始化失败，无法运行")
             return False
         
+        return self._tick()
+    
+    def _tick(self):
+        """
+        执行一帧：事件、计时、更新、渲染和呈现
+        
+        Returns:
+            bool: 应用程序是否仍在运行
+        """
         if not self.running:
             return False
-            
+        
         # 处理事件
         self._process_events()
         
@@ -223,19 +256,8 @@ class Application:
         if not self.running:
             return False
         
-        # 计算帧时间
-        self.delta_time = self.clock.tick(self.target_fps) / 1000.0
-        self.elapsed_time += self.delta_time
-        self.frame_count += 1
-        
-        # 计算FPS
-        if self.elapsed_time >= 1.0:
-            self.fps = self.frame_count
-            self.frame_count = 0
-            self.elapsed_time = 0.0
-            
-            # 更新窗口标题
-            pygame.display.set_caption(f"{self.title} - FPS: {self.fps}")
+        # 计算帧时间和FPS
+        self._update_timing()
         
         # 更新
         if not self.paused:
@@ -244,14 +266,92 @@ class Application:
         # 渲染
         self._render()
         
-        # 交换缓冲区
+        # 等待到呈现时间后交换缓冲区
+        self._pace_frame()
         pygame.display.flip()
         
         return True
     
+    def _update_timing(self):
+        """用高精度计时器计算帧时间和平滑后的FPS"""
+        now_ns = time.perf_counter_ns()
+        self.delta_time = (now_ns - self._last_frame_ns) * 1e-9
+        self._last_frame_ns = now_ns
+        self.elapsed_time += self.delta_time
+        self.frame_count += 1
+        
+        # 每隔若干帧按采样区间的平均帧率更新一次指数移动平均
+        self._fps_sample_frames += 1
+        if self._fps_sample_frames >= self.FPS_SAMPLE_FRAMES:
+            sample_fps = self._fps_sample_frames * 1e9 / (now_ns - self._fps_sample_start_ns)
+            self._fps_ema = 0.9 * self._fps_ema + 0.1 * sample_fps
+            self._fps_sample_start_ns = now_ns
+            self._fps_sample_frames = 0
+            self.fps = int(self._fps_ema + 0.5)
+            
+            # 更新窗口标题
+            self._update_fps_caption()
+    
+    def _pace_frame(self):
+        """
+        在交换缓冲区前等待到本帧的呈现截止时间
+        
+        先休眠到截止时间前的最后几毫秒，再以让步轮询等待剩余时间，
+        比时钟的毫秒级休眠更稳定。启用垂直同步时由交换缓冲区阻塞，不额外等待；
+        目标帧率不大于0时表示不限帧率，同样直接返回。
+        """
+        if self.vsync or self.target_fps <= 0:
+            return
+        
+        frame_ns = 1_000_000_000 // self.target_fps
+        self._next_present_ns += frame_ns
+        deadline_ns = self._next_present_ns - self.PACING_SAFETY_NS
+        
+        remaining_ns = deadline_ns - time.perf_counter_ns()
+        if remaining_ns <= 0:
+            # 本帧已超时，从当前时间重新对齐节奏，避免连续追帧
+            self._next_present_ns = time.perf_counter_ns()
+            return
+        
+        if remaining_ns > self.PACING_SPIN_NS:
+            time.sleep((remaining_ns - self.PACING_SPIN_NS) * 1e-9)
+        
+        while time.perf_counter_ns() < deadline_ns:
+            time.sleep(0)
+    
+    def _reset_timing(self):
+        """重置计时器"""
+        now_ns = time.perf_counter_ns()
+        self.elapsed_time = 0.0
+        self.frame_count = 0
+        self.delta_time = 0.0
+        self._last_frame_ns = now_ns
+        self._fps_sample_start_ns = now_ns
+        self._fps_sample_frames = 0
+        self._next_present_ns = now_ns
+    
+    def _update_fps_caption(self):
+        """更新窗口标题和FPS标签中的FPS，数值未变化时不重复设置"""
+        if self.fps == self._caption_fps:
+            return
+        
+        self._caption_fps = self.fps
+        fps_text = self.FPS_TEXTS[self.fps] if self.fps < len(self.FPS_TEXTS) else f"FPS: {self.fps}"
+        pygame.display.set_caption(f"{self.title} - {fps_text}")
+        
+        # 更新活动画布中标记为FPS标签的控件
+        canvas = self.ui_system.active_canvas
+        if canvas is not None:
+            for label in canvas.get_widgets_by_kind(UIKind.FPS_LABEL):
+                label.set_text(fps_text)
+    
     def _process_events(self):
         """处理事件"""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if len(events) > 1:
+            events = self._coalesce_motion(events)
+        
+        for event in events:
             # 退出事件
             if event.type == pygame.QUIT:
                 self.running = False
@@ -279,10 +379,34 @@ class Application:
                     self.toggle_pause()
             
             # 处理输入系统事件
-            self.input_system.process_event(event)
+            self._input_process_event(event)
             
             # 处理UI系统事件
-            self.ui_system.process_event(event)
+            self._ui_process_event(event)
+    
+    def _coalesce_motion(self, events):
+        """
+        将连续的鼠标移动事件合并为一个，位置取最后一个，相对位移累加
+        
+        Args:
+            events (list): 事件列表
+            
+        Returns:
+            list: 合并后的事件列表
+        """
+        motion = pygame.MOUSEMOTION
+        coalesced = []
+        
+        for event in events:
+            if event.type == motion and coalesced and coalesced[-1].type == motion:
+                previous_rel = coalesced[-1].rel
+                attributes = dict(event.dict)
+                attributes["rel"] = (previous_rel[0] + event.rel[0], previous_rel[1] + event.rel[1])
+                coalesced[-1] = pygame.event.Event(motion, attributes)
+            else:
+                coalesced.append(event)
+        
+        return coalesced
     
     def _update(self):
         """更新"""
@@ -294,6 +418,7 @@ class Application:
         
         # 更新物理系统
         self.physics_system.update(self.delta_time)
+        self.physics_system.sync_transforms(self.scene_manager.active_scene)
         
         # 更新场景管理器
         self.scene_manager.update(self.delta_time)
@@ -307,6 +432,9 @@ class Application:
                 self.on_update_callback(self, self.delta_time)
             except Exception as e:
                 print(f"更新回调异常: {e}")
+        
+        # 记录本帧的绘制命令，渲染阶段只负责提交
+        self.render_system.record(self.scene_manager.active_scene)
     
     def _render(self):
         """渲染"""
@@ -364,10 +492,11 @@ class Application:
         self.paused = not self.paused
         
         # 更新窗口标题
+        self._caption_fps = None
         if self.paused:
             pygame.display.set_caption(f"{self.title} - 已暂停")
         else:
-            pygame.display.set_caption(f"{self.title} - FPS: {self.fps}")
+            self._update_fps_caption()
     
     def load_scene(self, path):
         """
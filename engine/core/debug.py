@@ -0,0 +1,7 @@
+"""
+调试开关，设置环境变量 PYCRAFT_DEBUG=1 时启用诊断输出
+"""
+
+import os
+
+DEBUG = os.environ.get("PYCRAFT_DEBUG") == "1"  # 是否输出诊断信息
@@ -6,6 +6,17 @@
 class Component:
     """组件基类，所有组件都应继承自此类"""
     
+    __slots__ = ("entity", "enabled")
+    
+    type_id = 0  # 组件类型ID，每个子类自动分配一个整数
+    _type_count = 1  # 已分配的组件类型数量
+    
+    def __init_subclass__(cls, **kwargs):
+        """为每个组件子类分配整数类型ID"""
+        super().__init_subclass__(**kwargs)
+        cls.type_id = Component._type_count
+        Component._type_count += 1
+    
     def __init__(self):
         """初始化组件"""
         self.entity = None  # 所属实体
@@ -0,0 +1,3 @@
+"""
+内置组件模块，提供引擎自带的组件
+"""
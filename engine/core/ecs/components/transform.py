@@ -0,0 +1,294 @@
+"""
+变换组件，描述实体的位置、旋转和缩放
+"""
+
+import numpy as np
+
+from engine.core.ecs.component import Component
+
+
+_IDENTITY = np.identity(4, dtype=np.float32)  # 单位矩阵
+
+
+class TransformStore:
+    """变换数据的SoA存储，所有变换组件的数据保存在连续数组中"""
+    
+    def __init__(self, capacity=256):
+        """
+        初始化变换存储
+        
+        Args:
+            capacity (int): 初始容量
+        """
+        self.capacity = capacity  # 容量
+        self.positions = np.zeros((capacity, 3), dtype=np.float32)  # 位置数组
+        self.rotations = np.zeros((capacity, 3), dtype=np.float32)  # 旋转数组，单位为度
+        self.scales = np.ones((capacity, 3), dtype=np.float32)  # 缩放数组
+        self.matrices = np.tile(_IDENTITY, (capacity, 1, 1))  # 模型矩阵数组
+        self.dirty = np.zeros(capacity, dtype=bool)  # 需要重新计算矩阵的行
+        self.count = 0  # 已分配的最大行数
+        self.free_rows = []  # 空闲行列表
+    
+    def allocate(self):
+        """
+        分配一行
+        
+        Returns:
+            int: 行索引
+        """
+        if self.free_rows:
+            return self.free_rows.pop()
+        
+        if self.count >= self.capacity:
+            self._grow()
+        
+        row = self.count
+        self.count += 1
+        return row
+    
+    def release(self, row):
+        """
+        释放一行
+        
+        Args:
+            row (int): 行索引
+        """
+        self.positions[row] = 0.0
+        self.rotations[row] = 0.0
+        self.scales[row] = 1.0
+        self.matrices[row] = _IDENTITY
+        self.dirty[row] = False
+        self.free_rows.append(row)
+    
+    def _grow(self):
+        """容量翻倍"""
+        capacity = self.capacity * 2
+        
+        positions = np.zeros((capacity, 3), dtype=np.float32)
+        rotations = np.zeros((capacity, 3), dtype=np.float32)
+        scales = np.ones((capacity, 3), dtype=np.float32)
+        matrices = np.tile(_IDENTITY, (capacity, 1, 1))
+        dirty = np.zeros(capacity, dtype=bool)
+        
+        positions[:self.capacity] = self.positions
+        rotations[:self.capacity] = self.rotations
+        scales[:self.capacity] = self.scales
+        matrices[:self.capacity] = self.matrices
+        dirty[:self.capacity] = self.dirty
+        
+        self.positions = positions
+        self.rotations = rotations
+        self.scales = scales
+        self.matrices = matrices
+        self.dirty = dirty
+        self.capacity = capacity
+    
+    def update_matrices(self):
+        """
+        批量重新计算所有脏行的模型矩阵
+        
+        矩阵按 平移 * 绕X旋转 * 绕Y旋转 * 绕Z旋转 * 缩放 的顺序组合，
+        与glTranslatef/glRotatef/glScalef的调用顺序一致。
+        """
+        dirty = self.dirty[:self.count]
+        
+        # 全部为脏行时使用连续切片，直接写入矩阵数组，省去收集和回写的拷贝
+        if dirty.all():
+            rows = slice(0, self.count)
+        else:
+            rows = np.flatnonzero(dirty)
+            if len(rows) == 0:
+                return
+        
+        radians = np.radians(self.rotations[rows])
+        cos = np.cos(radians)
+        sin = np.sin(radians)
+        cx, cy, cz = cos[:, 0], cos[:, 1], cos[:, 2]
+        sx, sy, sz = sin[:, 0], sin[:, 1], sin[:, 2]
+        
+        scales = self.scales[rows]
+        scale_x, scale_y, scale_z = scales[:, 0], scales[:, 1], scales[:, 2]
+        
+        # 旋转矩阵 Rx * Ry * Rz 乘以缩放，逐元素写入，不生成中间的3x3矩阵
+        matrices = self.matrices[rows]
+        sx_sy = sx * sy
+        cx_sy = cx * sy
+        matrices[:, 0, 0] = cy * cz * scale_x
+        matrices[:, 0, 1] = -cy * sz * scale_y
+        matrices[:, 0, 2] = sy * scale_z
+        matrices[:, 1, 0] = (sx_sy * cz + cx * sz) * scale_x
+        matrices[:, 1, 1] = (cx * cz - sx_sy * sz) * scale_y
+        matrices[:, 1, 2] = -sx * cy * scale_z
+        matrices[:, 2, 0] = (sx * sz - cx_sy * cz) * scale_x
+        matrices[:, 2, 1] = (cx_sy * sz + sx * cz) * scale_y
+        matrices[:, 2, 2] = cx * cy * scale_z
+        matrices[:, :3, 3] = self.positions[rows]
+        
+        # 花式索引得到的是副本，需要写回
+        if not isinstance(rows, slice):
+            self.matrices[rows] = matrices
+        
+        self.dirty[rows] = False
+
+
+def _snapshot(row):
+    """
+    复制存储中的一行并设为只读
+    
+    Args:
+        row (numpy.ndarray): 存储数组中的一行
+        
+    Returns:
+        numpy.ndarray: 只读副本，原地写入会抛出ValueError而不是被静默丢弃
+    """
+    snapshot = row.copy()
+    snapshot.flags.writeable = False
+    return snapshot
+
+
+class Transform(Component):
+    """
+    变换组件，数据存放在共享的TransformStore中
+    
+    位置、旋转、缩放和模型矩阵的访问器都返回只读副本：存储扩容时会替换数组，
+    视图会指向已废弃的数组，原地写入也不会标记脏行。修改需通过setter赋值，
+    或使用translate、rotate、set_scale；需要批量读写的系统按_row直接访问
+    TransformStore的数组，写入后标记dirty。
+    """
+    
+    __slots__ = ("_row",)
+    
+    store = TransformStore()  # 所有变换组件共享的存储
+    
+    def __init__(self, position=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1)):
+        """
+        初始化变换组件
+        
+        Args:
+            position (tuple): 位置，(x, y, z)
+            rotation (tuple): 旋转，(x, y, z)，单位为度
+            scale (tuple): 缩放，(x, y, z)
+        """
+        super().__init__()
+        self._row = Transform.store.allocate()  # 在存储中的行索引
+        self.position = position
+        self.rotation = rotation
+        self.scale = scale
+    
+    @property
+    def position(self):
+        """位置，返回只读副本，修改需通过setter赋值"""
+        return _snapshot(self.store.positions[self._row])
+    
+    @position.setter
+    def position(self, value):
+        self.store.positions[self._row] = value
+        self.store.dirty[self._row] = True
+    
+    @property
+    def rotation(self):
+        """旋转，返回只读副本，修改需通过setter赋值"""
+        return _snapshot(self.store.rotations[self._row])
+    
+    @rotation.setter
+    def rotation(self, value):
+        self.store.rotations[self._row] = value
+        self.store.dirty[self._row] = True
+    
+    @property
+    def scale(self):
+        """缩放，返回只读副本，修改需通过setter赋值"""
+        return _snapshot(self.store.scales[self._row])
+    
+    @scale.setter
+    def scale(self, value):
+        self.store.scales[self._row] = value
+        self.store.dirty[self._row] = True
+    
+    @property
+    def matrix(self):
+        """模型矩阵，返回只读副本，由TransformStore.update_matrices批量计算"""
+        return _snapshot(self.store.matrices[self._row])
+    
+    def mark_dirty(self):
+        """直接修改TransformStore中本行的数据后调用，标记矩阵需要重新计算"""
+        self.store.dirty[self._row] = True
+    
+    def translate(self, x, y, z):
+        """
+        平移
+        
+        Args:
+            x (float): X轴偏移
+            y (float): Y轴偏移
+            z (float): Z轴偏移
+        """
+        # 逐分量原地累加，避免创建临时数组
+        row = self.store.positions[self._row]
+        row[0] += x
+        row[1] += y
+        row[2] += z
+        self.store.dirty[self._row] = True
+    
+    def rotate(self, x, y, z):
+        """
+        旋转
+        
+        Args:
+            x (float): 绕X轴旋转角度
+            y (float): 绕Y轴旋转角度
+            z (float): 绕Z轴旋转角度
+        """
+        # 逐分量原地累加，避免创建临时数组
+        row = self.store.rotations[self._row]
+        row[0] += x
+        row[1] += y
+        row[2] += z
+        self.store.dirty[self._row] = True
+    
+    def set_scale(self, x, y, z):
+        """
+        设置缩放
+        
+        Args:
+            x (float): X轴缩放
+            y (float): Y轴缩放
+            z (float): Z轴缩放
+        """
+        row = self.store.scales[self._row]
+        row[0] = x
+        row[1] = y
+        row[2] = z
+        self.store.dirty[self._row] = True
+    
+    def serialize(self):
+        """
+        序列化组件
+        
+        Returns:
+            dict: 组件数据
+        """
+        return {
+            "position": self.position.tolist(),
+            "rotation": self.rotation.tolist(),
+            "scale": self.scale.tolist()
+        }
+    
+    def deserialize(self, data):
+        """
+        反序列化组件
+        
+        Args:
+            data (dict): 组件数据
+        """
+        self.position = data.get("position", (0, 0, 0))
+        self.rotation = data.get("rotation", (0, 0, 0))
+        self.scale = data.get("scale", (1, 1, 1))
+    
+    def __del__(self):
+        """释放存储中的行"""
+        try:
+            self.store.release(self._row)
+        except (AttributeError, TypeError):
+            # 解释器退出时存储可能已被回收
+            pass
@@ -8,14 +8,17 @@ import uuid
 class Entity:
     """实体类，代表游戏中的对象"""
     
-    def __init__(self, name="Entity"):
+    def __init__(self, name="Entity", entity_id=None):
         """
         初始化实体
         
         Args:
             name (str): 实体名称
+            entity_id (str): 实体ID，如果为None则生成新的唯一ID
         """
-        self.id = str(uuid.uuid4())  # 唯一ID
+        self.id = entity_id or str(uuid.uuid4())  # 唯一ID
+        self.index = -1  # 场景内的整数索引，由场景分配
+        self.generation = 0  # 索引的代数，用于检测已被回收的索引
         self.name = name  # 实体名称
         self.enabled = True  # 是否启用
         self.components = {}  # 组件字典，键为组件类型，值为组件实例
@@ -39,6 +42,10 @@ class Entity:
         self.components[component_type] = component
         component.entity = self
         
+        # 通知场景更新组件索引
+        if self.scene:
+            self.scene._on_component_added(self, component_type, component)
+        
         # 调用组件的添加方法
         if hasattr(component, "on_add"):
             component.on_add()
@@ -64,6 +71,11 @@ class Entity:
             
             component.entity = None
             del self.components[component_type]
+            
+            # 通知场景更新组件索引
+            if self.scene:
+                self.scene._on_component_removed(self, component_type)
+            
             return True
         
         return False
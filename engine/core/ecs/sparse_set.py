@@ -0,0 +1,129 @@
+"""
+稀疏集合，按整数实体索引存储组件
+"""
+
+import numpy as np
+
+
+class SparseSet:
+    """稀疏集合，提供O(1)的添加、移除和查找，以及紧凑的密集遍历"""
+
+    NONE = -1  # 稀疏数组中表示不存在的哨兵值
+
+    def __init__(self, capacity=64):
+        """
+        初始化稀疏集合
+
+        Args:
+            capacity (int): 稀疏数组的初始容量
+        """
+        self.sparse = np.full(capacity, self.NONE, dtype=np.int32)  # 实体索引 -> 密集索引
+        self.dense_ids = []  # 密集实体索引列表
+        self.dense_vals = []  # 与dense_ids并行的值列表
+
+    def _grow(self, index):
+        """
+        扩容稀疏数组，使其能容纳指定索引
+
+        Args:
+            index (int): 需要容纳的实体索引
+        """
+        capacity = len(self.sparse)
+        while capacity <= index:
+            capacity *= 2
+
+        sparse = np.full(capacity, self.NONE, dtype=np.int32)
+        sparse[:len(self.sparse)] = self.sparse
+        self.sparse = sparse
+
+    def add(self, index, value):
+        """
+        添加或替换值
+
+        Args:
+            index (int): 实体索引
+            value: 值
+        """
+        if index >= len(self.sparse):
+            self._grow(index)
+
+        dense_index = self.sparse[index]
+        if dense_index != self.NONE:
+            self.dense_vals[dense_index] = value
+            return
+
+        self.sparse[index] = len(self.dense_ids)
+        self.dense_ids.append(index)
+        self.dense_vals.append(value)
+
+    def remove(self, index):
+        """
+        移除值，将末尾元素交换到被移除的位置
+
+        Args:
+            index (int): 实体索引
+
+        Returns:
+            bool: 是否成功移除
+        """
+        if index >= len(self.sparse):
+            return False
+
+        dense_index = self.sparse[index]
+        if dense_index == self.NONE:
+            return False
+
+        last_id = self.dense_ids[-1]
+        last_val = self.dense_vals[-1]
+
+        # 用末尾元素覆盖被移除的元素
+        self.dense_ids[dense_index] = last_id
+        self.dense_vals[dense_index] = last_val
+        self.sparse[last_id] = dense_index
+
+        self.dense_ids.pop()
+        self.dense_vals.pop()
+        self.sparse[index] = self.NONE
+        return True
+
+    def get(self, index):
+        """
+        获取值
+
+        Args:
+            index (int): 实体索引
+
+        Returns:
+            值，如果不存在则返回None
+        """
+        if index >= len(self.sparse):
+            return None
+
+        dense_index = self.sparse[index]
+        return self.dense_vals[dense_index] if dense_index != self.NONE else None
+
+    def contains(self, index):
+        """
+        检查是否包含实体索引
+
+        Args:
+            index (int): 实体索引
+
+        Returns:
+            bool: 是否包含
+        """
+        return index < len(self.sparse) and self.sparse[index] != self.NONE
+
+    def clear(self):
+        """清空集合"""
+        self.sparse.fill(self.NONE)
+        self.dense_ids.clear()
+        self.dense_vals.clear()
+
+    def __len__(self):
+        """密集元素数量"""
+        return len(self.dense_ids)
+
+    def __contains__(self, index):
+        """支持in运算符"""
+        return self.contains(index)
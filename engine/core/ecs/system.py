@@ -6,11 +6,23 @@
 class System:
     """系统基类，所有系统都应继承自此类"""
     
+    schedule_version = 0  # 调度版本，任何系统启用状态变化时递增，场景据此重建更新调度
+    
     def __init__(self):
         """初始化系统"""
         self.priority = 0  # 系统优先级，数值越小优先级越高
         self.enabled = True  # 是否启用
     
+    @property
+    def enabled(self):
+        """是否启用"""
+        return self._enabled
+    
+    @enabled.setter
+    def enabled(self, value):
+        self._enabled = value
+        System.schedule_version += 1
+    
     def initialize(self):
         """初始化系统，在系统被添加到引擎时调用"""
         pass
@@ -6,7 +6,11 @@ import uuid
 import json
 import os
 
+import numpy as np
+
 from engine.core.ecs.entity import Entity
+from engine.core.ecs.sparse_set import SparseSet
+from engine.core.ecs.system import System
 
 
 class Scene:
@@ -23,9 +27,20 @@ class Scene:
         self.name = name  # 场景名称
         self.entities = {}  # 实体字典，键为实体ID，值为实体实例
         self.systems = []  # 系统列表
+        self._schedule = None  # 更新调度，已启用系统的update方法列表
+        self._schedule_version = -1  # 构建调度时的系统调度版本
         self.root_entities = []  # 根实体列表
         self.active = False  # 是否激活
         self.path = None  # 场景文件路径
+        self.component_sets = []  # 组件索引，按组件类型ID索引的稀疏集合列表
+        self._next_index = 0  # 下一个未使用过的实体索引
+        self._free_indices = []  # 可回收的实体索引
+        self._generations = np.zeros(64, dtype=np.uint32)  # 每个实体索引的代数，索引回收时递增
+        self._index_entities = []  # 实体索引 -> 实体
+        self.archetypes = {0: {}}  # 原型字典，键为组件类型位掩码，值为{实体索引: 实体}
+        self._index_masks = []  # 实体索引 -> 组件类型位掩码
+        self._component_versions = []  # 按组件类型ID索引的版本号，组件增删时递增
+        self._query_cache = {}  # 查询缓存，键为组件类型位掩码，值为(版本元组, 实体列表)
     
     def create_entity(self, name="Entity"):
         """
@@ -53,6 +68,15 @@ class Scene:
         """
         self.entities[entity.id] = entity
         entity.scene = self
+        entity.index = self._allocate_index()
+        entity.generation = int(self._generations[entity.index])
+        self._index_entities[entity.index] = entity
+        self._index_masks[entity.index] = 0
+        self.archetypes[0][entity.index] = entity
+        
+        # 登记实体已有的组件
+        for component_type, component in entity.components.items():
+            self._on_component_added(entity, component_type, component)
         
         # 如果没有父实体，添加到根实体列表
         if entity.parent is None:
@@ -75,14 +99,67 @@ class Scene:
             if entity in self.root_entities:
                 self.root_entities.remove(entity)
             
+            # 从组件索引中移除
+            for component_type in entity.components:
+                self._on_component_removed(entity, component_type)
+            
+            # 从原型中移除
+            self._set_archetype(entity, None)
+            
             # 从实体字典中移除
             del self.entities[entity.id]
             entity.scene = None
+            self._release_index(entity.index)
+            entity.index = -1
             
             return True
         
         return False
     
+    def remove_entities(self, entities):
+        """
+        批量移除实体，每个组件类型的版本和根实体列表只更新一次
+        
+        Args:
+            entities: 实体的可迭代对象
+            
+        Returns:
+            int: 移除的实体数量
+        """
+        # 重复传入的实体只移除一次，与逐个调用remove_entity的结果一致
+        removed = [entity for entity in dict.fromkeys(entities) if self.entities.get(entity.id) is entity]
+        if not removed:
+            return 0
+        
+        # 一次性重建根实体列表
+        removed_set = set(removed)
+        self.root_entities[:] = [entity for entity in self.root_entities if entity not in removed_set]
+        
+        touched_types = set()
+        for entity in removed:
+            index = entity.index
+            
+            # 从组件索引中移除，暂不递增版本
+            for component_type in entity.components:
+                type_id = component_type.type_id
+                component_set = self.component_sets[type_id] if type_id < len(self.component_sets) else None
+                if component_set is not None and component_set.remove(index):
+                    touched_types.add(type_id)
+            
+            # 从原型中移除
+            self._set_archetype(entity, None)
+            
+            # 从实体字典中移除
+            del self.entities[entity.id]
+            entity.scene = None
+            self._release_index(index)
+            entity.index = -1
+        
+        for type_id in touched_types:
+            self._component_versions[type_id] += 1
+        
+        return len(removed)
+    
     def get_entity(self, entity_id):
         """
         获取实体
@@ -95,6 +172,58 @@ class Scene:
         """
         return self.entities.get(entity_id)
     
+    def get_entity_by_index(self, index, generation=None):
+        """
+        通过实体索引获取实体
+        
+        Args:
+            index (int): 实体索引
+            generation (int): 实体代数，如果提供则用于检测已被回收的旧索引
+            
+        Returns:
+            Entity: 实体，如果不存在或代数不匹配则返回None
+        """
+        if index < 0 or index >= len(self._index_entities):
+            return None
+        
+        if generation is not None and self._generations[index] != generation:
+            return None
+        
+        return self._index_entities[index]
+    
+    def _allocate_index(self):
+        """
+        分配实体索引，优先复用已释放的索引，使稀疏数组保持紧凑
+        
+        Returns:
+            int: 实体索引
+        """
+        if self._free_indices:
+            return self._free_indices.pop()
+        
+        index = self._next_index
+        self._next_index += 1
+        self._index_entities.append(None)
+        self._index_masks.append(None)
+        
+        if index >= len(self._generations):
+            generations = np.zeros(len(self._generations) * 2, dtype=np.uint32)
+            generations[:len(self._generations)] = self._generations
+            self._generations = generations
+        
+        return index
+    
+    def _release_index(self, index):
+        """
+        释放实体索引
+        
+        Args:
+            index (int): 实体索引
+        """
+        self._index_entities[index] = None
+        self._generations[index] += 1
+        self._free_indices.append(index)
+    
     def get_entities(self):
         """
         获取所有实体
@@ -104,6 +233,16 @@ class Scene:
         """
         return list(self.entities.values())
     
+    @property
+    def entity_ids(self):
+        """
+        获取实体ID快照，可在遍历时安全地增删实体
+        
+        Returns:
+            frozenset: 实体ID集合
+        """
+        return frozenset(self.entities)
+    
     def get_entities_with_component(self, component_type):
         """
         获取具有指定组件的实体
@@ -111,10 +250,141 @@ class Scene:
         Args:
             component_type: 组件类型
             
+        Returns:
+            list: 实体列表，结果会被缓存，调用方不应修改
+        """
+        return self.get_entities_with_components(component_type)
+    
+    def get_entities_with_components(self, *component_types):
+        """
+        获取同时具有多个组件的实体
+        
+        Args:
+            *component_types: 组件类型
+            
+        Returns:
+            list: 实体列表，结果会被缓存，调用方不应修改
+        """
+        key = 0
+        versions = []
+        type_count = len(self._component_versions)
+        for component_type in component_types:
+            type_id = component_type.type_id
+            key |= 1 << type_id
+            versions.append(self._component_versions[type_id] if type_id < type_count else 0)
+        versions = tuple(versions)
+        
+        # 相关组件类型未变化时直接返回缓存结果
+        cached = self._query_cache.get(key)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        
+        result = self._query_entities(key)
+        self._query_cache[key] = (versions, result)
+        return result
+    
+    def _query_entities(self, mask):
+        """
+        计算同时具有多个组件的实体
+        
+        Args:
+            mask (int): 组件类型位掩码
+            
         Returns:
             list: 实体列表
         """
-        return [entity for entity in self.entities.values() if entity.has_component(component_type)]
+        if not mask:
+            return []
+        
+        # 单个组件类型直接遍历其稀疏集合的密集数组
+        if mask & (mask - 1) == 0:
+            type_id = mask.bit_length() - 1
+            component_set = self.component_sets[type_id] if type_id < len(self.component_sets) else None
+            if component_set is None:
+                return []
+            return [component.entity for component in component_set.dense_vals]
+        
+        # 多个组件类型时合并所有包含这些类型的原型，按原型连续遍历
+        result = []
+        for archetype, archetype_entities in self.archetypes.items():
+            if archetype & mask == mask:
+                result.extend(archetype_entities.values())
+        
+        return result
+    
+    def _set_archetype(self, entity, archetype):
+        """
+        将实体迁移到新的原型
+        
+        Args:
+            entity: 实体
+            archetype (int): 新的组件类型位掩码，为None时仅从当前原型中移除
+        """
+        index = entity.index
+        current = self._index_masks[index]
+        if current == archetype:
+            return
+        
+        if current is not None:
+            current_entities = self.archetypes[current]
+            del current_entities[index]
+            
+            # 移除空原型，保留无组件的原型
+            if not current_entities and current:
+                del self.archetypes[current]
+        
+        self._index_masks[index] = archetype
+        
+        if archetype is not None:
+            archetype_entities = self.archetypes.get(archetype)
+            if archetype_entities is None:
+                archetype_entities = self.archetypes[archetype] = {}
+            archetype_entities[index] = entity
+    
+    def _on_component_added(self, entity, component_type, component):
+        """
+        组件被添加到场景内实体时调用，更新组件索引
+        
+        Args:
+            entity: 实体
+            component_type: 组件类型
+            component: 组件实例
+        """
+        type_id = component_type.type_id
+        
+        # 按需扩展类型ID索引的列表
+        if type_id >= len(self.component_sets):
+            self.component_sets.extend([None] * (type_id + 1 - len(self.component_sets)))
+            self._component_versions.extend([0] * (type_id + 1 - len(self._component_versions)))
+        
+        component_set = self.component_sets[type_id]
+        if component_set is None:
+            component_set = self.component_sets[type_id] = SparseSet()
+        
+        component_set.add(entity.index, component)
+        self._component_versions[type_id] += 1
+        
+        # 迁移到包含该组件类型的原型
+        self._set_archetype(entity, self._index_masks[entity.index] | (1 << type_id))
+    
+    def _on_component_removed(self, entity, component_type):
+        """
+        组件从场景内实体移除时调用，更新组件索引
+        
+        Args:
+            entity: 实体
+            component_type: 组件类型
+        """
+        type_id = component_type.type_id
+        if type_id >= len(self.component_sets):
+            return
+        
+        component_set = self.component_sets[type_id]
+        if component_set is not None and component_set.remove(entity.index):
+            self._component_versions[type_id] += 1
+            
+            # 迁移到不含该组件类型的原型
+            self._set_archetype(entity, self._index_masks[entity.index] & ~(1 << type_id))
     
     def get_entities_with_tag(self, tag):
         """
@@ -158,6 +428,7 @@ class Scene:
         
         # 按优先级排序
         self.systems.sort(key=lambda s: s.priority)
+        self._schedule = None
         
         return system
     
@@ -173,6 +444,7 @@ class Scene:
         """
         if system in self.systems:
             self.systems.remove(system)
+            self._schedule = None
             return True
         
         return False
@@ -209,10 +481,25 @@ class Scene:
         Args:
             delta_time (float): 帧时间，单位为秒
         """
+        # 系统集合或启用状态变化时重建调度
+        schedule = self._schedule
+        if schedule is None or self._schedule_version != System.schedule_version:
+            schedule = self._build_schedule()
+        
         # 更新系统
-        for system in self.systems:
-            if system.is_enabled():
-                system.update(delta_time)
+        for update in schedule:
+            update(delta_time)
+    
+    def _build_schedule(self):
+        """
+        构建更新调度，预先绑定已启用系统的update方法
+        
+        Returns:
+            list: update方法列表，按优先级排序
+        """
+        self._schedule = [system.update for system in self.systems if system.is_enabled()]
+        self._schedule_version = System.schedule_version
+        return self._schedule
     
     def activate(self):
         """激活场景"""
@@ -233,13 +520,18 @@ class Scene:
     
     def clear(self):
         """清空场景"""
-        # 销毁所有实体
-        for entity in list(self.entities.values()):
+        # 先批量移除出场景索引，再销毁实体，避免逐个组件更新索引
+        entities = list(self.entities.values())
+        self.remove_entities(entities)
+        for entity in entities:
             entity.destroy()
         
-        # 清空实体字典和根实体列表
+        # 清空实体字典、根实体列表和组件索引
         self.entities.clear()
         self.root_entities.clear()
+        self.component_sets.clear()
+        self._query_cache.clear()
+        self.archetypes = {0: {}}
     
     def save(self, path=None):
         """
@@ -362,8 +654,7 @@ class Scene:
             Entity: 实体
         """
         # 创建实体
-        entity = Entity(entity_data.get("name", "Entity"))
-        entity.id = entity_data.get("id", entity.id)
+        entity = Entity(entity_data.get("name", "Entity"), entity_data.get("id"))
         entity.enabled = entity_data.get("enabled", True)
         entity.tags = set(entity_data.get("tags", []))
         entity.layer = entity_data.get("layer", 0)
@@ -14,6 +14,7 @@ class SceneManager:
         self.scenes = {}  # 场景字典，键为场景ID，值为场景实例
         self.active_scene = None  # 当前激活的场景
         self.scene_paths = {}  # 场景路径字典，键为场景名称，值为场景文件路径
+        self.scene_factories = {}  # 延迟创建的场景，键为场景名称，值为返回场景实例的工厂函数
     
     def create_scene(self, name="Scene"):
         """
@@ -42,6 +43,18 @@ class SceneManager:
         self.scenes[scene.id] = scene
         return scene
     
+    def register_scene(self, name, factory):
+        """
+        注册延迟创建的场景，首次按名称获取时才调用工厂函数创建
+        
+        工厂函数可以在内部导入场景模块，未使用的场景不会产生导入和创建开销。
+        
+        Args:
+            name (str): 场景名称
+            factory (callable): 无参数、返回场景实例的工厂函数
+        """
+        self.scene_factories[name] = factory
+    
     def remove_scene(self, scene_id):
         """
         移除场景
@@ -101,6 +114,11 @@ class SceneManager:
             if scene.name == name:
                 return scene
         
+        # 已注册但尚未创建的场景在此时创建并缓存
+        factory = self.scene_factories.pop(name, None)
+        if factory is not None:
+            return self.add_scene(factory())
+        
         return None
     
     def set_active_scene(self, scene_id):
@@ -126,6 +144,23 @@ class SceneManager:
         
         return False
     
+    def change_scene(self, name):
+        """
+        按名称切换当前激活的场景，延迟注册的场景在首次切换时创建
+        
+        Args:
+            name (str): 场景名称
+            
+        Returns:
+            bool: 是否成功切换
+        """
+        scene = self.get_scene_by_name(name)
+        if scene is None:
+            print(f"未找到场景: {name}")
+            return False
+        
+        return self.set_active_scene(scene.id)
+    
     def get_active_scene(self):
         """
         获取当前激活的场景
@@ -217,8 +252,9 @@ class SceneManager:
         for scene in list(self.scenes.values()):
             scene.clear()
         
-        # 清空场景字典
+        # 清空场景字典和延迟注册的场景
         self.scenes.clear()
+        self.scene_factories.clear()
         
         # 清空当前激活的场景
         self.active_scene = None
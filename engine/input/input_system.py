@@ -177,8 +177,10 @@ class InputSystem(System):
         if not self.initialized:
             return False
         
+        event_type = event.type
+        
         # 处理键盘事件
-        if event.type == pygame.KEYDOWN:
+        if event_type == pygame.KEYDOWN:
             key = event.key
             self.key_pressed[key] = True
             self.key_down[key] = True
@@ -190,7 +192,7 @@ class InputSystem(System):
             
             return True
         
-        elif event.type == pygame.KEYUP:
+        elif event_type == pygame.KEYUP:
             key = event.key
             self.key_pressed[key] = False
             self.key_up[key] = True
@@ -203,7 +205,7 @@ class InputSystem(System):
             return True
         
         # 处理鼠标事件
-        elif event.type == pygame.MOUSEMOTION:
+        elif event_type == pygame.MOUSEMOTION:
             self.mouse_position = event.pos
             self.mouse_delta = event.rel
             
@@ -214,7 +216,7 @@ class InputSystem(System):
             
             return True
         
-        elif event.type == pygame.MOUSEBUTTONDOWN:
+        elif event_type == pygame.MOUSEBUTTONDOWN:
             button = event.button
             self.mouse_button_pressed[button] = True
             self.mouse_button_down[button] = True
@@ -226,7 +228,7 @@ class InputSystem(System):
             
             return True
         
-        elif event.type == pygame.MOUSEBUTTONUP:
+        elif event_type == pygame.MOUSEBUTTONUP:
             button = event.button
             self.mouse_button_pressed[button] = False
             self.mouse_button_up[button] = True
@@ -238,7 +240,7 @@ class InputSystem(System):
             
             return True
         
-        elif event.type == pygame.MOUSEWHEEL:
+        elif event_type == pygame.MOUSEWHEEL:
             self.mouse_wheel_move = event.y
             
             # 调用回调函数
@@ -249,7 +251,7 @@ class InputSystem(System):
             return True
         
         # 处理游戏手柄事件
-        elif event.type == pygame.JOYBUTTONDOWN:
+        elif event_type == pygame.JOYBUTTONDOWN:
             gamepad_id = event.instance_id
             button = event.button
             
@@ -264,7 +266,7 @@ class InputSystem(System):
             
             return True
         
-        elif event.type == pygame.JOYBUTTONUP:
+        elif event_type == pygame.JOYBUTTONUP:
             gamepad_id = event.instance_id
             button = event.button
             
@@ -279,7 +281,7 @@ class InputSystem(System):
             
             return True
         
-        elif event.type == pygame.JOYAXISMOTION:
+        elif event_type == pygame.JOYAXISMOTION:
             gamepad_id = event.instance_id
             axis = event.axis
             value = event.value
@@ -8,6 +8,7 @@ import numpy as np
 import time
 
 from engine.core.ecs.system import System
+from engine.core.ecs.components.transform import Transform
 
 
 class PhysicsSystem(System):
@@ -23,6 +24,10 @@ class PhysicsSystem(System):
         self.max_sub_steps = 5  # 最大子步数
         self.solver_iterations = 10  # 求解器迭代次数
         self.collision_objects = {}  # 碰撞对象字典，键为实体ID，值为碰撞对象ID
+        self._bodies_version = 0  # 碰撞对象版本号，增删碰撞对象时递增
+        self._sync_key = None  # 构建同步绑定时的(场景, 碰撞对象版本, 变换实体列表)
+        self._sync_bodies = []  # 需要同步的碰撞对象ID列表
+        self._sync_rows = None  # 与_sync_bodies对应的变换存储行
         self.constraints = {}  # 约束字典，键为约束名称，值为约束ID
         self.debug_mode = False  # 调试模式
         self.initialized = False  # 是否已初始化
@@ -157,6 +162,7 @@ class PhysicsSystem(System):
         
         # 存储碰撞对象
         self.collision_objects[entity_id] = body_id
+        self._bodies_version += 1
         
         return body_id
     
@@ -204,6 +210,7 @@ class PhysicsSystem(System):
         
         # 存储碰撞对象
         self.collision_objects[entity_id] = body_id
+        self._bodies_version += 1
         
         return body_id
     
@@ -261,6 +268,7 @@ class PhysicsSystem(System):
         
         # 存储碰撞对象
         self.collision_objects[entity_id] = body_id
+        self._bodies_version += 1
         
         return body_id
     
@@ -318,6 +326,7 @@ class PhysicsSystem(System):
         
         # 存储碰撞对象
         self.collision_objects[entity_id] = body_id
+        self._bodies_version += 1
         
         return body_id
     
@@ -394,6 +403,7 @@ class PhysicsSystem(System):
             body_id = self.collision_objects[entity_id]
             p.removeBody(body_id, physicsClientId=self.client_id)
             del self.collision_objects[entity_id]
+            self._bodies_version += 1
             return True
         
         return False
@@ -699,6 +709,79 @@ class PhysicsSystem(System):
         # 步进模拟
         p.stepSimulation(physicsClientId=self.client_id)
     
+    def sync_transforms(self, scene):
+        """
+        将刚体的位置和方向批量写回实体的变换组件
+        
+        Args:
+            scene: 实体所在的场景
+        """
+        if not self.initialized or not scene or not self.collision_objects:
+            return
+        
+        # 碰撞对象和变换组件都未变化时复用上一帧的绑定
+        sync_key = (scene, self._bodies_version, scene.get_entities_with_component(Transform))
+        if self._sync_key is None or any(a is not b for a, b in zip(sync_key, self._sync_key)):
+            self._build_sync_bindings(scene)
+            self._sync_key = sync_key
+        
+        if not self._sync_bodies:
+            return
+        
+        # 每个刚体只需一次PyBullet调用，其余计算批量完成
+        positions = []
+        orientations = []
+        for body_id in self._sync_bodies:
+            position, orientation = p.getBasePositionAndOrientation(body_id, physicsClientId=self.client_id)
+            positions.append(position)
+            orientations.append(orientation)
+        
+        rows = self._sync_rows
+        quat = np.array(orientations, dtype=np.float64)
+        qx, qy, qz, qw = quat[:, 0], quat[:, 1], quat[:, 2], quat[:, 3]
+        
+        # 四元数批量转换为 Rx * Ry * Rz 顺序的欧拉角，与变换组件的矩阵约定一致
+        r00 = 1.0 - 2.0 * (qy * qy + qz * qz)
+        r01 = 2.0 * (qx * qy - qz * qw)
+        r02 = 2.0 * (qx * qz + qy * qw)
+        r12 = 2.0 * (qy * qz - qx * qw)
+        r22 = 1.0 - 2.0 * (qx * qx + qy * qy)
+        
+        rotations = np.empty((len(rows), 3), dtype=np.float32)
+        rotations[:, 0] = np.arctan2(-r12, r22)
+        rotations[:, 1] = np.arcsin(np.clip(r02, -1.0, 1.0))
+        rotations[:, 2] = np.arctan2(-r01, r00)
+        
+        store = Transform.store
+        store.positions[rows] = positions
+        store.rotations[rows] = np.degrees(rotations)
+        store.dirty[rows] = True
+    
+    def _build_sync_bindings(self, scene):
+        """
+        构建碰撞对象到变换存储行的绑定
+        
+        Args:
+            scene: 实体所在的场景
+        """
+        bodies = []
+        rows = []
+        
+        for entity_id, body_id in self.collision_objects.items():
+            entity = scene.get_entity(entity_id)
+            if entity is None:
+                continue
+            
+            transform = entity.get_component(Transform)
+            if transform is None:
+                continue
+            
+            bodies.append(body_id)
+            rows.append(transform._row)
+        
+        self._sync_bodies = bodies
+        self._sync_rows = np.array(rows, dtype=np.intp)
+    
     def shutdown(self):
         """关闭物理系统"""
         if self.initialized:
@@ -708,5 +791,7 @@ class PhysicsSystem(System):
             # 清空碰撞对象和约束
             self.collision_objects.clear()
             self.constraints.clear()
+            self._bodies_version += 1
+            self._sync_key = None
             
             self.initialized = False 
\ No newline at end of file
@@ -2,6 +2,7 @@
 网格类，封装3D模型的顶点数据和渲染功能
 """
 
+import ctypes
 import numpy as np
 from OpenGL.GL import *
 
@@ -44,7 +45,7 @@ class Mesh:
         Args:
             vertices (numpy.ndarray): 顶点坐标数组，形状为 (n, 3)
         """
-        self.vertices = np.array(vertices, dtype=np.float32)
+        self.vertices = np.asarray(vertices, dtype=np.float32)
         self.vertex_count = len(self.vertices)
         
         # 计算包围盒
@@ -59,7 +60,7 @@ class Mesh:
         Args:
             normals (numpy.ndarray): 法线数组，形状为 (n, 3)
         """
-        self.normals = np.array(normals, dtype=np.float32)
+        self.normals = np.asarray(normals, dtype=np.float32)
     
     def set_texcoords(self, texcoords):
         """
@@ -68,7 +69,7 @@ class Mesh:
         Args:
             texcoords (numpy.ndarray): 纹理坐标数组，形状为 (n, 2)
         """
-        self.texcoords = np.array(texcoords, dtype=np.float32)
+        self.texcoords = np.asarray(texcoords, dtype=np.float32)
     
     def set_tangents(self, tangents):
         """
@@ -77,7 +78,7 @@ class Mesh:
         Args:
             tangents (numpy.ndarray): 切线数组，形状为 (n, 3)
         """
-        self.tangents = np.array(tangents, dtype=np.float32)
+        self.tangents = np.asarray(tangents, dtype=np.float32)
     
     def set_colors(self, colors):
         """
@@ -86,7 +87,7 @@ class Mesh:
         Args:
             colors (numpy.ndarray): 顶点颜色数组，形状为 (n, 4)
         """
-        self.colors = np.array(colors, dtype=np.float32)
+        self.colors = np.asarray(colors, dtype=np.float32)
     
     def set_indices(self, indices):
         """
@@ -95,7 +96,7 @@ class Mesh:
         Args:
             indices (numpy.ndarray): 索引数组
         """
-        self.indices = np.array(indices, dtype=np.uint32)
+        self.indices = np.asarray(indices, dtype=np.uint32)
         self.index_count = len(self.indices)
     
     def set_primitive_type(self, primitive_type):
@@ -218,6 +219,40 @@ class Mesh:
             if length > 0:
                 self.tangents[i] = t / length
     
+    def _check_attributes(self, attributes):
+        """
+        检查顶点属性数据，去掉无法使用的属性
+        
+        形状不符合分量数的属性会被跳过；行数少于顶点数的属性保留，缺少的行按0填充。
+        
+        Args:
+            attributes (list): (位置, 数据, 分量数) 列表，数据可以为None
+            
+        Returns:
+            list: 可用的 (位置, 二维数据, 分量数) 列表，第一项决定顶点数
+        """
+        checked = []
+        vertex_count = None
+        
+        for location, data, size in attributes:
+            if data is None:
+                continue
+            
+            data = np.asarray(data, dtype=np.float32)
+            if data.size % size != 0:
+                print(f"警告: 网格 {self.name} 的顶点属性 {location} 数据长度 {data.size} 不是 {size} 的倍数，已跳过")
+                continue
+            
+            data = data.reshape(-1, size)
+            if vertex_count is None:
+                vertex_count = len(data)
+            elif len(data) < vertex_count:
+                print(f"警告: 网格 {self.name} 的顶点属性 {location} 只有 {len(data)} 行，少于顶点数 {vertex_count}，缺少的部分按0填充")
+            
+            checked.append((location, data, size))
+        
+        return checked
+    
     def create_buffers(self):
         """创建OpenGL缓冲对象"""
         # 如果已创建，先删除
@@ -227,46 +262,39 @@ class Mesh:
         self.vao = glGenVertexArrays(1)
         glBindVertexArray(self.vao)
         
-        # 创建顶点缓冲对象
-        if self.vertices is not None:
-            vbo = glGenBuffers(1)
-            glBindBuffer(GL_ARRAY_BUFFER, vbo)
-            glBufferData(GL_ARRAY_BUFFER, self.vertices.nbytes, self.vertices, GL_STATIC_DRAW)
-            glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 0, None)
-            glEnableVertexAttribArray(0)
-            self.vbos["vertices"] = vbo
-        
-        if self.normals is not None:
-            vbo = glGenBuffers(1)
-            glBindBuffer(GL_ARRAY_BUFFER, vbo)
-            glBufferData(GL_ARRAY_BUFFER, self.normals.nbytes, self.normals, GL_STATIC_DRAW)
-            glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, 0, None)
-            glEnableVertexAttribArray(1)
-            self.vbos["normals"] = vbo
-        
-        if self.texcoords is not None:
-            vbo = glGenBuffers(1)
-            glBindBuffer(GL_ARRAY_BUFFER, vbo)
-            glBufferData(GL_ARRAY_BUFFER, self.texcoords.nbytes, self.texcoords, GL_STATIC_DRAW)
-            glVertexAttribPointer(2, 2, GL_FLOAT, GL_FALSE, 0, None)
-            glEnableVertexAttribArray(2)
-            self.vbos["texcoords"] = vbo
-        
-        if self.tangents is not None:
-            vbo = glGenBuffers(1)
-            glBindBuffer(GL_ARRAY_BUFFER, vbo)
-            glBufferData(GL_ARRAY_BUFFER, self.tangents.nbytes, self.tangents, GL_STATIC_DRAW)
-            glVertexAttribPointer(3, 3, GL_FLOAT, GL_FALSE, 0, None)
-            glEnableVertexAttribArray(3)
-            self.vbos["tangents"] = vbo
-        
-        if self.colors is not None:
+        # 将所有顶点属性交错存入一个顶点缓冲对象，同一顶点的属性位于相邻内存
+        attributes = [
+            (0, self.vertices, 3),
+            (1, self.normals, 3),
+            (2, self.texcoords, 2),
+            (3, self.tangents, 3),
+            (4, self.colors, 4),
+        ]
+        attributes = self._check_attributes(attributes)
+        
+        if attributes:
+            vertex_count = len(attributes[0][1])
+            stride = sum(size for _, _, size in attributes)
+            # 未被属性数据覆盖的行保持为0
+            interleaved = np.zeros((vertex_count, stride), dtype=np.float32)
+            
+            column = 0
+            for location, data, size in attributes:
+                rows = min(len(data), vertex_count)
+                interleaved[:rows, column:column + size] = data[:rows]
+                column += size
+            
             vbo = glGenBuffers(1)
             glBindBuffer(GL_ARRAY_BUFFER, vbo)
-            glBufferData(GL_ARRAY_BUFFER, self.colors.nbytes, self.colors, GL_STATIC_DRAW)
-            glVertexAttribPointer(4, 4, GL_FLOAT, GL_FALSE, 0, None)
-            glEnableVertexAttribArray(4)
-            self.vbos["colors"] = vbo
+            glBufferData(GL_ARRAY_BUFFER, interleaved.nbytes, interleaved, GL_STATIC_DRAW)
+            
+            offset = 0
+            for location, data, size in attributes:
+                glVertexAttribPointer(location, size, GL_FLOAT, GL_FALSE, stride * 4, ctypes.c_void_p(offset))
+                glEnableVertexAttribArray(location)
+                offset += size * 4
+            
+            self.vbos["interleaved"] = vbo
         
         # 创建索引缓冲对象
         if self.indices is not None:
@@ -303,27 +331,75 @@ class Mesh:
         for sub_mesh in self.sub_meshes:
             sub_mesh.render()
     
+    def render_batch(self, matrices):
+        """
+        使用多个模型矩阵批量渲染网格，顶点数组对象只绑定一次
+        
+        这不是实例化绘制，每个矩阵仍单独调用一次glDrawElements/glDrawArrays；
+        实例化绘制需要着色器声明逐实例的模型矩阵属性，当前的着色器没有提供。
+        
+        Args:
+            matrices (list): 行主序的4x4模型矩阵列表
+        """
+        # 如果没有顶点数组对象，创建
+        if self.vao is None:
+            self.create_buffers()
+        
+        # 绑定顶点数组对象
+        glBindVertexArray(self.vao)
+        
+        # 逐个实例设置模型矩阵并绘制
+        for matrix in matrices:
+            glPushMatrix()
+            glMultTransposeMatrixf(matrix)
+            
+            if self.indices is not None:
+                glDrawElements(self.primitive_type, self.index_count, GL_UNSIGNED_INT, None)
+            else:
+                glDrawArrays(self.primitive_type, 0, self.vertex_count)
+            
+            glPopMatrix()
+        
+        # 解绑顶点数组对象
+        glBindVertexArray(0)
+        
+        # 渲染子网格
+        for sub_mesh in self.sub_meshes:
+            sub_mesh.render_batch(matrices)
+    
     def delete_buffers(self):
-        """删除OpenGL缓冲对象"""
-        # 删除顶点缓冲对象
-        for vbo in self.vbos.values():
-            glDeleteBuffers(1, [vbo])
+        """删除OpenGL缓冲对象，包括子网格的缓冲"""
+        buffers = []
+        vertex_arrays = []
+        self.take_buffers(buffers, vertex_arrays)
+        
+        # 每种对象只调用一次删除
+        if buffers:
+            glDeleteBuffers(len(buffers), buffers)
+        if vertex_arrays:
+            glDeleteVertexArrays(len(vertex_arrays), vertex_arrays)
+    
+    def take_buffers(self, buffers, vertex_arrays):
+        """
+        收集网格及其子网格的OpenGL对象以便批量删除，并重置网格的缓冲状态
         
+        Args:
+            buffers (list): 缓冲对象ID列表，顶点和索引缓冲对象追加到其中
+            vertex_arrays (list): 顶点数组对象ID列表
+        """
+        buffers.extend(self.vbos.values())
         self.vbos.clear()
         
-        # 删除索引缓冲对象
         if self.ebo is not None:
-            glDeleteBuffers(1, [self.ebo])
+            buffers.append(self.ebo)
             self.ebo = None
         
-        # 删除顶点数组对象
         if self.vao is not None:
-            glDeleteVertexArrays(1, [self.vao])
+            vertex_arrays.append(self.vao)
             self.vao = None
         
-        # 删除子网格的缓冲
         for sub_mesh in self.sub_meshes:
-            sub_mesh.delete_buffers()
+            sub_mesh.take_buffers(buffers, vertex_arrays)
     
     def get_aabb(self):
         """
@@ -12,10 +12,14 @@ from engine.rendering.models.mesh import Mesh
 class MeshManager:
     """网格管理器，负责加载和管理3D模型"""
     
+    CACHE_EXTENSION = ".npz"  # 二进制网格缓存文件扩展名
+    CACHE_ARRAYS = ("vertices", "normals", "texcoords", "tangents", "indices")  # 缓存的网格数组
+    
     def __init__(self):
         """初始化网格管理器"""
         self.meshes = {}  # 网格缓存
         self.mesh_paths = {}  # 网格路径
+        self._meshes_by_path = {}  # 规范路径 -> 网格，同一文件的不同名称共享网格
         
         # 设置默认网格路径
         self._set_default_mesh_paths()
@@ -367,13 +371,29 @@ class MeshManager:
         # 获取网格路径
         mesh_path = self.mesh_paths[name]
         
+        # 同一文件已以其他名称加载过时直接复用
+        real_path = os.path.realpath(mesh_path)
+        mesh = self._meshes_by_path.get(real_path)
+        if mesh is not None:
+            self.meshes[name] = mesh
+            return mesh
+        
         # 加载网格
         try:
             # 根据文件扩展名选择加载方法
             ext = os.path.splitext(mesh_path)[1].lower()
             
+            # 优先读取二进制缓存，避免重复解析文本和计算法线、切线
+            mesh = self._load_cache(mesh_path, name)
+            if mesh:
+                self.meshes[name] = mesh
+                self._meshes_by_path[real_path] = mesh
+                return mesh
+            
             if ext == ".obj":
                 mesh = self._load_obj(mesh_path, name)
+                if mesh:
+                    self._save_cache(mesh_path, mesh)
             elif ext == ".fbx":
                 mesh = self._load_fbx(mesh_path, name)
             else:
@@ -383,6 +403,7 @@ class MeshManager:
             # 缓存网格
             if mesh:
                 self.meshes[name] = mesh
+                self._meshes_by_path[real_path] = mesh
             
             return mesh
         
@@ -484,6 +505,64 @@ class MeshManager:
         
         return mesh
     
+    def _load_cache(self, file_path, name):
+        """
+        从二进制缓存加载网格，缓存不存在或比源文件旧时返回None
+        
+        Args:
+            file_path (str): 源文件路径
+            name (str): 网格名称
+            
+        Returns:
+            Mesh: 网格实例，如果没有可用缓存则返回None
+        """
+        cache_path = file_path + self.CACHE_EXTENSION
+        try:
+            if os.path.getmtime(cache_path) < os.path.getmtime(file_path):
+                return None
+        except OSError:
+            return None
+        
+        try:
+            with np.load(cache_path) as data:
+                mesh = Mesh(name)
+                mesh.set_vertices(data["vertices"])
+                
+                if "normals" in data:
+                    mesh.set_normals(data["normals"])
+                if "texcoords" in data:
+                    mesh.set_texcoords(data["texcoords"])
+                if "tangents" in data:
+                    mesh.set_tangents(data["tangents"])
+                if "indices" in data:
+                    mesh.set_indices(data["indices"])
+                
+                return mesh
+        
+        except Exception as e:
+            print(f"读取网格缓存失败: {cache_path}, {e}")
+            return None
+    
+    def _save_cache(self, file_path, mesh):
+        """
+        将网格数组保存为二进制缓存
+        
+        Args:
+            file_path (str): 源文件路径
+            mesh (Mesh): 网格实例
+        """
+        arrays = {}
+        for key in self.CACHE_ARRAYS:
+            value = getattr(mesh, key)
+            if value is not None:
+                arrays[key] = value
+        
+        try:
+            with open(file_path + self.CACHE_EXTENSION, "wb") as f:
+                np.savez(f, **arrays)
+        except OSError as e:
+            print(f"保存网格缓存失败: {file_path}, {e}")
+    
     def _load_fbx(self, file_path, name):
         """
         加载FBX文件
@@ -540,10 +619,11 @@ class MeshManager:
         Returns:
             Mesh: 网格实例，如果重新加载失败则返回None
         """
-        # 如果已加载，先删除
+        # 如果已加载，先删除，并使路径缓存失效以便重新读取文件
         if name in self.meshes:
-            self.meshes[name].delete_buffers()
-            del self.meshes[name]
+            mesh = self.meshes.pop(name)
+            self._forget_mesh_path(mesh)
+            self._release_mesh(mesh)
         
         # 重新加载
         return self.load_mesh(name)
@@ -559,18 +639,49 @@ class MeshManager:
             bool: 是否成功删除
         """
         if name in self.meshes:
-            self.meshes[name].delete_buffers()
-            del self.meshes[name]
+            self._release_mesh(self.meshes.pop(name))
             return True
         
         return False
     
+    def _release_mesh(self, mesh):
+        """
+        释放网格，仍被其他名称引用时保留其缓冲对象
+        
+        Args:
+            mesh (Mesh): 网格实例
+        """
+        if any(other is mesh for other in self.meshes.values()):
+            return
+        
+        self._forget_mesh_path(mesh)
+        mesh.delete_buffers()
+    
+    def _forget_mesh_path(self, mesh):
+        """
+        从路径缓存中移除网格
+        
+        Args:
+            mesh (Mesh): 网格实例
+        """
+        for path, cached in list(self._meshes_by_path.items()):
+            if cached is mesh:
+                del self._meshes_by_path[path]
+    
     def delete_all_meshes(self):
-        """删除所有网格"""
-        for mesh in self.meshes.values():
-            mesh.delete_buffers()
+        """删除所有网格，共享的网格只删除一次，所有缓冲对象批量删除"""
+        buffers = []
+        vertex_arrays = []
+        for mesh in {id(mesh): mesh for mesh in self.meshes.values()}.values():
+            mesh.take_buffers(buffers, vertex_arrays)
+        
+        if buffers:
+            glDeleteBuffers(len(buffers), buffers)
+        if vertex_arrays:
+            glDeleteVertexArrays(len(vertex_arrays), vertex_arrays)
         
         self.meshes.clear()
+        self._meshes_by_path.clear()
     
     def __del__(self):
         """析构函数"""
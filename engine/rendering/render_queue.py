@@ -0,0 +1,71 @@
+"""
+渲染队列，记录与提交分离的双缓冲绘制命令
+"""
+
+
+class RenderQueue:
+    """
+    双缓冲渲染命令队列
+
+    更新阶段把绘制命令记录到后缓冲，渲染阶段只提交前缓冲中的命令，
+    命令中保存的是变换存储的行，模型矩阵在提交时才读取。
+    """
+
+    def __init__(self):
+        """初始化渲染队列"""
+        self._buffers = ({}, {})  # 两个命令缓冲，{材质名称: {网格名称: [变换存储行]}}
+        self._write_index = 0  # 当前写入的缓冲索引
+        self.scene = None  # 前缓冲中命令所属的场景
+        self.pending = False  # 前缓冲中是否有尚未提交的新命令
+
+    def begin(self):
+        """开始记录新的一帧，清空后缓冲"""
+        self._buffers[self._write_index].clear()
+
+    def add(self, material, mesh, row):
+        """
+        记录一条绘制命令
+
+        Args:
+            material (str): 材质名称
+            mesh (str): 网格名称
+            row (int): 变换在存储中的行索引
+        """
+        mesh_groups = self._buffers[self._write_index].get(material)
+        if mesh_groups is None:
+            mesh_groups = self._buffers[self._write_index][material] = {}
+
+        rows = mesh_groups.get(mesh)
+        if rows is None:
+            rows = mesh_groups[mesh] = []
+
+        rows.append(row)
+
+    def end(self, scene):
+        """
+        结束记录，交换前后缓冲
+
+        Args:
+            scene: 记录的场景
+        """
+        self._write_index ^= 1
+        self.scene = scene
+        self.pending = True
+
+    @property
+    def front(self):
+        """
+        获取前缓冲中的命令
+
+        Returns:
+            dict: {材质名称: {网格名称: [变换存储行]}}
+        """
+        return self._buffers[self._write_index ^ 1]
+
+    def clear(self):
+        """清空两个缓冲"""
+        for buffer in self._buffers:
+            buffer.clear()
+
+        self.scene = None
+        self.pending = False
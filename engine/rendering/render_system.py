@@ -10,6 +10,7 @@ import math
 
 from engine.core.ecs.system import System
 from engine.core.ecs.entity import Entity
+from engine.rendering.render_queue import RenderQueue
 
 
 class RenderSystem(System):
@@ -34,6 +35,7 @@ class RenderSystem(System):
         self.material_cache = {}  # 材质缓存
         self.render_targets = {}  # 渲染目标
         self.post_processors = []  # 后处理器
+        self.render_queue = RenderQueue()  # 不透明物体的双缓冲绘制命令
         self.width = 0  # 渲染宽度
         self.height = 0  # 渲染高度
         self.aspect_ratio = 1.0  # 宽高比
@@ -351,8 +353,16 @@ class RenderSystem(System):
         if self.skybox:
             self._render_skybox()
         
+        # 批量更新模型矩阵
+        from engine.core.ecs.components.transform import Transform
+        Transform.store.update_matrices()
+        
+        # 本帧没有为该场景记录新命令时（如暂停或未经更新直接渲染）立即记录
+        if not self.render_queue.pending or self.render_queue.scene is not scene:
+            self.record(scene)
+        
         # 渲染不透明物体
-        self._render_opaque_objects(scene)
+        self._render_opaque_objects()
         
         # 渲染透明物体
         self._render_transparent_objects(scene)
@@ -458,40 +468,49 @@ class RenderSystem(System):
         # 恢复深度写入
         glDepthMask(GL_TRUE)
     
-    def _render_opaque_objects(self, scene):
+    def record(self, scene):
         """
-        渲染不透明物体
+        记录场景中不透明物体的绘制命令，按材质和网格两级分组
+        
+        在更新阶段结束时调用，渲染阶段只提交已记录的命令。
         
         Args:
-            scene: 要渲染的场景
+            scene: 要记录的场景
         """
-        # 获取所有有MeshRenderer组件的实体
         from engine.core.ecs.components.mesh_renderer import MeshRenderer
         from engine.core.ecs.components.transform import Transform
         
-        entities = scene.get_entities_with_component(MeshRenderer)
+        queue = self.render_queue
+        queue.begin()
         
-        # 按材质分组
-        opaque_entities = {}
+        if scene:
+            for entity in scene.get_entities_with_component(MeshRenderer):
+                if not entity.enabled:
+                    continue
+                
+                mesh_renderer = entity.get_component(MeshRenderer)
+                
+                if not mesh_renderer or not mesh_renderer.enabled or mesh_renderer.transparent:
+                    continue
+                
+                transform = entity.get_component(Transform)
+                
+                if not transform:
+                    continue
+                
+                queue.add(mesh_renderer.material, mesh_renderer.mesh, transform._row)
         
-        for entity in entities:
-            if not entity.enabled:
-                continue
-            
-            mesh_renderer = entity.get_component(MeshRenderer)
-            
-            if not mesh_renderer or not mesh_renderer.enabled or mesh_renderer.transparent:
-                continue
-            
-            material_name = mesh_renderer.material
-            
-            if material_name not in opaque_entities:
-                opaque_entities[material_name] = []
-            
-            opaque_entities[material_name].append(entity)
+        queue.end(scene)
+    
+    def _render_opaque_objects(self):
+        """提交渲染队列中已记录的不透明物体绘制命令"""
+        from engine.core.ecs.components.transform import Transform
+        
+        matrices_store = Transform.store.matrices
+        self.render_queue.pending = False
         
         # 渲染每组实体
-        for material_name, material_entities in opaque_entities.items():
+        for material_name, mesh_groups in self.render_queue.front.items():
             material = self.material_cache.get(material_name)
             
             if not material:
@@ -511,31 +530,12 @@ class RenderSystem(System):
             # 设置光照
             self._set_lighting(shader)
             
-            # 渲染实体
-            for entity in material_entities:
-                mesh_renderer = entity.get_component(MeshRenderer)
-                transform = entity.get_component(Transform)
-                
-                if not transform:
-                    continue
-                
-                # 设置模型矩阵
-                glPushMatrix()
-                
-                # 应用变换
-                glTranslatef(*transform.position)
-                glRotatef(transform.rotation[0], 1, 0, 0)
-                glRotatef(transform.rotation[1], 0, 1, 0)
-                glRotatef(transform.rotation[2], 0, 0, 1)
-                glScalef(*transform.scale)
-                
-                # 渲染网格
-                mesh = self.mesh_cache.get(mesh_renderer.mesh)
+            # 同一网格的实体共用一次顶点数组绑定，模型矩阵在提交时按行批量读取
+            for mesh_name, rows in mesh_groups.items():
+                mesh = self.mesh_cache.get(mesh_name)
                 
                 if mesh:
-                    mesh.render()
-                
-                glPopMatrix()
+                    mesh.render_batch(matrices_store[rows])
     
     def _render_transparent_objects(self, scene):
         """
@@ -550,8 +550,9 @@ class RenderSystem(System):
         
         entities = scene.get_entities_with_component(MeshRenderer)
         
-        # 收集透明实体
+        # 收集透明实体及其变换在存储中的行
         transparent_entities = []
+        rows = []
         
         for entity in entities:
             if not entity.enabled:
@@ -567,30 +568,33 @@ class RenderSystem(System):
             if not transform:
                 continue
             
-            # 计算与相机的距离
-            camera_position = (0, 0, 0)
-            
-            if isinstance(self.camera, Entity):
-                camera_transform = self.camera.get_component(Transform)
-                if camera_transform:
-                    camera_position = camera_transform.position
-            
-            # 计算距离
-            dx = transform.position[0] - camera_position[0]
-            dy = transform.position[1] - camera_position[1]
-            dz = transform.position[2] - camera_position[2]
-            distance_squared = dx * dx + dy * dy + dz * dz
-            
-            transparent_entities.append((entity, distance_squared))
+            transparent_entities.append(entity)
+            rows.append(transform._row)
+        
+        if not transparent_entities:
+            return
+        
+        # 相机位置
+        camera_position = (0, 0, 0)
+        
+        if isinstance(self.camera, Entity):
+            camera_transform = self.camera.get_component(Transform)
+            if camera_transform:
+                camera_position = camera_transform.position
+        
+        # 直接在位置数组上批量计算与相机的距离平方
+        offsets = Transform.store.positions[rows] - camera_position
+        distances_squared = np.einsum("ij,ij->i", offsets, offsets)
         
         # 按距离排序，从远到近渲染
-        transparent_entities.sort(key=lambda x: x[1], reverse=True)
+        order = np.argsort(-distances_squared, kind="stable")
+        transparent_entities = [transparent_entities[i] for i in order]
         
         # 启用混合
         glEnable(GL_BLEND)
         
         # 渲染透明实体
-        for entity, _ in transparent_entities:
+        for entity in transparent_entities:
             mesh_renderer = entity.get_component(MeshRenderer)
             transform = entity.get_component(Transform)
             
@@ -617,11 +621,7 @@ class RenderSystem(System):
             glPushMatrix()
             
             # 应用变换
-            glTranslatef(*transform.position)
-            glRotatef(transform.rotation[0], 1, 0, 0)
-            glRotatef(transform.rotation[1], 0, 1, 0)
-            glRotatef(transform.rotation[2], 0, 0, 1)
-            glScalef(*transform.scale)
+            glMultTransposeMatrixf(Transform.store.matrices[transform._row])
             
             # 渲染网格
             mesh = self.mesh_cache.get(mesh_renderer.mesh)
@@ -656,13 +656,17 @@ class RenderSystem(System):
         light_count = min(len(self.lights), 8)  # 最多支持8个光源
         shader.set_uniform("light_count", light_count)
         
+        if light_count == 0:
+            return
+        
+        # 组件类在循环外解析一次
+        from engine.core.ecs.components.light import Light
+        from engine.core.ecs.components.transform import Transform
+        
         for i in range(light_count):
             light = self.lights[i]
             
             # 获取光源组件
-            from engine.core.ecs.components.light import Light
-            from engine.core.ecs.components.transform import Transform
-            
             light_component = None
             transform_component = None
             
@@ -781,21 +785,35 @@ class RenderSystem(System):
     
     def shutdown(self):
         """关闭渲染系统"""
-        # 删除渲染目标
-        for name in list(self.render_targets.keys()):
-            self.delete_render_target(name)
+        # 收集渲染目标和纹理缓存中的纹理、帧缓冲，每种对象批量删除一次
+        textures = list(self.texture_cache.values())
+        framebuffers = []
+        for render_target in self.render_targets.values():
+            if render_target["color_texture"]:
+                textures.append(render_target["color_texture"])
+            if render_target["depth_texture"]:
+                textures.append(render_target["depth_texture"])
+            framebuffers.append(render_target["fbo"])
         
-        # 删除着色器
+        if textures:
+            glDeleteTextures(len(textures), textures)
+        if framebuffers:
+            glDeleteFramebuffers(len(framebuffers), framebuffers)
+        
+        # 删除着色器，程序对象没有批量删除接口
         for shader in self.shader_cache.values():
             shader.delete()
         
-        # 删除纹理
-        for texture in self.texture_cache.values():
-            glDeleteTextures(1, [texture])
-        
         # 删除网格
+        buffers = []
+        vertex_arrays = []
         for mesh in self.mesh_cache.values():
-            mesh.delete()
+            mesh.take_buffers(buffers, vertex_arrays)
+        
+        if buffers:
+            glDeleteBuffers(len(buffers), buffers)
+        if vertex_arrays:
+            glDeleteVertexArrays(len(vertex_arrays), vertex_arrays)
         
         # 清空缓存
         self.shader_cache.clear()
@@ -803,6 +821,7 @@ class RenderSystem(System):
         self.mesh_cache.clear()
         self.material_cache.clear()
         self.render_targets.clear()
+        self.render_queue.clear()
         
         # 重置状态
         self.camera = None
@@ -2,10 +2,17 @@
 着色器类，封装OpenGL着色器程序
 """
 
+import os
+import ctypes
+import hashlib
+import struct
+
 from OpenGL.GL import *
 from OpenGL.GL.shaders import compileShader, compileProgram
 import numpy as np
 
+from engine.core.debug import DEBUG
+
 
 class Shader:
     """着色器类，封装OpenGL着色器程序"""
@@ -15,17 +22,26 @@ class Shader:
         self.program = None  # 着色器程序
         self.uniforms = {}  # 统一变量位置缓存
     
-    def create(self, vertex_source, fragment_source):
+    def create(self, vertex_source, fragment_source, cache_dir=None):
         """
         创建着色器程序
         
         Args:
             vertex_source (str): 顶点着色器源代码
             fragment_source (str): 片段着色器源代码
+            cache_dir (str): 程序二进制缓存目录，为None时不使用缓存
             
         Returns:
             bool: 是否成功创建
         """
+        # 驱动支持时优先加载已缓存的程序二进制，跳过编译和链接
+        cache_path = None
+        if cache_dir and bool(glProgramBinary) and bool(glProgramParameteri):
+            cache_path = self._get_cache_path(cache_dir, vertex_source, fragment_source)
+            self.program = self._load_binary(cache_path)
+            if self.program:
+                return True
+        
         try:
             # 编译顶点着色器
             vertex_shader = compileShader(vertex_source, GL_VERTEX_SHADER)
@@ -33,19 +49,135 @@ class Shader:
             # 编译片段着色器
             fragment_shader = compileShader(fragment_source, GL_FRAGMENT_SHADER)
             
-            # 链接着色器程序
-            self.program = compileProgram(vertex_shader, fragment_shader)
+            # 链接着色器程序，使用缓存时需要在链接前声明程序二进制可取回
+            if cache_path:
+                self.program = self._link_retrievable_program(vertex_shader, fragment_shader)
+            else:
+                self.program = compileProgram(vertex_shader, fragment_shader)
             
             # 删除着色器对象
             glDeleteShader(vertex_shader)
             glDeleteShader(fragment_shader)
             
+            if cache_path:
+                self._save_binary(cache_path)
+            
             return True
         
         except Exception as e:
             print(f"创建着色器程序失败: {e}")
             return False
     
+    def _link_retrievable_program(self, vertex_shader, fragment_shader):
+        """
+        链接着色器程序，并在链接前设置GL_PROGRAM_BINARY_RETRIEVABLE_HINT
+        
+        部分驱动只有在链接前设置该提示时才返回可用的程序二进制，
+        而compileProgram在内部完成链接，无法设置，因此手动链接。
+        
+        Args:
+            vertex_shader (int): 顶点着色器对象
+            fragment_shader (int): 片段着色器对象
+            
+        Returns:
+            int: 着色器程序
+        """
+        program = glCreateProgram()
+        glAttachShader(program, vertex_shader)
+        glAttachShader(program, fragment_shader)
+        glProgramParameteri(program, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
+        glLinkProgram(program)
+        
+        if glGetProgramiv(program, GL_LINK_STATUS) != GL_TRUE:
+            info_log = glGetProgramInfoLog(program)
+            glDeleteProgram(program)
+            raise RuntimeError(f"链接着色器程序失败: {info_log}")
+        
+        glDetachShader(program, vertex_shader)
+        glDetachShader(program, fragment_shader)
+        return program
+    
+    def _get_cache_path(self, cache_dir, vertex_source, fragment_source):
+        """
+        计算程序二进制缓存路径，二进制与驱动相关，因此驱动信息也计入哈希
+        
+        Args:
+            cache_dir (str): 缓存目录
+            vertex_source (str): 顶点着色器源代码
+            fragment_source (str): 片段着色器源代码
+            
+        Returns:
+            str: 缓存文件路径
+        """
+        digest = hashlib.sha1()
+        for part in (glGetString(GL_VENDOR), glGetString(GL_RENDERER), glGetString(GL_VERSION)):
+            digest.update(part or b"")
+        digest.update(vertex_source.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(fragment_source.encode("utf-8"))
+        
+        return os.path.join(cache_dir, digest.hexdigest() + ".shbin")
+    
+    def _load_binary(self, cache_path):
+        """
+        从缓存文件加载程序二进制
+        
+        Args:
+            cache_path (str): 缓存文件路径
+            
+        Returns:
+            int: 着色器程序，如果缓存不存在或驱动拒绝则返回None
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        
+        if len(data) <= 4:
+            return None
+        
+        # 文件前4字节为二进制格式，其后为程序二进制
+        binary_format = struct.unpack("<I", data[:4])[0]
+        binary = data[4:]
+        
+        program = glCreateProgram()
+        try:
+            glProgramBinary(program, binary_format, binary, len(binary))
+            if glGetProgramiv(program, GL_LINK_STATUS) == GL_TRUE:
+                return program
+        except Exception as e:
+            print(f"加载着色器程序缓存失败: {cache_path}, {e}")
+        
+        # 驱动更新等原因导致缓存失效，回退到重新编译
+        glDeleteProgram(program)
+        return None
+    
+    def _save_binary(self, cache_path):
+        """
+        将当前程序二进制保存到缓存文件
+        
+        Args:
+            cache_path (str): 缓存文件路径
+        """
+        try:
+            length = glGetProgramiv(self.program, GL_PROGRAM_BINARY_LENGTH)
+            if length <= 0:
+                print(f"驱动未提供着色器程序二进制，无法缓存: {cache_path}")
+                return
+            
+            binary = (ctypes.c_ubyte * length)()
+            binary_format = (GLenum * 1)()  # 输出参数，需要传入数组
+            glGetProgramBinary(self.program, length, None, binary_format, binary)
+            
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "wb") as f:
+                f.write(struct.pack("<I", binary_format[0]))
+                f.write(bytes(binary))
+        
+        except Exception as e:
+            print(f"保存着色器程序缓存失败: {cache_path}, {e}")
+    
     def use(self):
         """使用着色器程序"""
         if self.program:
@@ -82,7 +214,8 @@ class Shader:
             value: 统一变量值
         """
         if not self.program:
-            print(f"无法设置统一变量 {name}: 着色器程序未初始化")
+            if DEBUG:
+                print(f"无法设置统一变量 {name}: 着色器程序未初始化")
             return
         
         # 获取位置
@@ -115,7 +248,7 @@ class Shader:
                         glUniform4i(location, value[0], value[1], value[2], value[3])
                     else:
                         glUniform4f(location, value[0], value[1], value[2], value[3])
-                else:
+                elif DEBUG:
                     print(f"不支持的向量维度: {len(value)}")
             elif hasattr(value, 'size') and hasattr(value, 'dtype'):
                 # NumPy数组
@@ -135,12 +268,13 @@ class Shader:
                     glUniform3fv(location, 1, value)
                 elif value.size == 2:
                     glUniform2fv(location, 1, value)
-                else:
+                elif DEBUG:
                     print(f"不支持的数组大小: {value.size}")
-            else:
+            elif DEBUG:
                 print(f"不支持的统一变量类型: {type(value)}")
         except Exception as e:
-            print(f"设置统一变量 {name} 失败: {e}")
+            if DEBUG:
+                print(f"设置统一变量 {name} 失败: {e}")
     
     def set_uniform_matrix4(self, name, matrix):
         """
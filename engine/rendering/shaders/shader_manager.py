@@ -17,6 +17,8 @@ class ShaderManager:
         """初始化着色器管理器"""
         self.shaders = {}  # 着色器缓存
         self.shader_paths = {}  # 着色器路径
+        self.cache_dir = None  # 着色器程序二进制缓存目录
+        self._shaders_by_path = {}  # (顶点, 片段)规范路径 -> 着色器，相同文件的不同名称共享程序
         
         # 设置默认着色器路径
         self._set_default_shader_paths()
@@ -26,6 +28,9 @@ class ShaderManager:
         # 获取着色器目录
         shader_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "assets", "shaders")
         
+        # 程序二进制缓存放在着色器目录下
+        self.cache_dir = os.path.join(shader_dir, "cache")
+        
         # 设置默认着色器路径
         self.shader_paths = {
             "default": {
@@ -80,6 +85,13 @@ class ShaderManager:
         # 获取着色器路径
         shader_path = self.shader_paths[name]
         
+        # 相同的着色器文件已以其他名称加载过时直接复用
+        path_key = (os.path.realpath(shader_path["vertex"]), os.path.realpath(shader_path["fragment"]))
+        shader = self._shaders_by_path.get(path_key)
+        if shader is not None:
+            self.shaders[name] = shader
+            return shader
+        
         # 加载着色器
         try:
             # 读取顶点着色器
@@ -92,10 +104,11 @@ class ShaderManager:
             
             # 创建着色器
             shader = Shader()
-            shader.create(vertex_source, fragment_source)
+            shader.create(vertex_source, fragment_source, self.cache_dir)
             
             # 缓存着色器
             self.shaders[name] = shader
+            self._shaders_by_path[path_key] = shader
             
             return shader
         
@@ -139,10 +152,11 @@ class ShaderManager:
         Returns:
             Shader: 着色器实例，如果重新加载失败则返回None
         """
-        # 如果已加载，先删除
+        # 如果已加载，先删除，并使路径缓存失效以便重新读取文件
         if name in self.shaders:
-            self.shaders[name].delete()
-            del self.shaders[name]
+            shader = self.shaders.pop(name)
+            self._forget_shader_path(shader)
+            self._release_shader(shader)
         
         # 重新加载
         return self.load_shader(name)
@@ -177,18 +191,42 @@ class ShaderManager:
             bool: 是否成功删除
         """
         if name in self.shaders:
-            self.shaders[name].delete()
-            del self.shaders[name]
+            self._release_shader(self.shaders.pop(name))
             return True
         
         return False
     
+    def _release_shader(self, shader):
+        """
+        释放着色器，仍被其他名称引用时保留其程序
+        
+        Args:
+            shader (Shader): 着色器实例
+        """
+        if any(other is shader for other in self.shaders.values()):
+            return
+        
+        self._forget_shader_path(shader)
+        shader.delete()
+    
+    def _forget_shader_path(self, shader):
+        """
+        从路径缓存中移除着色器
+        
+        Args:
+            shader (Shader): 着色器实例
+        """
+        for path_key, cached in list(self._shaders_by_path.items()):
+            if cached is shader:
+                del self._shaders_by_path[path_key]
+    
     def delete_all_shaders(self):
-        """删除所有着色器"""
-        for shader in self.shaders.values():
+        """删除所有着色器，共享的着色器只删除一次"""
+        for shader in {id(shader): shader for shader in self.shaders.values()}.values():
             shader.delete()
         
         self.shaders.clear()
+        self._shaders_by_path.clear()
     
     def __del__(self):
         """析构函数"""
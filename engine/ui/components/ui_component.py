@@ -7,9 +7,25 @@ from OpenGL.GL import *
 import numpy as np
 
 
+class UIKind:
+    """UI组件类型标签，系统可按标签直接查找组件，无需比较名称或文本"""
+    
+    NONE = 0  # 无标签
+    FPS_LABEL = 1  # 帧率显示标签
+
+
 class UIComponent:
     """UI组件基类，所有UI组件都应继承自此类"""
     
+    __slots__ = (
+        "_x", "_y", "_abs_pos", "_width", "_height", "visible", "enabled", "parent", "children",
+        "background_color", "border_color", "text_color", "border_width", "padding", "hover",
+        "focused", "dragging", "drag_offset_x", "drag_offset_y", "on_click", "on_hover",
+        "on_focus", "on_blur", "name", "kind"
+    )
+    
+    layout_version = 0  # 布局版本，任何组件的位置、大小或层级变化时递增
+    
     def __init__(self, x=0, y=0, width=100, height=30):
         """
         初始化UI组件
@@ -20,10 +36,11 @@ class UIComponent:
             width (float): 宽度
             height (float): 高度
         """
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
+        self._abs_pos = None  # 缓存的绝对位置，None表示需要重新计算
+        self._x = x
+        self._y = y
+        self._width = width
+        self._height = height
         self.visible = True
         self.enabled = True
         self.parent = None
@@ -42,6 +59,8 @@ class UIComponent:
         self.on_hover = None  # 悬停事件回调
         self.on_focus = None  # 获取焦点事件回调
         self.on_blur = None  # 失去焦点事件回调
+        self.name = None  # 名称，用于按名称查找
+        self.kind = UIKind.NONE  # 类型标签，用于按类型查找，应在添加到画布前设置
     
     def set_position(self, x, y):
         """
@@ -51,8 +70,61 @@ class UIComponent:
             x (float): X坐标
             y (float): Y坐标
         """
-        self.x = x
-        self.y = y
+        self._x = x
+        self._y = y
+        self._invalidate_position()
+    
+    @property
+    def x(self):
+        """相对父组件的X坐标"""
+        return self._x
+    
+    @x.setter
+    def x(self, value):
+        self._x = value
+        self._invalidate_position()
+    
+    @property
+    def y(self):
+        """相对父组件的Y坐标"""
+        return self._y
+    
+    @y.setter
+    def y(self, value):
+        self._y = value
+        self._invalidate_position()
+    
+    @property
+    def width(self):
+        """宽度"""
+        return self._width
+    
+    @width.setter
+    def width(self, value):
+        self._width = value
+        UIComponent.layout_version += 1
+    
+    @property
+    def height(self):
+        """高度"""
+        return self._height
+    
+    @height.setter
+    def height(self, value):
+        self._height = value
+        UIComponent.layout_version += 1
+    
+    def _invalidate_position(self):
+        """使自身及所有子组件的绝对位置缓存失效"""
+        UIComponent.layout_version += 1
+        
+        # 缓存已失效的组件，其子组件的缓存也一定已失效
+        if self._abs_pos is None:
+            return
+        
+        self._abs_pos = None
+        for child in self.children:
+            child._invalidate_position()
     
     def set_size(self, width, height):
         """
@@ -62,8 +134,9 @@ class UIComponent:
             width (float): 宽度
             height (float): 高度
         """
-        self.width = width
-        self.height = height
+        self._width = width
+        self._height = height
+        UIComponent.layout_version += 1
     
     def get_absolute_position(self):
         """
@@ -72,11 +145,14 @@ class UIComponent:
         Returns:
             tuple: (x, y) 绝对坐标
         """
-        if self.parent:
-            parent_x, parent_y = self.parent.get_absolute_position()
-            return (parent_x + self.x, parent_y + self.y)
-        
-        return (self.x, self.y)
+        if self._abs_pos is None:
+            if self.parent:
+                parent_x, parent_y = self.parent.get_absolute_position()
+                self._abs_pos = (parent_x + self._x, parent_y + self._y)
+            else:
+                self._abs_pos = (self._x, self._y)
+        
+        return self._abs_pos
     
     def contains_point(self, x, y):
         """
@@ -104,6 +180,7 @@ class UIComponent:
             UIComponent: 子组件
         """
         child.parent = self
+        child._invalidate_position()
         self.children.append(child)
         return child
     
@@ -119,6 +196,7 @@ class UIComponent:
         """
         if child in self.children:
             child.parent = None
+            child._invalidate_position()
             self.children.remove(child)
             return True
         
@@ -143,11 +221,24 @@ class UIComponent:
                 return True
         
         # 处理鼠标事件
-        if event.type == pygame.MOUSEMOTION:
+        return self.handle_mouse_event(event)
+    
+    def handle_mouse_event(self, event):
+        """
+        处理自身的鼠标事件，不传递给子组件
+        
+        Args:
+            event: Pygame事件
+            
+        Returns:
+            bool: 事件是否被处理
+        """
+        event_type = event.type
+        if event_type == pygame.MOUSEMOTION:
             return self._handle_mouse_motion(event)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
+        elif event_type == pygame.MOUSEBUTTONDOWN:
             return self._handle_mouse_down(event)
-        elif event.type == pygame.MOUSEBUTTONUP:
+        elif event_type == pygame.MOUSEBUTTONUP:
             return self._handle_mouse_up(event)
         
         return False
@@ -239,6 +330,15 @@ class UIComponent:
         
         return False
     
+    def has_mouse_state(self):
+        """
+        检查组件是否处于需要后续鼠标事件才能复位的状态
+        
+        Returns:
+            bool: 是否悬停、获得焦点或正在拖动
+        """
+        return self.hover or self.focused or self.dragging
+    
     def _set_focus(self, focused):
         """
         设置焦点状态
@@ -0,0 +1,107 @@
+"""
+UI空间网格，用于鼠标命中测试的粗筛
+"""
+
+import numpy as np
+
+
+class UIGrid:
+    """均匀网格空间索引，按单元格记录与其重叠的UI组件
+    
+    网格包含所有组件，不论是否可见，可见性在查询后由调用方检查，
+    因此切换可见性不需要重建网格。
+    """
+    
+    def __init__(self, cell_size=64):
+        """
+        初始化UI网格
+        
+        Args:
+            cell_size (int): 单元格大小，单位为像素
+        """
+        self.cell_size = cell_size  # 单元格大小
+        self.cells = {}  # 单元格字典，键为(cell_x, cell_y)，值为组件序号数组
+        self.components = []  # 按渲染顺序排列的组件列表
+        self.order = {}  # 组件 -> 渲染顺序序号
+        self.rects = np.zeros((0, 4), dtype=np.float32)  # 组件绝对矩形，(左, 上, 右, 下)
+        self.version = -1  # 构建网格时的布局版本
+    
+    def clear(self):
+        """清空网格"""
+        self.cells.clear()
+        self.components = []
+        self.order = {}
+        self.rects = np.zeros((0, 4), dtype=np.float32)
+        self.version = -1
+    
+    def rebuild(self, root, version):
+        """
+        重新构建网格
+        
+        Args:
+            root (UIComponent): 根组件
+            version (int): 当前布局版本
+        """
+        self.cells.clear()
+        self.components = []
+        rects = []
+        self._insert(root, rects)
+        self.order = {component: index for index, component in enumerate(self.components)}
+        
+        # 转换为数组，命中测试时在C层批量比较
+        self.rects = np.array(rects, dtype=np.float32).reshape(-1, 4)
+        for key, indices in self.cells.items():
+            self.cells[key] = np.array(indices, dtype=np.intp)
+        
+        self.version = version
+    
+    def _insert(self, component, rects):
+        """
+        按渲染顺序插入组件及其子组件，后插入的组件位于上层
+        
+        Args:
+            component (UIComponent): UI组件
+            rects (list): 收集组件绝对矩形的列表
+        """
+        abs_x, abs_y = component.get_absolute_position()
+        index = len(self.components)
+        self.components.append(component)
+        rects.append((abs_x, abs_y, abs_x + component.width, abs_y + component.height))
+        
+        cell_size = self.cell_size
+        min_x = int(abs_x // cell_size)
+        min_y = int(abs_y // cell_size)
+        max_x = int((abs_x + component.width) // cell_size)
+        max_y = int((abs_y + component.height) // cell_size)
+        
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = self.cells.get((cell_x, cell_y))
+                if cell is None:
+                    cell = self.cells[(cell_x, cell_y)] = []
+                cell.append(index)
+        
+        for child in component.children:
+            self._insert(child, rects)
+    
+    def query(self, x, y):
+        """
+        获取包含点的组件，使用向量化的矩形测试
+        
+        Args:
+            x (float): X坐标
+            y (float): Y坐标
+            
+        Returns:
+            list: 包含点的组件列表，最上层的组件在前，包括不可见的组件
+        """
+        cell_size = self.cell_size
+        indices = self.cells.get((int(x // cell_size), int(y // cell_size)))
+        if indices is None:
+            return []
+        
+        rects = self.rects[indices]
+        mask = (rects[:, 0] <= x) & (x <= rects[:, 2]) & (rects[:, 1] <= y) & (y <= rects[:, 3])
+        
+        components = self.components
+        return [components[i] for i in indices[mask][::-1]]
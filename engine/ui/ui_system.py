@@ -8,10 +8,18 @@ import numpy as np
 import os
 import json
 import time
+import ctypes
 
 from engine.core.ecs.system import System
 from engine.ui.components.ui_component import UIComponent
 from engine.ui.widgets.ui_canvas import UICanvas
+from engine.ui.ui_grid import UIGrid
+
+# 通过命中测试网格分发的鼠标事件类型
+_MOUSE_EVENTS = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP})
+
+# 内存中按R、G、B、A字节顺序排列的32位像素格式掩码（小端）
+_RGBA_MASKS = (0x000000FF, 0x0000FF00, 0x00FF0000, 0xFF000000)
 
 
 class UISystem(System):
@@ -24,10 +32,14 @@ class UISystem(System):
         self.active_canvas = None  # 当前活动的画布
         self.font_cache = {}  # 字体缓存
         self.texture_cache = {}  # 纹理缓存
+        self._textures_by_path = {}  # 规范路径 -> 纹理ID，同一文件的不同写法共享纹理
+        self._upload_pbo = 0  # 纹理上传用的像素缓冲对象
         self.screen_width = 0  # 屏幕宽度
         self.screen_height = 0  # 屏幕高度
         self.scale_factor = 1.0  # UI缩放因子
         self.initialized = False  # 是否已初始化
+        self.ui_grid = UIGrid()  # 命中测试用的空间网格
+        self._mouse_state_components = set()  # 悬停、焦点、拖动或按下状态需要复位的组件
         
         # 主题相关
         self.themes = {}  # 主题字典
@@ -250,6 +262,8 @@ class UISystem(System):
         
         if canvas:
             self.active_canvas = canvas
+            self.ui_grid.clear()
+            self._mouse_state_components.clear()
             return True
         
         return False
@@ -339,11 +353,20 @@ class UISystem(System):
         if image_path in self.texture_cache:
             return self.texture_cache[image_path]
         
+        # 同一文件已通过其他路径写法加载过时直接复用
+        real_path = os.path.realpath(image_path)
+        texture_id = self._textures_by_path.get(real_path)
+        if texture_id is not None:
+            self.texture_cache[image_path] = texture_id
+            return texture_id
+        
         # 加载图像
         try:
             image = pygame.image.load(image_path)
-            image = pygame.transform.flip(image, False, True)  # OpenGL坐标系与Pygame相反
-            image_data = pygame.image.tostring(image, "RGBA", 1)
+            
+            # 转换为RGBA字节顺序，之后直接读取表面像素缓冲区，不再生成中间bytes对象
+            rgba_format = pygame.Surface((1, 1), pygame.SRCALPHA, 32, _RGBA_MASKS)
+            image = image.convert(rgba_format)
             
             # 创建纹理
             texture_id = glGenTextures(1)
@@ -353,12 +376,18 @@ class UISystem(System):
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
             
-            # 上传纹理数据
+            # 分配存储并通过像素缓冲对象上传纹理数据
             width, height = image.get_size()
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, image_data)
+            if bool(glTexStorage2D):
+                glTexStorage2D(GL_TEXTURE_2D, 1, GL_RGBA8, width, height)
+            else:
+                glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+            
+            self._upload_surface(image)
             
             # 添加到缓存
             self.texture_cache[image_path] = texture_id
+            self._textures_by_path[real_path] = texture_id
             
             return texture_id
         
@@ -366,6 +395,37 @@ class UISystem(System):
             print(f"加载纹理失败: {image_path}, {e}")
             return 0
     
+    def _upload_surface(self, surface):
+        """
+        通过像素缓冲对象把表面像素上传到当前绑定的纹理
+        
+        像素直接从表面缓冲区复制到映射的缓冲对象中，驱动可以异步完成到纹理的传输。
+        
+        Args:
+            surface (pygame.Surface): RGBA字节顺序的32位表面
+        """
+        width, height = surface.get_size()
+        pixels = np.frombuffer(surface.get_view("1"), dtype=np.uint8)
+        
+        if not self._upload_pbo:
+            self._upload_pbo = glGenBuffers(1)
+        
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, self._upload_pbo)
+        glBufferData(GL_PIXEL_UNPACK_BUFFER, pixels.nbytes, None, GL_STREAM_DRAW)
+        
+        # 映射时丢弃旧内容，避免等待上一次传输完成
+        pointer = glMapBufferRange(GL_PIXEL_UNPACK_BUFFER, 0, pixels.nbytes,
+                                   GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT)
+        ctypes.memmove(pointer, pixels.ctypes.data, pixels.nbytes)
+        glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+        
+        # 表面的行跨度可能包含填充
+        glPixelStorei(GL_UNPACK_ROW_LENGTH, surface.get_pitch() // 4)
+        glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE, None)
+        glPixelStorei(GL_UNPACK_ROW_LENGTH, 0)
+        
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+    
     def create_animation(self, target, property_name, end_value, duration=0.5, delay=0, easing="linear"):
         """
         创建UI动画
@@ -543,8 +603,112 @@ class UISystem(System):
         if not self.initialized or self.active_canvas is None:
             return False
         
+        # 鼠标事件通过网格只分发给相关组件，其他事件仍然遍历组件树
+        if event.type in _MOUSE_EVENTS:
+            return self._dispatch_mouse_event(event)
+        
         return self.active_canvas.process_event(event)
     
+    def _update_grid(self):
+        """布局变化后重新构建网格"""
+        if self.ui_grid.version != UIComponent.layout_version:
+            self.ui_grid.rebuild(self.active_canvas, UIComponent.layout_version)
+            
+            # 重建时顺便收集在鼠标分发之外进入状态的组件，例如代码设置的焦点
+            self._mouse_state_components.update(
+                component for component in self.ui_grid.components if component.has_mouse_state()
+            )
+    
+    def _is_reachable(self, component):
+        """
+        检查组件是否会收到活动画布分发的事件，即自身和所有祖先都可见且启用
+        
+        Args:
+            component (UIComponent): UI组件
+            
+        Returns:
+            bool: 是否可达
+        """
+        while True:
+            if not component.visible or not component.enabled:
+                return False
+            if component.parent is None:
+                return component is self.active_canvas
+            component = component.parent
+    
+    def _dispatch_mouse_event(self, event):
+        """
+        分发鼠标事件
+        
+        遍历组件树时，不在光标下且没有悬停、焦点、拖动或按下状态的组件不会对鼠标事件做出任何改变，
+        因此只需把事件按相同的顺序（渲染顺序的逆序）分发给光标下的组件和有状态的组件，
+        遇到处理了事件的组件即停止，结果与遍历组件树相同。
+        
+        Args:
+            event: Pygame鼠标事件
+            
+        Returns:
+            bool: 事件是否被处理
+        """
+        self._update_grid()
+        
+        x, y = event.pos
+        candidates = self.ui_grid.query(x, y)
+        
+        # 合并有状态但不在光标下的组件，已经从画布移除的组件不会再收到事件
+        order = self.ui_grid.order
+        state_components = self._mouse_state_components
+        state_components.intersection_update(order)
+        extra = [component for component in state_components if component not in candidates]
+        if extra:
+            candidates = sorted(candidates + extra, key=order.__getitem__, reverse=True)
+        
+        handled = False
+        dispatched = []
+        for component in candidates:
+            if not self._is_reachable(component):
+                continue
+            
+            dispatched.append(component)
+            if component.handle_mouse_event(event):
+                handled = True
+                break
+        
+        # 更新有状态的组件集合
+        for component in dispatched:
+            if component.has_mouse_state():
+                state_components.add(component)
+            else:
+                state_components.discard(component)
+        
+        for component in extra:
+            if not component.has_mouse_state():
+                state_components.discard(component)
+        
+        return handled
+    
+    def hit_test(self, x, y):
+        """
+        获取点下最上层的UI组件
+        
+        Args:
+            x (float): X坐标
+            y (float): Y坐标
+            
+        Returns:
+            UIComponent: 最上层的可见且启用的组件，如果没有则返回None
+        """
+        if self.active_canvas is None:
+            return None
+        
+        self._update_grid()
+        
+        for component in self.ui_grid.query(x, y):
+            if self._is_reachable(component):
+                return component
+        
+        return None
+    
     def update(self, delta_time):
         """
         更新UI系统
@@ -593,11 +757,18 @@ class UISystem(System):
         # 清除字体缓存
         self.font_cache.clear()
         
-        # 清除纹理缓存
-        for texture_id in self.texture_cache.values():
-            glDeleteTextures(1, [texture_id])
+        # 清除纹理缓存，共享的纹理只删除一次，并批量删除
+        texture_ids = list(set(self.texture_cache.values()))
+        if texture_ids:
+            glDeleteTextures(len(texture_ids), texture_ids)
         
         self.texture_cache.clear()
+        self._textures_by_path.clear()
+        
+        # 删除纹理上传缓冲对象
+        if self._upload_pbo:
+            glDeleteBuffers(1, [self._upload_pbo])
+            self._upload_pbo = 0
         
         # 清除画布
         for canvas in self.canvases:
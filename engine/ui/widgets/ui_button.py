@@ -13,6 +13,13 @@ from engine.ui.widgets.ui_label import UILabel
 class UIButton(UIComponent):
     """UI按钮控件，用于处理点击事件"""
     
+    __slots__ = (
+        "pressed", "normal_color", "hover_color", "pressed_color", "disabled_color",
+        "normal_border_color", "hover_border_color", "pressed_border_color",
+        "disabled_border_color", "normal_text_color", "hover_text_color", "pressed_text_color",
+        "disabled_text_color", "label"
+    )
+    
     def __init__(self, text="Button", x=0, y=0, width=100, height=30, font_size=16, font_name=None):
         """
         初始化UI按钮
@@ -194,6 +201,15 @@ class UIButton(UIComponent):
         # 更新标签大小
         self.label.set_size(width, height)
     
+    def has_mouse_state(self):
+        """
+        检查组件是否处于需要后续鼠标事件才能复位的状态
+        
+        Returns:
+            bool: 是否按下、悬停、获得焦点或正在拖动
+        """
+        return self.pressed or super().has_mouse_state()
+    
     def _handle_mouse_motion(self, event):
         """
         处理鼠标移动事件
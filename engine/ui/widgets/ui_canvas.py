@@ -6,12 +6,14 @@ import pygame
 from OpenGL.GL import *
 import numpy as np
 
-from engine.ui.components.ui_component import UIComponent
+from engine.ui.components.ui_component import UIComponent, UIKind
 
 
 class UICanvas(UIComponent):
     """UI画布类，UI元素的容器"""
     
+    __slots__ = ("widgets", "_widgets_by_kind")
+    
     def __init__(self, name, width, height):
         """
         初始化UI画布
@@ -26,6 +28,7 @@ class UICanvas(UIComponent):
         self.background_color = (0, 0, 0, 0)  # 透明背景
         self.border_width = 0  # 无边框
         self.widgets = []  # 控件列表
+        self._widgets_by_kind = {}  # 类型标签 -> 控件列表
     
     def create_widget(self, widget_type, *args, **kwargs):
         """
@@ -55,6 +58,11 @@ class UICanvas(UIComponent):
         """
         self.widgets.append(widget)
         self.add_child(widget)
+        
+        # 按类型标签索引
+        if widget.kind != UIKind.NONE:
+            self._widgets_by_kind.setdefault(widget.kind, []).append(widget)
+        
         return widget
     
     def remove_widget(self, widget):
@@ -70,6 +78,11 @@ class UICanvas(UIComponent):
         if widget in self.widgets:
             self.widgets.remove(widget)
             self.remove_child(widget)
+            
+            kind_widgets = self._widgets_by_kind.get(widget.kind)
+            if kind_widgets and widget in kind_widgets:
+                kind_widgets.remove(widget)
+            
             return True
         
         return False
@@ -85,15 +98,30 @@ class UICanvas(UIComponent):
             widget: 控件实例，如果不存在则返回None
         """
         for widget in self.widgets:
-            if hasattr(widget, 'name') and widget.name == name:
+            if widget.name == name:
                 return widget
         
         return None
     
+    def get_widgets_by_kind(self, kind):
+        """
+        通过类型标签获取控件
+        
+        Args:
+            kind (int): 类型标签，见UIKind
+            
+        Returns:
+            list: 控件列表，调用方不应修改
+        """
+        return self._widgets_by_kind.get(kind, [])
+    
     def clear(self):
         """清空画布"""
+        # 通过remove_child断开父子关系并使布局版本递增，避免命中测试网格保留已移除的控件
+        for child in list(self.children):
+            self.remove_child(child)
         self.widgets.clear()
-        self.children.clear()
+        self._widgets_by_kind.clear()
     
     def update(self, delta_time):
         """
@@ -13,6 +13,16 @@ from engine.ui.widgets.ui_label import UILabel
 class UIInput(UIComponent):
     """UI输入框控件，用于文本输入"""
     
+    __slots__ = (
+        "text", "placeholder", "cursor_position", "selection_start", "selection_end",
+        "cursor_visible", "cursor_blink_time", "cursor_timer", "password_mode",
+        "password_char", "max_length", "normal_color", "hover_color", "focus_color",
+        "disabled_color", "normal_border_color", "hover_border_color", "focus_border_color",
+        "disabled_border_color", "placeholder_color", "selection_color", "cursor_color",
+        "label", "placeholder_label", "on_text_changed", "on_enter",
+        "_offset_cache", "_offset_cache_key", "_fallback_font"
+    )
+    
     def __init__(self, text="", placeholder="输入文本...", x=0, y=0, width=200, height=30, font_size=16, font_name=None):
         """
         初始化UI输入框
@@ -88,6 +98,11 @@ class UIInput(UIComponent):
         # 事件回调
         self.on_text_changed = None  # 文本改变事件回调
         self.on_enter = None  # 回车键事件回调
+        
+        # 文本宽度缓存，文本或字体变化时失效
+        self._offset_cache = {}  # 字符数 -> 像素宽度
+        self._offset_cache_key = None  # 缓存对应的(文本, 密码模式, 密码字符, 字体)
+        self._fallback_font = None  # 标签没有字体时使用的默认字体
     
     def set_text(self, text):
         """
@@ -596,6 +611,51 @@ class UIInput(UIComponent):
                 self.cursor_timer = 0
                 self.cursor_visible = not self.cursor_visible
     
+    def _get_font(self):
+        """
+        获取用于测量文本的字体
+        
+        Returns:
+            pygame.font.Font: 字体
+        """
+        font = self.label.font
+        if font:
+            return font
+        
+        if self._fallback_font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._fallback_font = pygame.font.Font(None, self.label.font_size)
+        
+        return self._fallback_font
+    
+    def _get_text_offset(self, count):
+        """
+        获取前count个字符的像素宽度，结果在文本和字体不变时被缓存
+        
+        Args:
+            count (int): 字符数
+            
+        Returns:
+            int: 像素宽度
+        """
+        font = self._get_font()
+        key = (self.text, self.password_mode, self.password_char, font)
+        
+        if key != self._offset_cache_key:
+            self._offset_cache_key = key
+            self._offset_cache = {}
+        
+        offset = self._offset_cache.get(count)
+        if offset is None:
+            if self.password_mode:
+                offset = font.size(self.password_char * count)[0]
+            else:
+                offset = font.size(self.text[:count])[0]
+            self._offset_cache[count] = offset
+        
+        return offset
+    
     def render(self):
         """渲染输入框"""
         # 渲染背景和边框
@@ -611,20 +671,9 @@ class UIInput(UIComponent):
             start = min(self.selection_start, self.selection_end)
             end = max(self.selection_start, self.selection_end)
             
-            # 获取字体
-            font = self.label.font
-            if not font:
-                if not pygame.font.get_init():
-                    pygame.font.init()
-                font = pygame.font.Font(None, self.label.font_size)
-            
             # 计算选择区域位置
-            if self.password_mode:
-                text_width = font.size(self.password_char * start)[0]
-                selection_width = font.size(self.password_char * (end - start))[0]
-            else:
-                text_width = font.size(self.text[:start])[0]
-                selection_width = font.size(self.text[start:end])[0]
+            text_width = self._get_text_offset(start)
+            selection_width = self._get_text_offset(end) - text_width
             
             # 渲染选择区域
             glColor4f(*self.selection_color)
@@ -643,16 +692,7 @@ class UIInput(UIComponent):
             
             # 计算光标位置
             # 这里简化处理，实际应该根据字体计算位置
-            font = self.label.font
-            if not font:
-                if not pygame.font.get_init():
-                    pygame.font.init()
-                font = pygame.font.Font(None, self.label.font_size)
-            
-            if self.password_mode:
-                cursor_x = abs_x + self.padding + font.size(self.password_char * self.cursor_position)[0]
-            else:
-                cursor_x = abs_x + self.padding + font.size(self.text[:self.cursor_position])[0]
+            cursor_x = abs_x + self.padding + self._get_text_offset(self.cursor_position)
             
             # 渲染光标
             glColor4f(*self.cursor_color)
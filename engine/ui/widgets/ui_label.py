@@ -12,6 +12,11 @@ from engine.ui.components.ui_component import UIComponent
 class UILabel(UIComponent):
     """UI标签控件，用于显示文本"""
     
+    __slots__ = (
+        "text", "font_size", "font_name", "font", "text_surface", "text_texture",
+        "text_alignment", "auto_size", "multiline", "word_wrap", "line_spacing"
+    )
+    
     def __init__(self, text="Label", x=0, y=0, width=100, height=30, font_size=16, font_name=None):
         """
         初始化UI标签
@@ -54,8 +59,10 @@ class UILabel(UIComponent):
             # 如果启用自动大小，调整大小
             if self.auto_size:
                 if self.text_surface:
-                    self.width = self.text_surface.get_width() + self.padding * 2
-                    self.height = self.text_surface.get_height() + self.padding * 2
+                    self.set_size(
+                        self.text_surface.get_width() + self.padding * 2,
+                        self.text_surface.get_height() + self.padding * 2
+                    )
     
     def set_font(self, font_name=None, font_size=None):
         """
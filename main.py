@@ -22,6 +22,7 @@ def parse_arguments():
     parser.add_argument('--project', type=str, help='要打开的项目路径')
     parser.add_argument('--scene', type=str, help='要加载的场景文件路径')
     parser.add_argument('--debug', action='store_true', help='启用调试模式')
+    parser.add_argument('--no-splash', action='store_true', help='不显示编辑器加载进度')
     parser.add_argument('--fullscreen', action='store_true', help='全屏模式')
     parser.add_argument('--resolution', type=str, default='1280x720', help='分辨率，格式为 宽x高')
     return parser.parse_args()
@@ -39,7 +40,8 @@ def main():
         app = EditorApp(
             width=width,
             height=height,
-            debug=args.debug
+            debug=args.debug,
+            show_splash=not args.no_splash
         )
         
         # 如果指定了项目，打开项目
@@ -0,0 +1,156 @@
+"""
+场景层级模型测试，随机增删节点后与重建的模型比较，并检查持久索引
+"""
+
+import os
+import random
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QModelIndex, QPersistentModelIndex, qInstallMessageHandler, QtWarningMsg, QtCriticalMsg, QtFatalMsg
+from PyQt5.QtTest import QAbstractItemModelTester
+from PyQt5.QtWidgets import QApplication
+
+from editor.ui.panels.hierarchy_panel import SceneHierarchyModel
+
+
+class FakeEntity:
+    """测试用实体，只提供模型读取的属性"""
+
+    _next_id = 0
+
+    def __init__(self, children=()):
+        FakeEntity._next_id += 1
+        self.id = FakeEntity._next_id
+        self.name = f"Entity{self.id}"
+        self.children = list(children)
+        self.enabled = True
+
+
+@pytest.fixture(scope="module")
+def app():
+    """创建QApplication"""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def qt_warnings():
+    """收集Qt警告，QAbstractItemModelTester在Warning模式下通过警告报告错误"""
+    messages = []
+
+    def handler(msg_type, context, message):
+        if msg_type in (QtWarningMsg, QtCriticalMsg, QtFatalMsg):
+            messages.append(message)
+
+    previous = qInstallMessageHandler(handler)
+    yield messages
+    qInstallMessageHandler(previous)
+
+
+def random_subtree(rnd, depth):
+    """生成随机实体子树"""
+    count = rnd.randint(0, 2) if depth > 0 else 0
+    return FakeEntity(random_subtree(rnd, depth - 1) for _ in range(count))
+
+
+def model_tree(model, parent=QModelIndex()):
+    """按模型接口遍历，返回 [(实体, 子树)] 结构"""
+    tree = []
+    for row in range(model.rowCount(parent)):
+        index = model.index(row, 0, parent)
+        assert index.isValid()
+        assert model.parent(index) == parent
+        tree.append((model.entity(index), model_tree(model, index)))
+    return tree
+
+
+def entity_tree(entities):
+    """按实体的children遍历，返回与model_tree相同的结构"""
+    return [(entity, entity_tree(entity.children)) for entity in entities]
+
+
+def all_entities(entities):
+    """返回所有实体及其父实体"""
+    result = []
+    pending = [(entity, None) for entity in entities]
+    while pending:
+        entity, parent = pending.pop()
+        result.append((entity, parent))
+        pending.extend((child, entity) for child in entity.children)
+    return result
+
+
+def entity_path(roots, target):
+    """返回从根到实体的行号路径，实体不在树中时返回None"""
+    pending = [(entity, (row,)) for row, entity in enumerate(roots)]
+    while pending:
+        entity, path = pending.pop()
+        if entity is target:
+            return path
+        pending.extend((child, path + (row,)) for row, child in enumerate(entity.children))
+    return None
+
+
+def index_path(index):
+    """返回模型索引从根开始的行号路径"""
+    path = []
+    while index.isValid():
+        path.append(index.row())
+        index = index.parent()
+    return tuple(reversed(path))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_insert_remove_matches_rebuilt_model(app, qt_warnings, seed):
+    """随机增删后模型与按相同实体重建的模型一致，持久索引跟随实体移动"""
+    rnd = random.Random(seed)
+    roots = [random_subtree(rnd, 2) for _ in range(rnd.randint(0, 4))]
+
+    model = SceneHierarchyModel()
+    tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Warning)
+    model.set_root_entities(roots)
+
+    for _ in range(30):
+        # 为一部分实体建立持久索引，操作后检查它们是否仍指向同一个实体
+        existing = all_entities(roots)
+        watched = rnd.sample(existing, min(len(existing), 8))
+        persistent = [
+            (entity, QPersistentModelIndex(model.node_index(model.entity_nodes[entity.id])))
+            for entity, _ in watched
+        ]
+
+        if existing and rnd.random() < 0.4:
+            entity, parent = rnd.choice(existing)
+            model.remove_node(model.entity_nodes[entity.id])
+            (parent.children if parent else roots).remove(entity)
+        else:
+            entity = random_subtree(rnd, 1)
+            parent = rnd.choice(existing)[0] if existing and rnd.random() < 0.7 else None
+            parent_node = model.entity_nodes[parent.id] if parent else SceneHierarchyModel.NONE
+            model.insert_entity(entity, parent_node)
+            (parent.children if parent else roots).append(entity)
+
+        assert model_tree(model) == entity_tree(roots)
+
+        rebuilt = SceneHierarchyModel()
+        rebuilt.set_root_entities(roots)
+        assert model_tree(model) == model_tree(rebuilt)
+
+        # 实体ID到节点的映射与模型一致
+        assert len(model.entity_nodes) == len(all_entities(roots))
+        for entity, _ in all_entities(roots):
+            assert model.entity(model.node_index(model.entity_nodes[entity.id])) is entity
+
+        for entity, index in persistent:
+            path = entity_path(roots, entity)
+            if path is None:
+                assert not index.isValid()
+            else:
+                assert index.isValid()
+                assert model.entity(QModelIndex(index)) is entity
+                assert index_path(QModelIndex(index)) == path
+
+    del tester
+    assert qt_warnings == []
@@ -0,0 +1,235 @@
+"""
+场景ECS存储测试，覆盖组件查询、查询缓存、实体索引回收和批量移除
+"""
+
+import random
+
+import pytest
+
+from engine.core.ecs.component import Component
+from engine.core.ecs.entity import Entity
+from engine.core.scene.scene import Scene
+
+
+class Position(Component):
+    """测试用组件"""
+
+
+class Velocity(Component):
+    """测试用组件"""
+
+
+class Health(Component):
+    """测试用组件"""
+
+
+COMPONENT_TYPES = (Position, Velocity, Health)
+
+# 所有非空的组件类型组合
+QUERIES = [
+    tuple(component_type for bit, component_type in enumerate(COMPONENT_TYPES) if combination & (1 << bit))
+    for combination in range(1, 1 << len(COMPONENT_TYPES))
+]
+
+
+def expected_entities(scene, component_types):
+    """逐个实体检查组件，得到查询的期望结果"""
+    return {
+        entity.id for entity in scene.entities.values()
+        if all(entity.has_component(component_type) for component_type in component_types)
+    }
+
+
+def assert_queries_match(scene):
+    """检查所有组件组合的查询结果与逐个实体检查的结果一致"""
+    for component_types in QUERIES:
+        result = scene.get_entities_with_components(*component_types)
+        ids = [entity.id for entity in result]
+        assert len(ids) == len(set(ids))
+        assert set(ids) == expected_entities(scene, component_types)
+
+
+def build_scene(seed):
+    """按随机种子创建带层级和组件的场景，相同种子得到相同结构"""
+    rnd = random.Random(seed)
+    scene = Scene()
+    entities = []
+    for i in range(40):
+        entity = Entity(f"Entity{i}", entity_id=f"entity-{i}")
+        for component_type in COMPONENT_TYPES:
+            if rnd.random() < 0.5:
+                entity.add_component(component_type())
+
+        # 后一半实体中的一部分作为子实体，不进入根实体列表
+        if i >= 20 and rnd.random() < 0.5:
+            rnd.choice(entities[:20]).add_child(entity)
+
+        scene.add_entity(entity)
+        entities.append(entity)
+    return scene, entities
+
+
+def scene_state(scene):
+    """收集用于比较两个场景的内部状态"""
+    return {
+        "entities": sorted(scene.entities),
+        "roots": [entity.id for entity in scene.root_entities],
+        "archetypes": {
+            mask: sorted(entity.id for entity in archetype_entities.values())
+            for mask, archetype_entities in scene.archetypes.items()
+        },
+        "queries": [
+            sorted(entity.id for entity in scene.get_entities_with_components(*component_types))
+            for component_types in QUERIES
+        ],
+        "free_indices": list(scene._free_indices),
+        "generations": scene._generations.tolist(),
+    }
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_query_follows_component_add_remove(seed):
+    """随机增删组件和实体后，所有组件组合的查询结果都正确"""
+    rnd = random.Random(seed)
+    scene = Scene()
+    entities = [scene.create_entity() for _ in range(20)]
+
+    for _ in range(300):
+        operation = rnd.random()
+        if operation < 0.1:
+            entities.append(scene.create_entity())
+        elif operation < 0.2 and entities:
+            scene.remove_entity(entities.pop(rnd.randrange(len(entities))))
+        elif entities:
+            entity = rnd.choice(entities)
+            component_type = rnd.choice(COMPONENT_TYPES)
+            if entity.has_component(component_type):
+                entity.remove_component(component_type)
+            else:
+                entity.add_component(component_type())
+        assert_queries_match(scene)
+
+
+def test_components_added_before_entity_joins_scene():
+    """实体加入场景前已有的组件会被登记"""
+    scene = Scene()
+    entity = scene.create_entity()
+    scene.remove_entity(entity)
+    entity.add_component(Position())
+    entity.add_component(Velocity())
+    scene.add_entity(entity)
+
+    assert scene.get_entities_with_components(Position, Velocity) == [entity]
+    assert scene.get_entities_with_component(Health) == []
+
+
+def test_query_cache_invalidated_by_component_change():
+    """相关组件变化后查询缓存失效，无关组件变化时继续使用缓存"""
+    scene = Scene()
+    first = scene.create_entity()
+    first.add_component(Position())
+    first.add_component(Velocity())
+    second = scene.create_entity()
+    second.add_component(Position())
+
+    result = scene.get_entities_with_components(Position, Velocity)
+    assert result == [first]
+    assert scene.get_entities_with_components(Position, Velocity) is result
+
+    # 无关组件类型变化不影响缓存
+    second.add_component(Health())
+    assert scene.get_entities_with_components(Position, Velocity) is result
+
+    # 添加相关组件后结果更新
+    second.add_component(Velocity())
+    result = scene.get_entities_with_components(Position, Velocity)
+    assert set(result) == {first, second}
+
+    # 移除相关组件后结果更新
+    first.remove_component(Position)
+    assert scene.get_entities_with_components(Position, Velocity) == [second]
+    assert scene.get_entities_with_component(Position) == [second]
+
+    # 移除实体后结果更新
+    scene.remove_entity(second)
+    assert scene.get_entities_with_components(Position, Velocity) == []
+    assert scene.get_entities_with_component(Velocity) == [first]
+
+
+def test_freed_index_is_reused_with_generation_bump():
+    """释放的实体索引会被复用，代数递增，旧的索引和代数不再能取到实体"""
+    scene = Scene()
+    old = scene.create_entity()
+    old.add_component(Position())
+    index, generation = old.index, old.generation
+    assert scene.get_entity_by_index(index, generation) is old
+
+    scene.remove_entity(old)
+    assert old.index == -1
+    assert scene.get_entity_by_index(index) is None
+
+    new = scene.create_entity()
+    assert new.index == index
+    assert new.generation == generation + 1
+    assert scene.get_entity_by_index(index, generation) is None
+    assert scene.get_entity_by_index(index, new.generation) is new
+
+    # 复用索引的实体不会继承旧实体的组件
+    assert scene.get_entities_with_component(Position) == []
+
+
+def test_generations_grow_with_index_count():
+    """实体索引超过代数数组的初始容量时数组扩容，已有代数保留"""
+    scene = Scene()
+    first = scene.create_entity()
+    index = first.index
+    scene.remove_entity(first)
+    reused = scene.create_entity()
+
+    entities = [scene.create_entity() for _ in range(200)]
+    assert len({entity.index for entity in entities} | {index}) == len(entities) + 1
+    assert reused.index == index
+    assert scene.get_entity_by_index(index, 1) is reused
+    for entity in entities:
+        assert scene.get_entity_by_index(entity.index, 0) is entity
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_remove_entities_matches_remove_entity(seed):
+    """批量移除与逐个移除得到相同的场景状态"""
+    batch_scene, batch_entities = build_scene(seed)
+    single_scene, single_entities = build_scene(seed)
+
+    rnd = random.Random(seed + 1000)
+    picked = rnd.sample(range(len(batch_entities)), 15)
+    # 重复传入和不在场景中的实体都应被忽略
+    picked += picked[:3]
+    outsider = Scene().create_entity()
+
+    # 先填充查询缓存，移除后缓存必须失效
+    assert_queries_match(batch_scene)
+    assert_queries_match(single_scene)
+
+    removed = batch_scene.remove_entities([batch_entities[i] for i in picked] + [outsider])
+    single_removed = sum(single_scene.remove_entity(single_entities[i]) for i in picked)
+    single_scene.remove_entity(outsider)
+
+    assert removed == single_removed == 15
+    assert scene_state(batch_scene) == scene_state(single_scene)
+    assert_queries_match(batch_scene)
+
+    for i in picked:
+        assert batch_entities[i].index == -1
+        assert batch_entities[i].scene is None
+
+    # 之后创建的实体以相同顺序复用索引
+    assert [batch_scene.create_entity().index for _ in range(20)] == \
+        [single_scene.create_entity().index for _ in range(20)]
+
+
+def test_remove_entities_ignores_empty_input():
+    """没有可移除的实体时返回0且不修改场景"""
+    scene, _ = build_scene(0)
+    state = scene_state(scene)
+    assert scene.remove_entities([]) == 0
+    assert scene_state(scene) == state